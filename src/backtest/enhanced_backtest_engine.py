@@ -11,13 +11,18 @@ Improvements over basic engine:
 - Slippage and commission modeling
 """
 
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import json
 
-from strategy_base import AdvancedStrategy, SignalType
+from src.strategies.strategy_base import AdvancedStrategy, SignalType
 
 
 class Trade:
@@ -127,6 +132,7 @@ class EnhancedBacktestEngine:
         self.positions: Dict[str, Trade] = {}
         self.closed_trades: List[Trade] = []
         self.equity_curve: List[Tuple[datetime, float]] = []
+        self._strategy: Optional[AdvancedStrategy] = None
     
     def run_backtest(
         self,
@@ -146,6 +152,8 @@ class EnhancedBacktestEngine:
             Dictionary with backtest results
         """
         self.reset()
+        self._strategy = strategy
+        strategy.reset_trade_results()
         
         # Generate signals
         signals = strategy.generate_signals(data)
@@ -350,6 +358,10 @@ class EnhancedBacktestEngine:
             profit = (position.entry_price - exit_price) * position.shares
             self.cash += original_value + profit - commission
         
+        # Feed the outcome back for trade-history based sizing
+        if self._strategy is not None:
+            self._strategy.update_trade_result(position.pnl)
+        
         # Move to closed trades
         self.closed_trades.append(position)
         del self.positions[symbol]
@@ -265,10 +265,12 @@ class DataDownloader:
                 # Add daily bars
                 bars_added = 0
                 for date, row in df.iterrows():
+                    bar_date = pd.Timestamp(date).date()
+                    
                     # Check if bar already exists
                     existing = session.query(DailyBar).filter_by(
                         symbol_id=symbol_obj.id,
-                        date=date
+                        date=bar_date
                     ).first()
                     
                     if existing:
@@ -283,7 +285,7 @@ class DataDownloader:
                         # Create new bar
                         bar = DailyBar(
                             symbol_id=symbol_obj.id,
-                            date=date,
+                            date=bar_date,
                             open=row['open'],
                             high=row['high'],
                             low=row['low'],
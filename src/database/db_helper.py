@@ -63,6 +63,7 @@ def get_daily_bars(symbol: str, days: int = 252, end_date: Optional[datetime] =
             } for bar in results]
             
             df = pd.DataFrame(data)
+            df['date'] = pd.to_datetime(df['date'])
             df.set_index('date', inplace=True)
             df.sort_index(inplace=True)  # Sort oldest to newest
             
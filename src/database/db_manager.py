@@ -6,6 +6,7 @@ Handles database connections, session management, and initialization
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
+from functools import cached_property
 from loguru import logger
 from typing import Generator
 
@@ -21,48 +22,67 @@ class DatabaseManager:
     def __init__(self):
         """Initialize database manager"""
         self.engine = None
-        self.SessionLocal = None
-        self._initialized = False
     
-    def initialize(self) -> None:
-        """
-        Initialize database connection and create tables
+    @cached_property
+    def SessionLocal(self) -> sessionmaker:
         """
-        if self._initialized:
-            logger.info("Database already initialized")
-            return
+        Session factory
         
+        The first access connects, creates tables and caches the factory;
+        later accesses are a plain attribute read.
+        """
         try:
             # Create engine
             database_url = config.database_url
             logger.info(f"Connecting to database...")
             
+            pool_size = config.db_pool_size
             self.engine = create_engine(
                 database_url,
                 pool_pre_ping=True,  # Verify connections before using
-                pool_size=10,  # Connection pool size
-                max_overflow=20,  # Max overflow connections
+                pool_size=pool_size,  # Connection pool size
+                max_overflow=config.db_max_overflow,  # Max overflow connections
                 echo=False  # Set to True for SQL query logging
             )
             
+            # Open pooled connections up front so the first requests
+            # don't pay connect + auth latency
+            if config.prewarm_pool:
+                connections = [self.engine.raw_connection() for _ in range(pool_size)]
+                for conn in connections:
+                    conn.close()  # Returns the live connection to the pool
+                logger.info(f"Pre-warmed {pool_size} pooled connections")
+            
             # Create session factory
-            self.SessionLocal = sessionmaker(
+            session_factory = sessionmaker(
                 autocommit=False,
                 autoflush=False,
                 bind=self.engine
             )
             
-            # Create all tables
+            # Create all tables (existing tables are not altered, upgrade
+            # them with src/database/migrate.py)
             logger.info("Creating database tables...")
             Base.metadata.create_all(bind=self.engine)
             
-            self._initialized = True
             logger.success("✓ Database initialized successfully")
+            return session_factory
             
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
             raise
     
+    def initialize(self) -> None:
+        """
+        Initialize database connection and create tables
+        """
+        if 'SessionLocal' in self.__dict__:
+            logger.info("Database already initialized")
+            return
+        
+        # First access builds and caches the session factory
+        self.SessionLocal
+    
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """
@@ -74,9 +94,6 @@ class DatabaseManager:
                 session.add(obj)
                 session.commit()
         """
-        if not self._initialized:
-            self.initialize()
-        
         session = self.SessionLocal()
         try:
             yield session
@@ -88,6 +105,15 @@ class DatabaseManager:
         finally:
             session.close()
     
+    def create_session(self) -> Session:
+        """
+        Create a bare session with no commit-on-exit semantics
+        
+        The caller owns the transaction boundaries and must close the
+        session. Use for bulk writes that commit in chunks.
+        """
+        return self.SessionLocal()
+    
     def close(self) -> None:
         """Close database connections"""
         if self.engine:
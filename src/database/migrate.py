@@ -0,0 +1,104 @@
+"""
+AlphaFactory OS - Schema Upgrade
+Brings an existing daily_bars table in line with models.DailyBar
+
+Base.metadata.create_all() only creates missing tables, it never alters
+existing ones. Databases created before these model changes need:
+- daily_bars.date: TIMESTAMP -> DATE
+- rsi_14, macd, macd_signal: DOUBLE PRECISION -> REAL
+- idx_symbol_date replaced by the covering index idx_symbol_date_ohlcv
+
+Run once after upgrading:
+    python -m src.database.migrate
+Every step checks the current schema first, so re-running is a no-op.
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from loguru import logger
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from src.database.models import DailyBar
+
+
+# Columns stored single-precision (Float(precision=24) in the model)
+REAL_COLUMNS = ('rsi_14', 'macd', 'macd_signal')
+
+# Pre-covering-index name of the (symbol_id, date) index
+OLD_INDEX = 'idx_symbol_date'
+
+
+def _column_types(conn: Connection) -> dict:
+    """Map daily_bars column names to their database type names (lowercase)"""
+    return {
+        col['name']: str(col['type']).lower()
+        for col in inspect(conn).get_columns(DailyBar.__tablename__)
+    }
+
+
+def _alter_column_types(conn: Connection) -> None:
+    """Convert date to DATE and the oscillator columns to REAL (PostgreSQL)"""
+    types = _column_types(conn)
+    
+    if types.get('date') != 'date':
+        # Fails on the uq_symbol_date constraint (and rolls back) if two
+        # bars of a symbol fall on the same day once times are dropped
+        logger.info("Converting daily_bars.date to DATE...")
+        conn.execute(text('ALTER TABLE daily_bars ALTER COLUMN date TYPE DATE USING date::date'))
+    
+    for col in REAL_COLUMNS:
+        if types.get(col) != 'real':
+            logger.info(f"Converting daily_bars.{col} to REAL...")
+            conn.execute(text(f'ALTER TABLE daily_bars ALTER COLUMN {col} TYPE REAL'))
+
+
+def _replace_index(conn: Connection) -> None:
+    """Create the covering (symbol_id, date) index and drop the old one"""
+    existing = {idx['name'] for idx in inspect(conn).get_indexes(DailyBar.__tablename__)}
+    
+    for index in DailyBar.__table__.indexes:
+        if index.name not in existing:
+            logger.info(f"Creating index {index.name}...")
+            index.create(bind=conn)
+    
+    if OLD_INDEX in existing:
+        logger.info(f"Dropping index {OLD_INDEX}...")
+        conn.execute(text(f'DROP INDEX {OLD_INDEX}'))
+
+
+def upgrade(engine: Engine) -> None:
+    """
+    Upgrade the daily_bars schema in a single transaction
+    
+    Column types are only altered on PostgreSQL; SQLite has no ALTER
+    COLUMN and stores values by affinity, so there only the indexes change.
+    
+    Args:
+        engine: Engine bound to the AlphaFactory database
+    """
+    with engine.begin() as conn:
+        if not inspect(conn).has_table(DailyBar.__tablename__):
+            logger.info("No daily_bars table yet, create_all() will build the current schema")
+            return
+        
+        if conn.dialect.name == 'postgresql':
+            _alter_column_types(conn)
+        else:
+            logger.warning(f"Skipping column type changes on {conn.dialect.name}")
+        
+        _replace_index(conn)
+    
+    logger.success("✓ daily_bars schema is up to date")
+
+
+if __name__ == '__main__':
+    from src.database.db_manager import db_manager
+    
+    # Connects and creates any missing tables first
+    db_manager.initialize()
+    upgrade(db_manager.engine)
+    db_manager.close()
@@ -6,7 +6,7 @@ SQLAlchemy ORM models for storing market data, trades, and performance
 from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
-    Column, Integer, String, Float, DateTime, Boolean, 
+    Column, Integer, String, Float, Date, DateTime, Boolean, 
     Text, Index, ForeignKey, UniqueConstraint
 )
 from sqlalchemy.ext.declarative import declarative_base
@@ -33,8 +33,16 @@ class Symbol(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    daily_bars = relationship('DailyBar', back_populates='symbol', cascade='all, delete-orphan')
-    trades = relationship('Trade', back_populates='symbol', cascade='all, delete-orphan')
+    # Collections raise on lazy load (query bars/trades explicitly);
+    # deleting a symbol still cascades to its rows through the ORM
+    daily_bars = relationship(
+        'DailyBar', back_populates='symbol', cascade='all, delete-orphan',
+        lazy='raise_on_sql'
+    )
+    trades = relationship(
+        'Trade', back_populates='symbol', cascade='all, delete-orphan',
+        lazy='raise_on_sql'
+    )
     
     def __repr__(self):
         return f"<Symbol(symbol='{self.symbol}', name='{self.name}')>"
@@ -48,7 +56,7 @@ class DailyBar(Base):
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     symbol_id = Column(Integer, ForeignKey('symbols.id'), nullable=False)
-    date = Column(DateTime, nullable=False, index=True)
+    date = Column(Date, nullable=False, index=True)
     open = Column(Float, nullable=False)
     high = Column(Float, nullable=False)
     low = Column(Float, nullable=False)
@@ -57,12 +65,13 @@ class DailyBar(Base):
     adj_close = Column(Float)  # Adjusted close for splits/dividends
     
     # Technical indicators (pre-calculated for performance)
+    # Bounded oscillators are stored single-precision (REAL/float4)
     sma_20 = Column(Float)
     sma_50 = Column(Float)
     sma_200 = Column(Float)
-    rsi_14 = Column(Float)
-    macd = Column(Float)
-    macd_signal = Column(Float)
+    rsi_14 = Column(Float(precision=24))
+    macd = Column(Float(precision=24))
+    macd_signal = Column(Float(precision=24))
     bbands_upper = Column(Float)
     bbands_middle = Column(Float)
     bbands_lower = Column(Float)
@@ -75,7 +84,12 @@ class DailyBar(Base):
     # Constraints
     __table_args__ = (
         UniqueConstraint('symbol_id', 'date', name='uq_symbol_date'),
-        Index('idx_symbol_date', 'symbol_id', 'date'),
+        # Covering index: range scans on (symbol_id, date) return OHLCV
+        # without a heap lookup (INCLUDE is Postgres-only, ignored elsewhere)
+        Index(
+            'idx_symbol_date_ohlcv', 'symbol_id', 'date',
+            postgresql_include=['open', 'high', 'low', 'close', 'volume', 'adj_close']
+        ),
     )
     
     def __repr__(self):
@@ -99,7 +113,10 @@ class Strategy(Base):
     
     # Relationships
     backtests = relationship('Backtest', back_populates='strategy', cascade='all, delete-orphan')
-    trades = relationship('Trade', back_populates='strategy', cascade='all, delete-orphan')
+    trades = relationship(
+        'Trade', back_populates='strategy', cascade='all, delete-orphan',
+        lazy='raise_on_sql'
+    )
     
     def __repr__(self):
         return f"<Strategy(name='{self.name}', version='{self.version}')>"
@@ -144,7 +161,10 @@ class Backtest(Base):
     
     # Relationships
     strategy = relationship('Strategy', back_populates='backtests')
-    trades = relationship('Trade', back_populates='backtest', cascade='all, delete-orphan')
+    trades = relationship(
+        'Trade', back_populates='backtest', cascade='all, delete-orphan',
+        lazy='raise_on_sql'
+    )
     
     def __repr__(self):
         return f"<Backtest(id={self.id}, strategy_id={self.strategy_id}, total_return={self.total_return})>"
@@ -11,12 +11,107 @@ sys.path.insert(0, str(project_root))
 import pandas as pd
 import numpy as np
 import talib
+from talib import abstract, stream
+from numba import njit, prange
 from loguru import logger
 from typing import Dict, List, Optional
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 
 from src.config.config_loader import config
 from src.database.db_manager import db_manager
-from src.database.models import DailyBar
+from src.database.models import DailyBar, Symbol
+from src.indicators.indicator_store import IndicatorStore
+
+# DataFrame indicator column -> DailyBar column
+INDICATOR_DB_COLUMNS = {
+    'sma_20': 'sma_20',
+    'sma_50': 'sma_50',
+    'sma_200': 'sma_200',
+    'rsi_14': 'rsi_14',
+    'macd': 'macd',
+    'macd_signal': 'macd_signal',
+    'bb_upper': 'bbands_upper',
+    'bb_middle': 'bbands_middle',
+    'bb_lower': 'bbands_lower',
+}
+
+# DataFrame pattern column -> TA-Lib candlestick function
+CANDLE_PATTERNS = {
+    'cdl_doji': 'CDLDOJI',
+    'cdl_hammer': 'CDLHAMMER',
+    'cdl_engulfing': 'CDLENGULFING',
+    'cdl_morning_star': 'CDLMORNINGSTAR',
+    'cdl_evening_star': 'CDLEVENINGSTAR',
+}
+
+
+@njit(parallel=True, cache=True, error_model='numpy')
+def _derived_indicators(
+    close, sma20, sma50, sma200, bb_upper, bb_lower, rsi14,
+    out_p20, out_p50, out_p200, out_bbpos,
+    out_overbought, out_oversold, out_20_above_50, out_50_above_200
+):
+    """
+    Fill the derived indicator arrays in one fused pass
+    
+    fastmath is deliberately off: its no-NaN assumption would break the
+    NaN warm-up comparisons (NaN > 70 must stay False).
+    """
+    for i in prange(close.shape[0]):
+        out_p20[i] = close[i] / sma20[i]
+        out_p50[i] = close[i] / sma50[i]
+        out_p200[i] = close[i] / sma200[i]
+        out_bbpos[i] = (close[i] - bb_lower[i]) / (bb_upper[i] - bb_lower[i])
+        out_overbought[i] = rsi14[i] > 70
+        out_oversold[i] = rsi14[i] < 30
+        out_20_above_50[i] = sma20[i] > sma50[i]
+        out_50_above_200[i] = sma50[i] > sma200[i]
+
+
+# Ticker -> symbols.id, filled by _symbol_id(). Only existing symbols are
+# cached (misses raise), so the symbols table bounds its size.
+_symbol_ids: Dict[str, int] = {}
+
+
+def _symbol_id(session: Session, symbol: str) -> int:
+    """
+    Resolve a ticker to its symbols.id on the caller's session
+    
+    Cached per process; the query only runs for tickers not seen yet.
+    Raises LookupError for unknown tickers (not cached, so a symbol added
+    later resolves on the next call). Drop a stale entry with
+    _symbol_ids.pop(symbol) or clear all with _symbol_ids.clear().
+    """
+    symbol_id = _symbol_ids.get(symbol)
+    if symbol_id is None:
+        symbol_id = session.execute(
+            select(Symbol.id).where(Symbol.symbol == symbol)
+        ).scalar_one_or_none()
+        if symbol_id is None:
+            raise LookupError(f"Symbol {symbol} not found in database")
+        _symbol_ids[symbol] = symbol_id
+    return symbol_id
+
+
+def _bar_rows(session: Session, symbol_id: int, start_date: str, end_date: str) -> list:
+    """Daily bars of a symbol as plain row tuples (no ORM objects)"""
+    return session.execute(
+        select(
+            DailyBar.date,
+            DailyBar.open,
+            DailyBar.high,
+            DailyBar.low,
+            DailyBar.close,
+            DailyBar.volume,
+            DailyBar.adj_close
+        ).where(
+            DailyBar.symbol_id == symbol_id,
+            DailyBar.date >= start_date,
+            DailyBar.date <= end_date
+        ).order_by(DailyBar.date)
+    ).all()
 
 
 class IndicatorCalculator:
@@ -27,6 +122,12 @@ class IndicatorCalculator:
     
     def __init__(self):
         """Initialize indicator calculator"""
+        self.store = IndicatorStore()
+        
+        # Pattern functions are built once and reused for every DataFrame
+        self._pattern_functions = {
+            col: abstract.Function(name) for col, name in CANDLE_PATTERNS.items()
+        }
         logger.info("Indicator calculator initialized")
     
     def calculate_all_indicators(
@@ -40,13 +141,13 @@ class IndicatorCalculator:
         
         Args:
             df: DataFrame with OHLCV data (must have: open, high, low, close, volume)
-            save_to_db: Whether to save indicators to database
+            save_to_db: Whether to persist indicators (Parquet store + latest bar in database)
             symbol_id: Symbol ID for database saving
         
         Returns:
             DataFrame with indicators added
         """
-        logger.info(f"Calculating indicators for {len(df)} bars")
+        logger.opt(lazy=True).debug("Calculating indicators for {} bars", lambda: len(df))
         
         # Make a copy to avoid modifying original
         df = df.copy()
@@ -67,6 +168,9 @@ class IndicatorCalculator:
         df['ema_12'] = talib.EMA(close, timeperiod=12)
         df['ema_26'] = talib.EMA(close, timeperiod=26)
         
+        # 20-bar average volume, read by the strategy volume filters
+        df['volume_sma_20'] = talib.SMA(volume, timeperiod=20)
+        
         # ====================================================================
         # MOMENTUM INDICATORS
         # ====================================================================
@@ -148,76 +252,125 @@ class IndicatorCalculator:
         # ====================================================================
         # PATTERN RECOGNITION (Boolean signals)
         # ====================================================================
-        df['cdl_doji'] = talib.CDLDOJI(open_prices, high, low, close)
-        df['cdl_hammer'] = talib.CDLHAMMER(open_prices, high, low, close)
-        df['cdl_engulfing'] = talib.CDLENGULFING(open_prices, high, low, close)
-        df['cdl_morning_star'] = talib.CDLMORNINGSTAR(open_prices, high, low, close)
-        df['cdl_evening_star'] = talib.CDLEVENINGSTAR(open_prices, high, low, close)
+        inputs = {
+            'open': open_prices,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': volume
+        }
+        for col, pattern_func in self._pattern_functions.items():
+            df[col] = pattern_func(inputs)
         
         # ====================================================================
         # DERIVED INDICATORS
         # ====================================================================
+        n = len(df)
+        price_to_sma20 = np.empty(n)
+        price_to_sma50 = np.empty(n)
+        price_to_sma200 = np.empty(n)
+        bb_position = np.empty(n)
+        rsi_overbought = np.empty(n, dtype=np.bool_)
+        rsi_oversold = np.empty(n, dtype=np.bool_)
+        sma_20_above_50 = np.empty(n, dtype=np.bool_)
+        sma_50_above_200 = np.empty(n, dtype=np.bool_)
+        
+        _derived_indicators(
+            np.ascontiguousarray(close, dtype=np.float64),
+            df['sma_20'].values, df['sma_50'].values, df['sma_200'].values,
+            upper, lower, df['rsi_14'].values,
+            price_to_sma20, price_to_sma50, price_to_sma200, bb_position,
+            rsi_overbought, rsi_oversold, sma_20_above_50, sma_50_above_200
+        )
+        
         # Price relative to moving averages
-        df['price_to_sma20'] = close / df['sma_20']
-        df['price_to_sma50'] = close / df['sma_50']
-        df['price_to_sma200'] = close / df['sma_200']
+        df['price_to_sma20'] = price_to_sma20
+        df['price_to_sma50'] = price_to_sma50
+        df['price_to_sma200'] = price_to_sma200
         
         # Moving average crossovers (boolean)
-        df['sma_20_above_50'] = df['sma_20'] > df['sma_50']
-        df['sma_50_above_200'] = df['sma_50'] > df['sma_200']
+        df['sma_20_above_50'] = sma_20_above_50
+        df['sma_50_above_200'] = sma_50_above_200
         
         # Bollinger Band position (0-1, where is price in the band?)
-        df['bb_position'] = (close - lower) / (upper - lower)
+        df['bb_position'] = bb_position
         
         # RSI overbought/oversold
-        df['rsi_overbought'] = df['rsi_14'] > 70
-        df['rsi_oversold'] = df['rsi_14'] < 30
+        df['rsi_overbought'] = rsi_overbought
+        df['rsi_oversold'] = rsi_oversold
         
-        logger.success(f"✓ Calculated {len(df.columns) - 6} indicators")  # Subtract original OHLCV columns
+        logger.opt(lazy=True).debug("✓ Calculated {} indicators", lambda: len(df.columns) - 6)  # Subtract original OHLCV columns
         
         # Save to database if requested
+        # Full history goes to the Parquet store; the database row of the
+        # latest bar gets its indicators for dashboard queries
         if save_to_db and symbol_id is not None:
+            self.store.write(symbol_id, df)
             self._save_indicators_to_db(df, symbol_id)
         
         return df
     
     def _save_indicators_to_db(self, df: pd.DataFrame, symbol_id: int) -> None:
         """
-        Save calculated indicators back to database
+        Save the latest bar's indicators to the database
+        
+        Only the most recent DailyBar row is updated, for dashboard queries;
+        full history is read from the IndicatorStore. Indicators already on
+        earlier rows are left as they are.
         
         Args:
             df: DataFrame with indicators
             symbol_id: Symbol ID
         """
+        session = db_manager.create_session()
         try:
-            with db_manager.get_session() as session:
-                updated = 0
-                
-                for date, row in df.iterrows():
-                    # Find existing bar
-                    bar = session.query(DailyBar).filter_by(
-                        symbol_id=symbol_id,
-                        date=date
-                    ).first()
-                    
-                    if bar:
-                        # Update indicators
-                        bar.sma_20 = row.get('sma_20')
-                        bar.sma_50 = row.get('sma_50')
-                        bar.sma_200 = row.get('sma_200')
-                        bar.rsi_14 = row.get('rsi_14')
-                        bar.macd = row.get('macd')
-                        bar.macd_signal = row.get('macd_signal')
-                        bar.bbands_upper = row.get('bb_upper')
-                        bar.bbands_middle = row.get('bb_middle')
-                        bar.bbands_lower = row.get('bb_lower')
-                        updated += 1
-                
-                session.commit()
-                logger.success(f"✓ Saved indicators for {updated} bars to database")
-                
-        except Exception as e:
+            columns = [col for col in INDICATOR_DB_COLUMNS if col in df.columns]
+            latest = df[columns].iloc[-1:].rename(columns=INDICATOR_DB_COLUMNS)
+            latest_date = latest.index[0].date()
+            values = {
+                col: (None if pd.isna(value) else value)
+                for col, value in latest.to_dict('records')[0].items()
+            }
+            
+            updated = session.execute(
+                update(DailyBar)
+                .where(DailyBar.symbol_id == symbol_id, DailyBar.date == latest_date)
+                .values(values)
+            ).rowcount
+            session.commit()
+            
+            logger.opt(lazy=True).debug(
+                "✓ Saved latest indicators for {} bar(s) to database", lambda: updated
+            )
+            
+        except SQLAlchemyError as e:
+            session.rollback()
             logger.error(f"Failed to save indicators to database: {e}")
+        finally:
+            session.close()
+    
+    def get_latest_patterns(self, df: pd.DataFrame) -> Dict[str, int]:
+        """
+        Evaluate candlestick patterns for the most recent bar only
+        
+        Uses the TA-Lib streaming API, which computes just the last value
+        instead of the full history. Intended for live mode.
+        
+        Args:
+            df: DataFrame with OHLC data
+        
+        Returns:
+            Dictionary mapping pattern column -> latest TA-Lib pattern value
+        """
+        open_prices = df['open'].values
+        high = df['high'].values
+        low = df['low'].values
+        close = df['close'].values
+        
+        return {
+            col: int(getattr(stream, name)(open_prices, high, low, close))
+            for col, name in CANDLE_PATTERNS.items()
+        }
     
     def get_indicator_summary(self, df: pd.DataFrame) -> Dict:
         """
@@ -283,45 +436,46 @@ class IndicatorCalculator:
         """
         try:
             with db_manager.get_session() as session:
-                # Get symbol
-                from src.database.models import Symbol
-                symbol_obj = session.query(Symbol).filter_by(symbol=symbol).first()
-                
-                if not symbol_obj:
+                # Get symbol and its daily bars
+                try:
+                    cached = symbol in _symbol_ids
+                    symbol_id = _symbol_id(session, symbol)
+                    rows = _bar_rows(session, symbol_id, start_date, end_date)
+                    
+                    # No bars may mean the cached id belongs to a symbol that
+                    # was deleted (and maybe re-created): resolve it again
+                    if not rows and cached:
+                        _symbol_ids.pop(symbol, None)
+                        fresh_id = _symbol_id(session, symbol)
+                        if fresh_id != symbol_id:
+                            symbol_id = fresh_id
+                            rows = _bar_rows(session, symbol_id, start_date, end_date)
+                except LookupError:
                     logger.error(f"Symbol {symbol} not found in database")
                     return None
                 
-                # Get daily bars
-                bars = session.query(DailyBar).filter(
-                    DailyBar.symbol_id == symbol_obj.id,
-                    DailyBar.date >= start_date,
-                    DailyBar.date <= end_date
-                ).order_by(DailyBar.date).all()
-                
-                if not bars:
+                if not rows:
                     logger.warning(f"No data found for {symbol} between {start_date} and {end_date}")
                     return None
                 
                 # Convert to DataFrame
-                data = []
-                for bar in bars:
-                    data.append({
-                        'date': bar.date,
-                        'open': bar.open,
-                        'high': bar.high,
-                        'low': bar.low,
-                        'close': bar.close,
-                        'volume': bar.volume,
-                        'adj_close': bar.adj_close
-                    })
+                df = pd.DataFrame.from_records(
+                    rows,
+                    columns=['date', 'open', 'high', 'low', 'close', 'volume', 'adj_close'],
+                    index='date',
+                    coerce_float=True
+                )
+                df.index = pd.to_datetime(df.index)
                 
-                df = pd.DataFrame(data)
-                df.set_index('date', inplace=True)
+                logger.opt(lazy=True).debug("Loaded {} bars for {}", lambda: len(df), lambda: symbol)
                 
-                logger.info(f"Loaded {len(df)} bars for {symbol}")
+                # Reuse stored indicators computed from exactly these bars
+                stored = self.store.read(symbol_id, df)
+                if stored is not None:
+                    return df.join(stored)
                 
                 # Calculate indicators
-                df = self.calculate_all_indicators(df, save_to_db=True, symbol_id=symbol_obj.id)
+                df = self.calculate_all_indicators(df, save_to_db=True, symbol_id=symbol_id)
                 
                 return df
                 
@@ -0,0 +1,145 @@
+"""
+AlphaFactory OS - Indicator Store
+Columnar Parquet cache for calculated indicators, one file per symbol and window
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import hashlib
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+from typing import List, Optional
+
+from src.config.config_loader import config
+
+
+# Raw bar columns that are never written to the store
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume', 'adj_close']
+
+# Parquet schema metadata key holding the OHLCV fingerprint of a window
+FINGERPRINT_KEY = b'ohlcv_fingerprint'
+
+
+class IndicatorStore:
+    """
+    Persist indicator columns as Parquet files keyed by symbol ID and window
+    
+    Indicator values depend on the bars they were computed from, warm-up
+    included (SMA/RSI NaNs at the start, EMA seeds, cumulative OBV), so a
+    stored window is only served for exactly the same bars: same first and
+    last date and the same OHLCV fingerprint. Windows are never merged, and
+    re-downloaded or corrected bars change the fingerprint, which forces a
+    recompute.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize indicator store
+        
+        Args:
+            cache_dir: Directory for Parquet files (default: <data_dir>/indicators)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else config.data_dir / 'indicators'
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.compression = config.get_yaml('data', 'storage', 'compression', default='snappy')
+    
+    def _path(self, symbol_id: int, index: pd.DatetimeIndex) -> Path:
+        """Parquet file path for a symbol's window (first and last bar date)"""
+        return self.cache_dir / f'ind_{symbol_id}_{index[0]:%Y%m%d}_{index[-1]:%Y%m%d}.parquet'
+    
+    @staticmethod
+    def indicator_columns(df: pd.DataFrame) -> List[str]:
+        """Return the non-OHLCV columns of a DataFrame"""
+        return [col for col in df.columns if col not in OHLCV_COLUMNS]
+    
+    @staticmethod
+    def fingerprint(df: pd.DataFrame) -> str:
+        """
+        Hash of the dates and OHLCV values of a DataFrame
+        
+        Args:
+            df: DataFrame with OHLCV columns, indexed by date
+        
+        Returns:
+            Hex digest identifying the bars
+        """
+        bars = df[[col for col in OHLCV_COLUMNS if col in df.columns]]
+        row_hashes = pd.util.hash_pandas_object(bars, index=True).to_numpy()
+        return hashlib.sha1(row_hashes.tobytes()).hexdigest()
+    
+    def write(self, symbol_id: int, df: pd.DataFrame) -> None:
+        """
+        Write the indicators computed over a window of bars
+        
+        Replaces any stored copy of the same window. Earlier windows with
+        the same first date (the same history before new bars were
+        appended) are removed.
+        
+        Args:
+            symbol_id: Symbol ID
+            df: DataFrame with OHLCV and indicators, indexed by date
+        """
+        if df.empty:
+            return
+        
+        indicators = df[self.indicator_columns(df)].rename_axis('date')
+        table = pa.Table.from_pandas(indicators)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            FINGERPRINT_KEY: self.fingerprint(df).encode()
+        })
+        
+        path = self._path(symbol_id, df.index)
+        for stale in self.cache_dir.glob(f'ind_{symbol_id}_{df.index[0]:%Y%m%d}_*.parquet'):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        
+        pq.write_table(table, path, compression=self.compression)
+        logger.opt(lazy=True).debug(
+            "Stored {} indicator rows for symbol_id={}", lambda: len(indicators), lambda: symbol_id
+        )
+    
+    def read(self, symbol_id: int, bars: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Read the indicators stored for exactly these bars
+        
+        Args:
+            symbol_id: Symbol ID
+            bars: OHLCV DataFrame indexed by date, as loaded from the database
+        
+        Returns:
+            DataFrame of indicators indexed by date, or None if the window is
+            not stored or its bars changed since it was written
+        """
+        if bars.empty:
+            return None
+        
+        path = self._path(symbol_id, bars.index)
+        if not path.exists():
+            return None
+        
+        table = pq.read_table(path)
+        stored_fingerprint = (table.schema.metadata or {}).get(FINGERPRINT_KEY)
+        if stored_fingerprint != self.fingerprint(bars).encode():
+            logger.opt(lazy=True).debug(
+                "Stored indicators for symbol_id={} are stale, recomputing", lambda: symbol_id
+            )
+            return None
+        
+        df = table.to_pandas()
+        return df if df.index.equals(bars.index) else None
+    
+    def clear(self, symbol_id: int) -> None:
+        """
+        Remove all stored windows of a symbol
+        
+        Args:
+            symbol_id: Symbol ID
+        """
+        for path in self.cache_dir.glob(f'ind_{symbol_id}_*.parquet'):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,36 @@
+"""
+Numba-compiled position sizing and stop kernels used by AdvancedStrategy
+
+Routines called once per sized trade or once per bar; kept free of Python
+objects so walk-forward and parameter sweeps do not pay interpreter
+overhead.
+"""
+
+from numba import njit
+
+
+@njit(cache=True)
+def _update_trailing_stops_batch(prices, sides, stops, trail_pct):
+    """
+    Ratchet the trailing stops of all open positions in place.
+
+    Long stops only move up to ``price * (1 - trail_pct)``, short stops
+    only move down to ``price * (1 + trail_pct)``. Rows with side 0 or a
+    NaN stop/price are left unchanged (NaN compares False, hence no
+    fastmath).
+
+    Args:
+        prices: Current price per position row
+        sides: int8 direction per row (1 long, -1 short, 0 flat)
+        stops: Stop price per row, updated in place
+        trail_pct: Trailing stop percentage
+    """
+    for i in range(prices.shape[0]):
+        side = sides[i]
+        candidate = prices[i] * (1.0 - side * trail_pct)
+        if side == 1:
+            if candidate > stops[i]:
+                stops[i] = candidate
+        elif side == -1:
+            if candidate < stops[i]:
+                stops[i] = candidate
@@ -10,10 +10,187 @@ Strategy Logic:
 Classic mean reversion strategy that profits from price returning to the mean.
 """
 
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
 import pandas as pd
 import numpy as np
+from numba import njit, prange
 from typing import List
-from strategy_base import AdvancedStrategy, SignalType, PositionSizingMethod
+from src.strategies.strategy_base import AdvancedStrategy, SignalType, PositionSizingMethod
+from src.strategies.signal_utils import avg_volume_20, avg_volume_20_pl, unpack, window_min_mask, pl_columns
+
+
+# Only fastmath flags that cannot change a signal: 'nsz' may flip the sign
+# of a zero, which compares equal. 'nnan'/'ninf' would break the False
+# comparisons of NaN warm-up bars, and 'reassoc'/'contract'/'arcp'/'afn'
+# reorder or fuse arithmetic, so the band width could differ from pandas
+_FASTMATH = {'nsz'}
+
+
+@njit(fastmath=_FASTMATH)
+def _bb_meanrev_signals_nb(
+    high, low, close, volume, avg_volume, upper, middle, lower, rsi,
+    vol_surge_ratio, rsi_hi, rsi_lo, exit_mid, require_sq, sq_thresh, out
+):
+    """
+    Fused mean-reversion signal kernel (one pass over the bars).
+    
+    Mirrors BollingerBandsMeanReversion.generate_signals: squeeze-ended and
+    middle-band crosses from carried previous-bar scalars instead of
+    shifted series. ``avg_volume`` is the 20-bar average volume. Bands
+    arrive precomputed, so the std multiplier never enters the kernel and
+    one compiled specialization serves every bb_std.
+    
+    Writes into ``out`` (zero-initialised int8, one slot per bar):
+    1 (LONG), -1 (SHORT), 2 (EXIT_LONG), -2 (EXIT_SHORT), 0
+    """
+    window = 20
+    n = out.shape[0]
+    
+    prev_close = np.nan
+    prev_middle = np.nan
+    prev_squeeze = False
+    
+    if require_sq:
+        # Band width and whether it is the narrowest of the last 20 bars
+        width = (upper - lower) / middle
+        narrowest = window_min_mask(width, window)
+    
+    for i in range(n):
+        volume_surge = volume[i] > avg_volume[i] * vol_surge_ratio
+        
+        touch_lower = low[i] <= lower[i] or close[i] <= lower[i]
+        touch_upper = high[i] >= upper[i] or close[i] >= upper[i]
+        
+        if require_sq:
+            # Squeeze: narrow band, or narrowest width of the last 20 bars
+            squeeze = width[i] < sq_thresh or narrowest[i]
+            squeeze_ended = prev_squeeze and not squeeze
+            prev_squeeze = squeeze
+        else:
+            squeeze_ended = True
+        
+        if touch_lower and volume_surge and rsi[i] < rsi_hi and squeeze_ended:
+            out[i] = 1
+        if touch_upper and volume_surge and rsi[i] > rsi_lo and squeeze_ended:
+            out[i] = -1
+        
+        if exit_mid:
+            # Middle-band crosses
+            if close[i] >= middle[i] and prev_close < prev_middle:
+                out[i] = 2
+            if close[i] <= middle[i] and prev_close > prev_middle:
+                out[i] = -2
+        
+        prev_close = close[i]
+        prev_middle = middle[i]
+
+
+@njit(parallel=True)
+def _bb_meanrev_batch_nb(highs, lows, closes, volumes, avg_volumes, uppers, middles, lowers, rsis, params, out):
+    """
+    Run the mean-reversion kernel for every (symbol, parameter set) pair.
+    
+    Inputs are [n_symbols, n_bars] arrays, ``params`` is [n_params, 6] (see
+    BollingerBandsMeanReversion._kernel_params) and ``out`` is a zeroed
+    [n_symbols, n_params, n_bars] int8 buffer. Pairs are independent, so
+    they are spread across cores with prange.
+    """
+    n_params = params.shape[0]
+    for t in prange(highs.shape[0] * n_params):
+        s = t // n_params
+        p = t % n_params
+        _bb_meanrev_signals_nb(
+            highs[s], lows[s], closes[s], volumes[s], avg_volumes[s],
+            uppers[s], middles[s], lowers[s], rsis[s],
+            params[p, 0], params[p, 1], params[p, 2],
+            params[p, 3], params[p, 4], params[p, 5],
+            out[s, p]
+        )
+
+
+@njit(fastmath=_FASTMATH)
+def _bb_breakout_signals_nb(close, volume, avg_volume, upper, lower, adx, vol_surge_ratio, min_adx, n):
+    """
+    Fused breakout signal kernel (one pass over n bars).
+    
+    Mirrors BollingerBandBreakout.generate_signals: the volume/ADX
+    confirmation and the band crossings are evaluated per bar as scalars,
+    so no boolean mask is ever materialized.
+    
+    Returns:
+        int8 array: 1 (LONG), -1 (SHORT), 0
+    """
+    out = np.zeros(n, dtype=np.int8)
+    
+    prev_close = np.nan
+    prev_upper = np.nan
+    prev_lower = np.nan
+    
+    for i in range(n):
+        confirm = volume[i] > avg_volume[i] * vol_surge_ratio and adx[i] > min_adx
+        
+        if confirm:
+            if close[i] < lower[i] and prev_close >= prev_lower:
+                out[i] = -1
+            elif close[i] > upper[i] and prev_close <= prev_upper:
+                out[i] = 1
+        
+        prev_close = close[i]
+        prev_upper = upper[i]
+        prev_lower = lower[i]
+    
+    return out
+
+
+@njit(fastmath=_FASTMATH)
+def _bb_combo_signals_nb(high, low, close, upper, lower, adx, rsi, rng_t, trd_t, n):
+    """
+    Fused regime-switching signal kernel (one pass over n bars).
+    
+    Mirrors BollingerBandCombo.generate_signals: band touches in a ranging
+    market, band breakouts (previous bar carried as scalars) in a trending
+    market.
+    
+    Returns:
+        int8 array: 1 (LONG), -1 (SHORT), 0
+    """
+    out = np.zeros(n, dtype=np.int8)
+    
+    prev_close = np.nan
+    prev_upper = np.nan
+    prev_lower = np.nan
+    
+    for i in range(n):
+        ranging = adx[i] < rng_t
+        trending = adx[i] > trd_t
+        
+        long_signal = False
+        short_signal = False
+        
+        # Regimes are tested independently: the thresholds may overlap
+        if ranging:
+            # Mean reversion on band touches
+            long_signal = low[i] <= lower[i] and rsi[i] < 70
+            short_signal = high[i] >= upper[i] and rsi[i] > 30
+        if trending:
+            # Breakout through the bands
+            long_signal = long_signal or (close[i] > upper[i] and prev_close <= prev_upper)
+            short_signal = short_signal or (close[i] < lower[i] and prev_close >= prev_lower)
+        
+        if short_signal:
+            out[i] = -1
+        elif long_signal:
+            out[i] = 1
+        
+        prev_close = close[i]
+        prev_upper = upper[i]
+        prev_lower = lower[i]
+    
+    return out
 
 
 class BollingerBandsMeanReversion(AdvancedStrategy):
@@ -21,6 +198,12 @@ class BollingerBandsMeanReversion(AdvancedStrategy):
     Mean reversion strategy using Bollinger Bands.
     """
     
+    __slots__ = (
+        'bb_period', 'bb_std', 'rsi_period', 'rsi_extreme_high', 'rsi_extreme_low',
+        'volume_surge_ratio', 'exit_at_middle_band', 'require_bb_squeeze', 'squeeze_threshold',
+        '_upper_col', '_middle_col', '_lower_col', '_rsi_col', '_required_indicators'
+    )
+    
     def __init__(
         self,
         bb_period: int = 20,
@@ -64,6 +247,13 @@ class BollingerBandsMeanReversion(AdvancedStrategy):
         self.require_bb_squeeze = require_bb_squeeze
         self.squeeze_threshold = squeeze_threshold
         
+        # Indicator column names, built once
+        self._upper_col = f'bb_upper_{bb_period}_{bb_std}'
+        self._middle_col = f'bb_middle_{bb_period}_{bb_std}'
+        self._lower_col = f'bb_lower_{bb_period}_{bb_std}'
+        self._rsi_col = f'rsi_{rsi_period}'
+        self._required_indicators = (self._upper_col, self._middle_col, self._lower_col, self._rsi_col)
+        
         self.parameters.update({
             'bb_period': bb_period,
             'bb_std': bb_std,
@@ -78,14 +268,9 @@ class BollingerBandsMeanReversion(AdvancedStrategy):
     
     def get_required_indicators(self) -> List[str]:
         """Return required indicators."""
-        return [
-            f'bb_upper_{self.bb_period}_{self.bb_std}',
-            f'bb_middle_{self.bb_period}_{self.bb_std}',
-            f'bb_lower_{self.bb_period}_{self.bb_std}',
-            f'rsi_{self.rsi_period}',
-        ]
+        return list(self._required_indicators)
     
-    def _detect_bb_squeeze(self, data: pd.DataFrame) -> pd.Series:
+    def _detect_bb_squeeze(self, data: pd.DataFrame) -> np.ndarray:
         """
         Detect Bollinger Band squeeze (low volatility periods).
         
@@ -93,22 +278,19 @@ class BollingerBandsMeanReversion(AdvancedStrategy):
             data: DataFrame with BB indicators
             
         Returns:
-            Boolean series indicating squeeze conditions
+            Boolean array indicating squeeze conditions
         """
-        upper_col = f'bb_upper_{self.bb_period}_{self.bb_std}'
-        lower_col = f'bb_lower_{self.bb_period}_{self.bb_std}'
-        middle_col = f'bb_middle_{self.bb_period}_{self.bb_std}'
+        a = unpack(data, [self._upper_col, self._lower_col, self._middle_col])
         
         # BB width as percentage of middle band
-        bb_width = (data[upper_col] - data[lower_col]) / data[middle_col]
+        bb_width = (a[self._upper_col] - a[self._lower_col]) / a[self._middle_col]
         
-        # Squeeze = BB width narrower than threshold
-        squeeze = bb_width < self.squeeze_threshold
+        # Squeeze = BB width narrower than threshold, or narrowest in recent
+        # period (OR-ed into the narrowest mask in place)
+        squeeze = window_min_mask(bb_width, 20)
+        np.logical_or(squeeze, np.less(bb_width, self.squeeze_threshold), out=squeeze)
         
-        # Also check if width is narrowest in recent period
-        narrowest = bb_width == bb_width.rolling(20).min()
-        
-        return squeeze | narrowest
+        return squeeze
     
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
@@ -120,68 +302,123 @@ class BollingerBandsMeanReversion(AdvancedStrategy):
         Returns:
             Series with signals: 1 (LONG), -1 (SHORT), 0 (NEUTRAL)
         """
+        cached = self._cached_signals(data)
+        if cached is not None:
+            return cached
+        
         self.validate_data(data)
         
-        signals = pd.Series(0, index=data.index)
+        # Extract price and indicator columns
+        a = unpack(data, ['high', 'low', 'close', 'volume', self._upper_col, self._middle_col, self._lower_col, self._rsi_col])
         
-        # Get indicator columns
-        upper_col = f'bb_upper_{self.bb_period}_{self.bb_std}'
-        middle_col = f'bb_middle_{self.bb_period}_{self.bb_std}'
-        lower_col = f'bb_lower_{self.bb_period}_{self.bb_std}'
-        rsi_col = f'rsi_{self.rsi_period}'
+        signals = np.zeros(len(data), dtype=np.int8)
+        _bb_meanrev_signals_nb(
+            a['high'], a['low'], a['close'], a['volume'], avg_volume_20(data, a['volume']),
+            a[self._upper_col], a[self._middle_col], a[self._lower_col], a[self._rsi_col],
+            *self._kernel_params(),
+            signals
+        )
         
-        upper_bb = data[upper_col]
-        middle_bb = data[middle_col]
-        lower_bb = data[lower_col]
-        rsi = data[rsi_col]
+        return self._store_signals(data, pd.Series(signals, index=data.index))
+    
+    def _kernel_params(self) -> tuple:
+        """Signal parameters in kernel argument order (all float64)."""
+        return (
+            float(self.volume_surge_ratio),
+            float(self.rsi_extreme_high),
+            float(self.rsi_extreme_low),
+            float(self.exit_at_middle_band),
+            float(self.require_bb_squeeze),
+            float(self.squeeze_threshold),
+        )
+    
+    @classmethod
+    def batch_generate_signals(cls, datas: List[pd.DataFrame], params_grid: List[dict]) -> np.ndarray:
+        """
+        Generate signals for many symbols x parameter sets in parallel.
         
-        # Volume surge detection
-        avg_volume = data['volume'].rolling(window=20).mean()
-        volume_surge = data['volume'] > (avg_volume * self.volume_surge_ratio)
+        All parameter sets must share bb_period, bb_std and rsi_period (the
+        indicator columns read); they may vary the signal thresholds.
         
-        # Price touching/breaking BB bands
-        touch_lower = (data['low'] <= lower_bb) | (data['close'] <= lower_bb)
-        touch_upper = (data['high'] >= upper_bb) | (data['close'] >= upper_bb)
+        Args:
+            datas: One DataFrame per symbol, all with the same number of bars
+            params_grid: Constructor keyword arguments, one dict per parameter set
+            
+        Returns:
+            int8 array of shape [n_symbols, n_params, n_bars]
+        """
+        strategies = [cls(**params) for params in params_grid]
         
-        # Check for BB squeeze if required
-        if self.require_bb_squeeze:
-            squeeze_detected = self._detect_bb_squeeze(data)
-            # Wait for squeeze to end (expansion)
-            squeeze_ended = squeeze_detected.shift(1) & ~squeeze_detected
-        else:
-            squeeze_ended = pd.Series(True, index=data.index)
-        
-        # LONG conditions: Touch lower BB + volume surge + RSI not extreme
-        long_conditions = (
-            touch_lower &
-            volume_surge &
-            (rsi < self.rsi_extreme_high) &  # Not overbought
-            squeeze_ended
-        )
+        indicator_params = {(s.bb_period, s.bb_std, s.rsi_period) for s in strategies}
+        if len(indicator_params) != 1:
+            raise ValueError("params_grid must share bb_period, bb_std and rsi_period")
+        if len({len(data) for data in datas}) != 1:
+            raise ValueError("All symbols must have the same number of bars")
         
-        # SHORT conditions: Touch upper BB + volume surge + RSI not extreme
-        short_conditions = (
-            touch_upper &
-            volume_surge &
-            (rsi > self.rsi_extreme_low) &  # Not oversold
-            squeeze_ended
-        )
+        strategy = strategies[0]
+        for data in datas:
+            strategy.validate_data(data)
         
-        # Set signals
-        signals[long_conditions] = 1
-        signals[short_conditions] = -1
+        cols = [
+            'high', 'low', 'close', 'volume',
+            strategy._upper_col, strategy._middle_col, strategy._lower_col, strategy._rsi_col,
+        ]
+        arrays = [unpack(data, cols) for data in datas]
+        stacked = [np.stack([a[col] for a in arrays]) for col in cols]
+        avg_volumes = np.stack([avg_volume_20(data, a['volume']) for data, a in zip(datas, arrays)])
+        params = np.array([s._kernel_params() for s in strategies], dtype=np.float64)
         
-        # Generate exit signals if using middle band exits
-        if self.exit_at_middle_band:
-            # Exit long when price crosses above middle band
-            exit_long = (data['close'] >= middle_bb) & (data['close'].shift(1) < middle_bb.shift(1))
-            signals[exit_long] = 2  # EXIT_LONG signal
+        out = np.zeros((len(datas), len(strategies), len(datas[0])), dtype=np.int8)
+        _bb_meanrev_batch_nb(*stacked[:4], avg_volumes, *stacked[4:], params, out)
+        
+        return out
+    
+    def generate_signals_pl(self, df: "pl.DataFrame") -> "pl.Series":
+        """
+        Polars implementation of generate_signals (lazy expression pipeline).
+        
+        Args:
+            df: Polars DataFrame with OHLCV and indicators
             
-            # Exit short when price crosses below middle band
-            exit_short = (data['close'] <= middle_bb) & (data['close'].shift(1) > middle_bb.shift(1))
-            signals[exit_short] = -2  # EXIT_SHORT signal
+        Returns:
+            Int8 Series with signals: 1 (LONG), -1 (SHORT), 2/-2 (EXITS), 0
+        """
+        import polars as pl
+        
+        c = pl_columns(['high', 'low', 'close', 'volume', self._upper_col, self._middle_col, self._lower_col, self._rsi_col])
+        close = c['close']
+        upper_bb, middle_bb, lower_bb = c[self._upper_col], c[self._middle_col], c[self._lower_col]
+        
+        volume_surge = c['volume'] > avg_volume_20_pl(df.columns) * self.volume_surge_ratio
+        touch_lower = (c['low'] <= lower_bb) | (close <= lower_bb)
+        touch_upper = (c['high'] >= upper_bb) | (close >= upper_bb)
+        
+        if self.require_bb_squeeze:
+            bb_width = (upper_bb - lower_bb) / middle_bb
+            squeeze = (
+                (bb_width < self.squeeze_threshold) | (bb_width == bb_width.rolling_min(20))
+            ).fill_null(False)
+            squeeze_ended = squeeze.shift(1) & ~squeeze
+        else:
+            squeeze_ended = pl.lit(True)
         
-        return signals
+        rules = [
+            (touch_lower & volume_surge & (c[self._rsi_col] < self.rsi_extreme_high) & squeeze_ended, 1),
+            (touch_upper & volume_surge & (c[self._rsi_col] > self.rsi_extreme_low) & squeeze_ended, -1),
+        ]
+        if self.exit_at_middle_band:
+            prev_close, prev_middle = close.shift(1), middle_bb.shift(1)
+            rules += [
+                ((close >= middle_bb) & (prev_close < prev_middle), 2),
+                ((close <= middle_bb) & (prev_close > prev_middle), -2),
+            ]
+        
+        # Later rules take precedence, like successive masked writes
+        signal = pl.lit(0)
+        for condition, value in rules:
+            signal = pl.when(condition).then(value).otherwise(signal)
+        
+        return df.lazy().select(signal=signal.cast(pl.Int8)).collect()['signal']
 
 
 class BollingerBandBreakout(AdvancedStrategy):
@@ -191,6 +428,11 @@ class BollingerBandBreakout(AdvancedStrategy):
     Trades breakouts from BB bands, betting on trend continuation.
     """
     
+    __slots__ = (
+        'bb_period', 'bb_std', 'volume_surge_ratio', 'min_adx', 'require_squeeze_setup',
+        '_upper_col', '_middle_col', '_lower_col', '_required_indicators'
+    )
+    
     def __init__(
         self,
         bb_period: int = 20,
@@ -222,6 +464,12 @@ class BollingerBandBreakout(AdvancedStrategy):
         self.min_adx = min_adx
         self.require_squeeze_setup = require_squeeze_setup
         
+        # Indicator column names, built once
+        self._upper_col = f'bb_upper_{bb_period}_{bb_std}'
+        self._middle_col = f'bb_middle_{bb_period}_{bb_std}'
+        self._lower_col = f'bb_lower_{bb_period}_{bb_std}'
+        self._required_indicators = (self._upper_col, self._middle_col, self._lower_col, 'adx_14')
+        
         self.parameters.update({
             'bb_period': bb_period,
             'bb_std': bb_std,
@@ -232,12 +480,7 @@ class BollingerBandBreakout(AdvancedStrategy):
     
     def get_required_indicators(self) -> List[str]:
         """Return required indicators."""
-        return [
-            f'bb_upper_{self.bb_period}_{self.bb_std}',
-            f'bb_middle_{self.bb_period}_{self.bb_std}',
-            f'bb_lower_{self.bb_period}_{self.bb_std}',
-            'adx_14',
-        ]
+        return list(self._required_indicators)
     
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
@@ -249,47 +492,56 @@ class BollingerBandBreakout(AdvancedStrategy):
         Returns:
             Series with signals
         """
+        cached = self._cached_signals(data)
+        if cached is not None:
+            return cached
+        
         self.validate_data(data)
         
-        signals = pd.Series(0, index=data.index)
+        # Extract price and indicator columns
+        a = unpack(data, ['close', 'volume', 'adx_14', self._upper_col, self._lower_col])
         
-        # Get indicator columns
-        upper_col = f'bb_upper_{self.bb_period}_{self.bb_std}'
-        lower_col = f'bb_lower_{self.bb_period}_{self.bb_std}'
-        middle_col = f'bb_middle_{self.bb_period}_{self.bb_std}'
+        signals = _bb_breakout_signals_nb(
+            a['close'], a['volume'], avg_volume_20(data, a['volume']),
+            a[self._upper_col], a[self._lower_col], a['adx_14'],
+            float(self.volume_surge_ratio),
+            float(self.min_adx),
+            len(data),
+        )
         
-        upper_bb = data[upper_col]
-        lower_bb = data[lower_col]
-        middle_bb = data[middle_col]
+        return self._store_signals(data, pd.Series(signals, index=data.index))
+    
+    def generate_signals_pl(self, df: "pl.DataFrame") -> "pl.Series":
+        """
+        Polars implementation of generate_signals (lazy expression pipeline).
         
-        # Volume surge
-        avg_volume = data['volume'].rolling(window=20).mean()
-        volume_surge = data['volume'] > (avg_volume * self.volume_surge_ratio)
+        Args:
+            df: Polars DataFrame with OHLCV and indicators
+            
+        Returns:
+            Int8 Series with signals: 1 (LONG), -1 (SHORT), 0
+        """
+        import polars as pl
         
-        # ADX for trend strength
-        strong_trend = data['adx_14'] > self.min_adx
+        c = pl_columns(['close', 'volume', 'adx_14', self._upper_col, self._lower_col])
+        close, upper_bb, lower_bb = c['close'], c[self._upper_col], c[self._lower_col]
         
-        # Breakout detection: Close ABOVE upper band or BELOW lower band
-        breakout_above = (
-            (data['close'] > upper_bb) &
-            (data['close'].shift(1) <= upper_bb.shift(1))
+        confirm = (
+            (c['volume'] > avg_volume_20_pl(df.columns) * self.volume_surge_ratio) &
+            (c['adx_14'] > self.min_adx)
         )
-        
-        breakout_below = (
-            (data['close'] < lower_bb) &
-            (data['close'].shift(1) >= lower_bb.shift(1))
+        # Previous-bar values, shifted once and shared by both sides
+        prev_close, prev_upper, prev_lower = close.shift(1), upper_bb.shift(1), lower_bb.shift(1)
+        breakout_above = (close > upper_bb) & (prev_close <= prev_upper)
+        breakout_below = (close < lower_bb) & (prev_close >= prev_lower)
+        
+        signal = (
+            pl.when(breakout_below & confirm).then(-1)
+            .when(breakout_above & confirm).then(1)
+            .otherwise(0)
         )
         
-        # LONG on upside breakout
-        long_conditions = breakout_above & volume_surge & strong_trend
-        
-        # SHORT on downside breakout
-        short_conditions = breakout_below & volume_surge & strong_trend
-        
-        signals[long_conditions] = 1
-        signals[short_conditions] = -1
-        
-        return signals
+        return df.lazy().select(signal=signal.cast(pl.Int8)).collect()['signal']
 
 
 class BollingerBandCombo(AdvancedStrategy):
@@ -301,6 +553,11 @@ class BollingerBandCombo(AdvancedStrategy):
     - High ADX (>30): Breakout mode
     """
     
+    __slots__ = (
+        'bb_period', 'bb_std', 'adx_ranging_threshold', 'adx_trending_threshold',
+        '_upper_col', '_middle_col', '_lower_col', '_required_indicators'
+    )
+    
     def __init__(
         self,
         bb_period: int = 20,
@@ -329,6 +586,12 @@ class BollingerBandCombo(AdvancedStrategy):
         self.adx_ranging_threshold = adx_ranging_threshold
         self.adx_trending_threshold = adx_trending_threshold
         
+        # Indicator column names, built once
+        self._upper_col = f'bb_upper_{bb_period}_{bb_std}'
+        self._middle_col = f'bb_middle_{bb_period}_{bb_std}'
+        self._lower_col = f'bb_lower_{bb_period}_{bb_std}'
+        self._required_indicators = (self._upper_col, self._middle_col, self._lower_col, 'adx_14', 'rsi_14')
+        
         self.parameters.update({
             'bb_period': bb_period,
             'bb_std': bb_std,
@@ -338,13 +601,7 @@ class BollingerBandCombo(AdvancedStrategy):
     
     def get_required_indicators(self) -> List[str]:
         """Return required indicators."""
-        return [
-            f'bb_upper_{self.bb_period}_{self.bb_std}',
-            f'bb_middle_{self.bb_period}_{self.bb_std}',
-            f'bb_lower_{self.bb_period}_{self.bb_std}',
-            'adx_14',
-            'rsi_14',
-        ]
+        return list(self._required_indicators)
     
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
@@ -356,41 +613,53 @@ class BollingerBandCombo(AdvancedStrategy):
         Returns:
             Series with signals
         """
-        self.validate_data(data)
+        cached = self._cached_signals(data)
+        if cached is not None:
+            return cached
         
-        signals = pd.Series(0, index=data.index)
+        self.validate_data(data)
         
-        # Get columns
-        upper_col = f'bb_upper_{self.bb_period}_{self.bb_std}'
-        middle_col = f'bb_middle_{self.bb_period}_{self.bb_std}'
-        lower_col = f'bb_lower_{self.bb_period}_{self.bb_std}'
+        # Extract price and indicator columns
+        a = unpack(data, ['high', 'low', 'close', 'adx_14', 'rsi_14', self._upper_col, self._lower_col])
         
-        upper_bb = data[upper_col]
-        middle_bb = data[middle_col]
-        lower_bb = data[lower_col]
-        adx = data['adx_14']
-        rsi = data['rsi_14']
+        signals = _bb_combo_signals_nb(
+            a['high'], a['low'], a['close'], a[self._upper_col], a[self._lower_col],
+            a['adx_14'], a['rsi_14'],
+            float(self.adx_ranging_threshold),
+            float(self.adx_trending_threshold),
+            len(data),
+        )
         
-        # Identify market regime
-        ranging_market = adx < self.adx_ranging_threshold
-        trending_market = adx > self.adx_trending_threshold
+        return self._store_signals(data, pd.Series(signals, index=data.index))
+    
+    def generate_signals_pl(self, df: "pl.DataFrame") -> "pl.Series":
+        """
+        Polars implementation of generate_signals (lazy expression pipeline).
         
-        # Mean reversion signals (for ranging markets)
-        touch_lower = data['low'] <= lower_bb
-        touch_upper = data['high'] >= upper_bb
+        Args:
+            df: Polars DataFrame with OHLCV and indicators
+            
+        Returns:
+            Int8 Series with signals: 1 (LONG), -1 (SHORT), 0
+        """
+        import polars as pl
         
-        mean_reversion_long = ranging_market & touch_lower & (rsi < 70)
-        mean_reversion_short = ranging_market & touch_upper & (rsi > 30)
+        c = pl_columns(['high', 'low', 'close', 'adx_14', 'rsi_14', self._upper_col, self._lower_col])
+        close, upper_bb, lower_bb = c['close'], c[self._upper_col], c[self._lower_col]
         
-        # Breakout signals (for trending markets)
-        breakout_above = (data['close'] > upper_bb) & (data['close'].shift(1) <= upper_bb.shift(1))
-        breakout_below = (data['close'] < lower_bb) & (data['close'].shift(1) >= lower_bb.shift(1))
+        ranging_market = c['adx_14'] < self.adx_ranging_threshold
+        trending_market = c['adx_14'] > self.adx_trending_threshold
         
-        breakout_long = trending_market & breakout_above
-        breakout_short = trending_market & breakout_below
+        mean_reversion_long = ranging_market & (c['low'] <= lower_bb) & (c['rsi_14'] < 70)
+        mean_reversion_short = ranging_market & (c['high'] >= upper_bb) & (c['rsi_14'] > 30)
+        prev_close, prev_upper, prev_lower = close.shift(1), upper_bb.shift(1), lower_bb.shift(1)
+        breakout_long = trending_market & (close > upper_bb) & (prev_close <= prev_upper)
+        breakout_short = trending_market & (close < lower_bb) & (prev_close >= prev_lower)
         
-        # Combine signals
-        signals[mean_reversion_long | breakout_long] = 1
-        signals[mean_reversion_short | breakout_short] = -1
+        signal = (
+            pl.when(mean_reversion_short | breakout_short).then(-1)
+            .when(mean_reversion_long | breakout_long).then(1)
+            .otherwise(0)
+        )
         
-        return signals
+        return df.lazy().select(signal=signal.cast(pl.Int8)).collect()['signal']
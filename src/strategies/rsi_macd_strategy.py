@@ -11,10 +11,103 @@ This strategy looks for confluence between mean reversion (RSI)
 and momentum (MACD) for higher probability trades.
 """
 
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
 import pandas as pd
 import numpy as np
+from numba import njit, prange
 from typing import List
-from strategy_base import AdvancedStrategy, SignalType, PositionSizingMethod
+from src.strategies.strategy_base import AdvancedStrategy, SignalType, PositionSizingMethod
+from src.strategies.signal_utils import avg_volume_20, avg_volume_20_pl, unpack, pl_columns
+
+
+@njit(error_model='numpy')
+def _rsi_macd_signals_nb(rsi, macd, macd_signal, macd_hist, volume, avg_volume, close, trend_sma, adx, params, out):
+    """
+    RSI + MACD confluence kernel with the signal filters fused in.
+    
+    Mirrors RSI_MACD_Strategy.generate_signals followed by apply_filters
+    (and the Enhanced trend/ADX filters) in one pass: previous MACD and
+    signal-line values are carried as scalars for the crossover test.
+    
+    ``params`` (see RSI_MACD_Strategy._kernel_params):
+    rsi_oversold, rsi_overbought, require_hist, use_volume_filter,
+    min_volume_ratio, use_trend_filter, use_adx_filter, min_adx.
+    ``avg_volume`` (20-bar average), ``trend_sma`` and ``adx`` are only
+    read when their filter is on.
+    
+    Writes into ``out`` (zero-initialised int8, one slot per bar):
+    1 (LONG), -1 (SHORT), 0 (NEUTRAL)
+    """
+    rsi_os = params[0]
+    rsi_ob = params[1]
+    require_hist = params[2] != 0.0
+    use_vol = params[3] != 0.0
+    min_vr = params[4]
+    use_trend = params[5] != 0.0
+    use_adx = params[6] != 0.0
+    min_adx = params[7]
+    
+    prev_macd = np.nan
+    prev_signal = np.nan
+    
+    for i in range(out.shape[0]):
+        cross_above = macd[i] > macd_signal[i] and prev_macd <= prev_signal
+        cross_below = macd[i] < macd_signal[i] and prev_macd >= prev_signal
+        prev_macd = macd[i]
+        prev_signal = macd_signal[i]
+        
+        # LONG: RSI oversold + MACD bullish cross
+        long_signal = rsi[i] < rsi_os and cross_above
+        # SHORT: RSI overbought + MACD bearish cross
+        short_signal = rsi[i] > rsi_ob and cross_below
+        
+        if require_hist:
+            long_signal = long_signal and macd_hist[i] > 0
+            short_signal = short_signal and macd_hist[i] < 0
+        
+        if not (long_signal or short_signal):
+            continue
+        
+        # Volume filter: skip bars trading below the 20-day average ratio
+        if use_vol and volume[i] / avg_volume[i] < min_vr:
+            continue
+        
+        # ADX filter: only trade when the trend is strong enough
+        if use_adx and adx[i] < min_adx:
+            continue
+        
+        if short_signal:
+            # Trend filter: no shorts above the trend SMA
+            if not (use_trend and close[i] > trend_sma[i]):
+                out[i] = -1
+        elif long_signal:
+            # Trend filter: no longs below the trend SMA
+            if not (use_trend and close[i] < trend_sma[i]):
+                out[i] = 1
+
+
+@njit(parallel=True)
+def _rsi_macd_batch_nb(rsis, macds, macd_signals, macd_hists, volumes, avg_volumes, closes, trend_smas, adxs, params, out):
+    """
+    Run the RSI + MACD kernel for every (symbol, parameter set) pair.
+    
+    Inputs are [n_symbols, n_bars] arrays, ``params`` is [n_params, 8] (see
+    RSI_MACD_Strategy._kernel_params) and ``out`` is a zeroed
+    [n_symbols, n_params, n_bars] int8 buffer.
+    """
+    n_params = params.shape[0]
+    for t in prange(rsis.shape[0] * n_params):
+        s = t // n_params
+        p = t % n_params
+        _rsi_macd_signals_nb(
+            rsis[s], macds[s], macd_signals[s], macd_hists[s],
+            volumes[s], avg_volumes[s], closes[s], trend_smas[s], adxs[s],
+            params[p], out[s, p]
+        )
 
 
 class RSI_MACD_Strategy(AdvancedStrategy):
@@ -22,6 +115,13 @@ class RSI_MACD_Strategy(AdvancedStrategy):
     Combined RSI and MACD strategy looking for confluence signals.
     """
     
+    __slots__ = (
+        'rsi_period', 'rsi_oversold', 'rsi_overbought', 'macd_fast', 'macd_slow', 'macd_signal',
+        'require_macd_histogram_positive', 'volume_filter', 'min_volume_ratio',
+        '_rsi_col', '_macd_col', '_macd_signal_col', '_macd_hist_col', '_required_indicators',
+        '_use_fast_kernel'
+    )
+    
     def __init__(
         self,
         rsi_period: int = 14,
@@ -65,6 +165,21 @@ class RSI_MACD_Strategy(AdvancedStrategy):
         self.volume_filter = volume_filter
         self.min_volume_ratio = min_volume_ratio
         
+        # Indicator column names, built once
+        macd_suffix = f'{macd_fast}_{macd_slow}_{macd_signal}'
+        self._rsi_col = f'rsi_{rsi_period}'
+        self._macd_col = f'macd_{macd_suffix}'
+        self._macd_signal_col = f'macd_signal_{macd_suffix}'
+        self._macd_hist_col = f'macd_hist_{macd_suffix}'
+        self._required_indicators = (
+            self._rsi_col, self._macd_col, self._macd_signal_col, self._macd_hist_col,
+            'sma_20'  # For volume filter
+        )
+        
+        # Apply the signal filters inside the Numba kernel; when False they
+        # run in apply_filters() on the generated signals instead
+        self._use_fast_kernel = True
+        
         # Store in parameters dict
         self.parameters.update({
             'rsi_period': rsi_period,
@@ -80,93 +195,176 @@ class RSI_MACD_Strategy(AdvancedStrategy):
     
     def get_required_indicators(self) -> List[str]:
         """Return required indicators."""
-        return [
-            f'rsi_{self.rsi_period}',
-            f'macd_{self.macd_fast}_{self.macd_slow}_{self.macd_signal}',
-            f'macd_signal_{self.macd_fast}_{self.macd_slow}_{self.macd_signal}',
-            f'macd_hist_{self.macd_fast}_{self.macd_slow}_{self.macd_signal}',
-            'sma_20'  # For volume filter
-        ]
+        return list(self._required_indicators)
     
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
         Generate trading signals based on RSI + MACD confluence.
         
+        The signal filters run inside the same kernel unless
+        _use_fast_kernel is False (then apply_filters() applies them).
+        
         Args:
             data: DataFrame with OHLCV and indicators
             
         Returns:
             Series with signals: 1 (LONG), -1 (SHORT), 0 (NEUTRAL)
         """
-        self.validate_data(data)
+        cached = self._cached_signals(data)
+        if cached is not None:
+            return cached
         
-        signals = pd.Series(0, index=data.index)
+        self.validate_data(data)
         
-        # Get indicator columns
-        rsi_col = f'rsi_{self.rsi_period}'
-        macd_col = f'macd_{self.macd_fast}_{self.macd_slow}_{self.macd_signal}'
-        macd_signal_col = f'macd_signal_{self.macd_fast}_{self.macd_slow}_{self.macd_signal}'
-        macd_hist_col = f'macd_hist_{self.macd_fast}_{self.macd_slow}_{self.macd_signal}'
+        # Extract indicator columns
+        cols = self._kernel_columns()
+        a = unpack(data, cols)
+        params = np.array(self._kernel_params(), dtype=np.float64)
         
-        rsi = data[rsi_col]
-        macd = data[macd_col]
-        macd_signal = data[macd_signal_col]
-        macd_hist = data[macd_hist_col]
+        # 20-bar average volume; only read when the volume filter is on
+        avg_volume = avg_volume_20(data, a['volume']) if params[3] else a['volume']
         
-        # Calculate MACD crossovers
-        macd_cross_above = (macd > macd_signal) & (macd.shift(1) <= macd_signal.shift(1))
-        macd_cross_below = (macd < macd_signal) & (macd.shift(1) >= macd_signal.shift(1))
+        signals = np.zeros(len(data), dtype=np.int8)
+        _rsi_macd_signals_nb(
+            *[a[col] for col in cols[:5]], avg_volume, *[a[col] for col in cols[5:]],
+            params,
+            signals
+        )
         
-        # LONG conditions: RSI oversold + MACD bullish cross
-        long_conditions = (
-            (rsi < self.rsi_oversold) &
-            macd_cross_above
+        return self._store_signals(data, pd.Series(signals, index=data.index))
+    
+    def _kernel_columns(self) -> List[str]:
+        """
+        Columns in kernel argument order: rsi, macd, macd signal, macd hist,
+        volume, close, trend SMA, ADX (the last two are unused here).
+        """
+        return [
+            self._rsi_col, self._macd_col, self._macd_signal_col, self._macd_hist_col,
+            'volume', 'close', 'close', 'close'
+        ]
+    
+    def _kernel_params(self) -> tuple:
+        """Signal and filter parameters in kernel order (all float64)."""
+        return (
+            float(self.rsi_oversold),
+            float(self.rsi_overbought),
+            float(self.require_macd_histogram_positive),
+            float(self._use_fast_kernel and self.volume_filter),
+            float(self.min_volume_ratio),
+            0.0,
+            0.0,
+            0.0,
         )
+    
+    @classmethod
+    def batch_generate_signals(cls, datas: List[pd.DataFrame], params_grid: List[dict]) -> np.ndarray:
+        """
+        Generate signals for many symbols x parameter sets in parallel.
         
-        if self.require_macd_histogram_positive:
-            long_conditions = long_conditions & (macd_hist > 0)
+        All parameter sets must share the indicator periods (the columns
+        read); they may vary the signal thresholds and filter settings.
         
-        # SHORT conditions: RSI overbought + MACD bearish cross
-        short_conditions = (
-            (rsi > self.rsi_overbought) &
-            macd_cross_below
-        )
+        Args:
+            datas: One DataFrame per symbol, all with the same number of bars
+            params_grid: Constructor keyword arguments, one dict per parameter set
+            
+        Returns:
+            int8 array of shape [n_symbols, n_params, n_bars]
+        """
+        strategies = [cls(**params) for params in params_grid]
+        
+        if len({tuple(s._kernel_columns()) for s in strategies}) != 1:
+            raise ValueError("params_grid must share the indicator periods")
+        if len({len(data) for data in datas}) != 1:
+            raise ValueError("All symbols must have the same number of bars")
+        
+        strategy = strategies[0]
+        for data in datas:
+            strategy.validate_data(data)
+        
+        cols = strategy._kernel_columns()
+        arrays = [unpack(data, cols) for data in datas]
+        stacked = [np.stack([a[col] for a in arrays]) for col in cols]
+        avg_volumes = np.stack([avg_volume_20(data, a['volume']) for data, a in zip(datas, arrays)])
+        params = np.array([s._kernel_params() for s in strategies], dtype=np.float64)
+        
+        out = np.zeros((len(datas), len(strategies), len(datas[0])), dtype=np.int8)
+        _rsi_macd_batch_nb(*stacked[:5], avg_volumes, *stacked[5:], params, out)
+        
+        return out
+    
+    def generate_signals_pl(self, df: "pl.DataFrame") -> "pl.Series":
+        """
+        Polars implementation of generate_signals (lazy expression pipeline).
+        
+        Args:
+            df: Polars DataFrame with OHLCV and indicators
+            
+        Returns:
+            Int8 Series with signals: 1 (LONG), -1 (SHORT), 0 (NEUTRAL)
+        """
+        import polars as pl
+        
+        return df.lazy().select(signal=self._signal_expr_pl(df.columns).cast(pl.Int8)).collect()['signal']
+    
+    def _signal_expr_pl(self, columns: List[str]) -> "pl.Expr":
+        """Polars signal expression, including the fused filters."""
+        import polars as pl
+        
+        c = pl_columns([self._rsi_col, self._macd_col, self._macd_signal_col, self._macd_hist_col, 'volume'])
+        macd, macd_signal = c[self._macd_col], c[self._macd_signal_col]
+        
+        prev_macd, prev_signal = macd.shift(1), macd_signal.shift(1)
+        macd_cross_above = (macd > macd_signal) & (prev_macd <= prev_signal)
+        macd_cross_below = (macd < macd_signal) & (prev_macd >= prev_signal)
+        
+        long_conditions = (c[self._rsi_col] < self.rsi_oversold) & macd_cross_above
+        short_conditions = (c[self._rsi_col] > self.rsi_overbought) & macd_cross_below
         
         if self.require_macd_histogram_positive:
-            short_conditions = short_conditions & (macd_hist < 0)
+            long_conditions = long_conditions & (c[self._macd_hist_col] > 0)
+            short_conditions = short_conditions & (c[self._macd_hist_col] < 0)
         
-        # Set signals
-        signals[long_conditions] = 1
-        signals[short_conditions] = -1
+        signal = (
+            pl.when(short_conditions).then(-1)
+            .when(long_conditions).then(1)
+            .otherwise(0)
+        )
         
-        return signals
+        if self._use_fast_kernel and self.volume_filter:
+            volume_ratio = c['volume'] / avg_volume_20_pl(columns)
+            signal = pl.when(volume_ratio < self.min_volume_ratio).then(0).otherwise(signal)
+        
+        return signal
     
     def apply_filters(self, data: pd.DataFrame, signals: pd.Series) -> pd.Series:
         """
         Apply volume filter if enabled.
         
+        With the fused kernel the filter already ran in generate_signals.
+        Otherwise ``signals`` is filtered in place (no copy) and returned.
+        
         Args:
             data: DataFrame with market data
-            signals: Raw signals
+            signals: Raw signals (modified in place)
             
         Returns:
             Filtered signals
         """
-        if not self.volume_filter:
+        if self._use_fast_kernel or not self.volume_filter:
             return signals
         
-        filtered_signals = signals.copy()
-        
         # Calculate volume ratio vs 20-day average
         if 'volume' in data.columns and 'sma_20' in data.columns:
-            avg_volume = data['volume'].rolling(window=20).mean()
-            volume_ratio = data['volume'] / avg_volume
+            volume = unpack(data, ['volume'])['volume']
+            avg_volume = avg_volume_20(data, volume)
+            volume_ratio = volume / avg_volume
             
             # Only take signals when volume is above threshold
             low_volume_mask = volume_ratio < self.min_volume_ratio
-            filtered_signals[low_volume_mask] = 0
+            signals[low_volume_mask] = 0
         
-        return filtered_signals
+        return signals
 
 
 class RSI_MACD_Enhanced_Strategy(RSI_MACD_Strategy):
@@ -179,6 +377,8 @@ class RSI_MACD_Enhanced_Strategy(RSI_MACD_Strategy):
     - Support/resistance awareness
     """
     
+    __slots__ = ('use_trend_filter', 'trend_sma_period', 'use_adx_filter', 'min_adx', '_trend_sma_col')
+    
     def __init__(
         self,
         use_trend_filter: bool = True,
@@ -203,6 +403,7 @@ class RSI_MACD_Enhanced_Strategy(RSI_MACD_Strategy):
         self.trend_sma_period = trend_sma_period
         self.use_adx_filter = use_adx_filter
         self.min_adx = min_adx
+        self._trend_sma_col = f'sma_{trend_sma_period}'
         
         self.name = f"RSI_MACD_Enhanced_{self.rsi_period}"
         
@@ -218,45 +419,101 @@ class RSI_MACD_Enhanced_Strategy(RSI_MACD_Strategy):
         indicators = super().get_required_indicators()
         
         if self.use_trend_filter:
-            indicators.append(f'sma_{self.trend_sma_period}')
+            indicators.append(self._trend_sma_col)
         
         if self.use_adx_filter:
             indicators.append('adx_14')
         
         return indicators
     
+    def _kernel_columns(self) -> List[str]:
+        """Kernel columns with the trend SMA and ADX slots filled in."""
+        columns = super()._kernel_columns()
+        if self.use_trend_filter:
+            columns[6] = self._trend_sma_col
+        if self.use_adx_filter:
+            columns[7] = 'adx_14'
+        return columns
+    
+    def _kernel_params(self) -> tuple:
+        """Kernel parameters including the trend and ADX filters."""
+        return super()._kernel_params()[:5] + (
+            float(self._use_fast_kernel and self.use_trend_filter),
+            float(self._use_fast_kernel and self.use_adx_filter),
+            float(self.min_adx),
+        )
+    
+    def _signal_expr_pl(self, columns: List[str]) -> "pl.Expr":
+        """Polars signal expression with the trend and ADX filters."""
+        import polars as pl
+        
+        signal = super()._signal_expr_pl(columns)
+        if not self._use_fast_kernel:
+            return signal
+        
+        if self.use_trend_filter:
+            c = pl_columns(['close', self._trend_sma_col])
+            close, trend_sma = c['close'], c[self._trend_sma_col]
+            signal = (
+                pl.when((signal == 1) & (close < trend_sma)).then(0)
+                .when((signal == -1) & (close > trend_sma)).then(0)
+                .otherwise(signal)
+            )
+        
+        if self.use_adx_filter:
+            signal = pl.when(pl_columns(['adx_14'])['adx_14'] < self.min_adx).then(0).otherwise(signal)
+        
+        return signal
+    
     def apply_filters(self, data: pd.DataFrame, signals: pd.Series) -> pd.Series:
         """
         Apply enhanced filters including trend and ADX.
         
+        With the fused kernel the filters already ran in generate_signals.
+        Otherwise all filters zero ``signals`` in place on the same buffer.
+        
         Args:
             data: DataFrame with market data
-            signals: Raw signals
+            signals: Raw signals (modified in place)
             
         Returns:
             Filtered signals
         """
+        if self._use_fast_kernel:
+            return signals
+        
         # First apply parent volume filter
-        filtered_signals = super().apply_filters(data, signals)
+        signals = super().apply_filters(data, signals)
+        values = signals.to_numpy()
+        
+        # Scratch buffers shared by both filters; bars to cancel collect in
+        # ``drop`` and are zeroed with a single write at the end
+        n = len(values)
+        drop = np.zeros(n, dtype=bool)
+        scratch = np.empty(n, dtype=bool)
+        side = np.empty(n, dtype=bool)
         
         # Trend filter: only long above SMA, only short below SMA
         if self.use_trend_filter:
-            trend_sma_col = f'sma_{self.trend_sma_period}'
-            if trend_sma_col in data.columns:
-                # Cancel long signals below trend SMA
-                below_trend = data['close'] < data[trend_sma_col]
-                filtered_signals[below_trend & (filtered_signals == 1)] = 0
+            if self._trend_sma_col in data.columns:
+                a = unpack(data, ['close', self._trend_sma_col])
                 
+                # Cancel long signals below trend SMA
+                np.less(a['close'], a[self._trend_sma_col], out=scratch)
+                np.logical_and(scratch, np.equal(values, 1, out=side), out=drop)
                 # Cancel short signals above trend SMA
-                above_trend = data['close'] > data[trend_sma_col]
-                filtered_signals[above_trend & (filtered_signals == -1)] = 0
+                np.greater(a['close'], a[self._trend_sma_col], out=scratch)
+                np.logical_and(scratch, np.equal(values, -1, out=side), out=scratch)
+                np.logical_or(drop, scratch, out=drop)
         
         # ADX filter: only trade when trend is strong enough
         if self.use_adx_filter and 'adx_14' in data.columns:
-            weak_trend = data['adx_14'] < self.min_adx
-            filtered_signals[weak_trend] = 0
+            np.less(unpack(data, ['adx_14'])['adx_14'], self.min_adx, out=scratch)
+            np.logical_or(drop, scratch, out=drop)
         
-        return filtered_signals
+        signals[drop] = 0
+        
+        return signals
 
 
 # Example usage and parameter sets
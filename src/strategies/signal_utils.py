@@ -0,0 +1,162 @@
+"""
+Array helpers shared by the strategy signal generators
+
+Numba-compiled building blocks that operate on contiguous float64
+NumPy arrays extracted from the indicator DataFrame.
+"""
+
+import numpy as np
+import pandas as pd
+from numba import njit
+from typing import Dict, Sequence
+
+
+def unpack(data: pd.DataFrame, cols: Sequence[str]) -> Dict[str, np.ndarray]:
+    """
+    Extract DataFrame columns as contiguous float64 arrays (SoA layout).
+    
+    Args:
+        data: DataFrame with OHLCV and indicators
+        cols: Column names to extract
+        
+    Returns:
+        Dictionary mapping column name -> float64 ndarray
+    """
+    return {
+        col: np.ascontiguousarray(data[col].to_numpy(), dtype=np.float64)
+        for col in cols
+    }
+
+
+# Precomputed 20-bar average volume (IndicatorCalculator), shared by the
+# strategies' volume filters
+VOLUME_SMA_COL = 'volume_sma_20'
+
+
+def avg_volume_20(data: pd.DataFrame, volume: np.ndarray) -> np.ndarray:
+    """
+    20-bar average volume for the volume filters.
+    
+    Reads the precomputed ``volume_sma_20`` column when the data has it,
+    otherwise falls back to a running-sum SMA of ``volume``.
+    
+    Args:
+        data: DataFrame with OHLCV and indicators
+        volume: float64 volume array extracted from ``data``
+        
+    Returns:
+        float64 array of the same length
+    """
+    if VOLUME_SMA_COL in data.columns:
+        return unpack(data, [VOLUME_SMA_COL])[VOLUME_SMA_COL]
+    return running_sma(volume, 20)
+
+
+def avg_volume_20_pl(columns: Sequence[str]) -> "pl.Expr":
+    """
+    Polars counterpart of avg_volume_20().
+    
+    Args:
+        columns: Column names of the Polars DataFrame
+        
+    Returns:
+        Expression for the 20-bar average volume
+    """
+    if VOLUME_SMA_COL in columns:
+        return pl_columns([VOLUME_SMA_COL])[VOLUME_SMA_COL]
+    return pl_columns(['volume'])['volume'].rolling_mean(20)
+
+
+def pl_columns(cols: Sequence[str]) -> Dict[str, "pl.Expr"]:
+    """
+    Polars counterpart of unpack(): float64 column expressions.
+    
+    NaN is mapped to null so comparisons on warm-up bars are falsy, as
+    they are in pandas (Polars orders NaN above every number).
+    
+    Args:
+        cols: Column names to reference
+        
+    Returns:
+        Dictionary mapping column name -> Polars expression
+    """
+    import polars as pl  # optional dependency, only needed for the Polars path
+    
+    return {
+        col: pl.col(col).cast(pl.Float64).fill_nan(None)
+        for col in cols
+    }
+
+
+@njit(cache=True, nogil=True)
+def running_sma(arr: np.ndarray, window: int) -> np.ndarray:
+    """
+    Simple moving average via a running sum (O(N) regardless of window).
+    
+    Matches pandas ``rolling(window).mean()``: NaN until ``window`` values
+    are available and NaN for any window containing a NaN.
+    
+    Args:
+        arr: float64 input array
+        window: Averaging window
+    
+    Returns:
+        float64 array of the same length
+    """
+    n = arr.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    nan_count = 0
+    
+    for i in range(n):
+        x = arr[i]
+        if np.isnan(x):
+            nan_count += 1
+        else:
+            total += x
+        
+        if i >= window:
+            old = arr[i - window]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                total -= old
+        
+        if i >= window - 1 and nan_count == 0:
+            out[i] = total / window
+    
+    return out
+
+
+@njit(cache=True)
+def window_min_mask(arr: np.ndarray, window: int) -> np.ndarray:
+    """
+    Flag bars whose value is the minimum of the trailing ``window`` bars.
+    
+    Equivalent to ``arr == pandas.Series(arr).rolling(window).min()``
+    (False until ``window`` values are available and for any window
+    containing a NaN), but answered with ``window - 1`` strided
+    comparisons AND-ed into the result. The inner loops are branch-free
+    and auto-vectorize, which beats a monotonic-deque rolling minimum
+    for short windows such as the 20-bar squeeze check.
+    
+    Args:
+        arr: float64 input array
+        window: Window length (>= 2)
+    
+    Returns:
+        bool array of the same length
+    """
+    n = arr.shape[0]
+    out = np.ones(n, dtype=np.uint8)
+    out[:window - 1] = 0
+    
+    for k in range(1, window):
+        # arr[i] <= arr[i - k]; NaN on either side compares False
+        cur = arr[k:]
+        prev = arr[:n - k]
+        res = out[k:]
+        for i in range(n - k):
+            res[i] &= np.uint8(cur[i] <= prev[i])
+    
+    return out.view(np.bool_)
@@ -10,9 +10,44 @@ sys.path.insert(0, str(project_root))
 
 import pandas as pd
 import numpy as np
-from loguru import logger
+from numba import njit
 from typing import Dict, Optional
 
+from src.strategies.signal_utils import running_sma, unpack, pl_columns
+
+
+@njit
+def _sma_signals_nb(fast, slow):
+    """
+    Crossover state, position change and entry/exit flags in one pass
+    
+    Returns:
+        (signal, position, entry, exit); position is float64 with NaN on
+        the first bar (like Series.diff), the rest are int8
+    """
+    n = fast.shape[0]
+    signal = np.zeros(n, dtype=np.int8)
+    position = np.full(n, np.nan)
+    entry = np.zeros(n, dtype=np.int8)
+    exit_ = np.zeros(n, dtype=np.int8)
+    
+    prev_signal = 0
+    for i in range(n):
+        # 1 when fast > slow (bullish), -1 when fast < slow (bearish), 0 = no position
+        if fast[i] > slow[i]:
+            signal[i] = 1
+        elif fast[i] < slow[i]:
+            signal[i] = -1
+        
+        if i > 0:
+            change = signal[i] - prev_signal
+            position[i] = change
+            entry[i] = change > 0
+            exit_[i] = change < 0
+        prev_signal = signal[i]
+    
+    return signal, position, entry, exit_
+
 
 class SMACrossoverStrategy:
     """
@@ -39,6 +74,7 @@ class SMACrossoverStrategy:
         self.slow_period = slow_period
         self.name = f"SMA_Crossover_{fast_period}_{slow_period}"
         
+        from loguru import logger  # imported lazily to keep module import light
         logger.info(f"Initialized {self.name}")
     
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -51,40 +87,77 @@ class SMACrossoverStrategy:
         Returns:
             DataFrame with signals added
         """
-        df = df.copy()
+        fast_col = f'sma_{self.fast_period}'
+        slow_col = f'sma_{self.slow_period}'
         
         # Get or calculate SMAs
-        if f'sma_{self.fast_period}' not in df.columns:
-            df[f'sma_{self.fast_period}'] = df['close'].rolling(window=self.fast_period).mean()
+        new_cols = {}
+        close = unpack(df, ['close'])['close']
+        if fast_col not in df.columns:
+            new_cols[fast_col] = running_sma(close, self.fast_period)
         
-        if f'sma_{self.slow_period}' not in df.columns:
-            df[f'sma_{self.slow_period}'] = df['close'].rolling(window=self.slow_period).mean()
+        if slow_col not in df.columns:
+            new_cols[slow_col] = running_sma(close, self.slow_period)
         
-        fast_sma = df[f'sma_{self.fast_period}']
-        slow_sma = df[f'sma_{self.slow_period}']
+        sma = {**unpack(df, [col for col in (fast_col, slow_col) if col not in new_cols]), **new_cols}
         
-        # Initialize signal column
-        df['signal'] = 0  # 0 = no position, 1 = long, -1 = short
+        # Crossover signals, position changes and entry/exit points
+        # Entry: signal changes from 0 or -1 to 1 (buy signal)
+        # Exit: signal changes from 1 to 0 or -1 (sell signal)
+        signal, position, entry, exit_ = _sma_signals_nb(sma[fast_col], sma[slow_col])
         
-        # Generate crossover signals
-        # 1 when fast > slow (bullish), -1 when fast < slow (bearish)
-        df.loc[fast_sma > slow_sma, 'signal'] = 1
-        df.loc[fast_sma < slow_sma, 'signal'] = -1
+        new_cols.update(signal=signal, position=position, entry=entry, exit=exit_)
         
-        # Generate position changes (entries and exits)
-        df['position'] = df['signal'].diff()
+        # Shallow copy: the result shares the input's column data and only
+        # the new columns are allocated (df.assign deep-copies without
+        # copy-on-write); the input frame is left unchanged
+        out = df.copy(deep=False)
+        for col, values in new_cols.items():
+            out[col] = values
+        return out
+    
+    def generate_signals_pl(self, df: "pl.DataFrame") -> "pl.DataFrame":
+        """
+        Polars implementation of generate_signals (lazy expression pipeline)
         
-        # Mark entry and exit points
-        df['entry'] = 0
-        df['exit'] = 0
+        Args:
+            df: Polars DataFrame with OHLCV data and indicators
         
-        # Entry: signal changes from 0 or -1 to 1 (buy signal)
-        df.loc[df['position'] > 0, 'entry'] = 1
+        Returns:
+            DataFrame with signals added
+        """
+        import polars as pl
         
-        # Exit: signal changes from 1 to 0 or -1 (sell signal)
-        df.loc[df['position'] < 0, 'exit'] = 1
+        fast_col = f'sma_{self.fast_period}'
+        slow_col = f'sma_{self.slow_period}'
         
-        return df
+        # Get or calculate SMAs
+        sma_exprs = [
+            pl.col('close').cast(pl.Float64).fill_nan(None).rolling_mean(period).alias(col)
+            for col, period in ((fast_col, self.fast_period), (slow_col, self.slow_period))
+            if col not in df.columns
+        ]
+        
+        c = pl_columns([fast_col, slow_col])
+        signal = (
+            pl.when(c[fast_col] > c[slow_col]).then(1)
+            .when(c[fast_col] < c[slow_col]).then(-1)
+            .otherwise(0)
+            .cast(pl.Int8)
+        )
+        position = pl.col('signal').diff()
+        
+        return (
+            df.lazy()
+            .with_columns(sma_exprs)
+            .with_columns(signal=signal)
+            .with_columns(position=position)
+            .with_columns(
+                entry=(pl.col('position') > 0).fill_null(False).cast(pl.Int8),
+                exit=(pl.col('position') < 0).fill_null(False).cast(pl.Int8),
+            )
+            .collect()
+        )
     
     def get_parameters(self) -> Dict:
         """Get strategy parameters"""
@@ -117,7 +190,7 @@ if __name__ == '__main__':
     
     if df is not None and len(df) > 0:
         # Create strategy
-        strategy = SMArossoverStrategy(fast_period=20, slow_period=50)
+        strategy = SMACrossoverStrategy(fast_period=20, slow_period=50)
         
         # Generate signals
         df = strategy.generate_signals(df)
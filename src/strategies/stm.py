@@ -1,14 +1,164 @@
 """
 STM (Short-Term Mean Reversion) Strategy for AlphaFactory OS
-CORRECTED VERSION - Uses your actual indicator column names
-
 Phase 1: Primary Profit Generator
+
+Strategy Type: Mean Reversion
+Timeframe: 1-5 day holds
+Target: >60% win rate, >2.0 profit factor
+
+Entry Rules:
+1. Price < Lower Bollinger Band (20, 2)
+2. RSI(14) < 30 (oversold)
+3. Volume > 1.5x average (capitulation)
+4. Not within 5 days of earnings
+5. Quality filters (price $10-500, volume >500K, mcap >$1B)
+
+Exit Rules:
+1. Price hits middle Bollinger Band (primary exit)
+2. RSI > 50 (momentum reversal)
+3. 5% stop-loss (risk management)
+4. 5-day maximum hold (force exit)
+5. 2% trailing stop (lock profits)
+
+Indicator columns are the IndicatorCalculator names ('bb_lower', 'rsi_14',
+...) by default; use_legacy_columns=True switches to the parameterized
+scheme ('bb_lower_20_2.0', 'rsi_14', 'atr_14', 'sma_20') of the original
+implementation, still importable from stm_old.
 """
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import numpy as np
+from numba import njit, prange
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
+from src.strategies.signal_utils import running_sma
+from src.backtest.portfolio_engine import PortfolioBacktestEngine
+
+
+@njit(nogil=True)
+def _stm_entry_kernel(
+    close, bb_lower, rsi, volume, avg_volume,
+    bb_factor, rsi_oversold, volume_surge_ratio, min_price, max_price, min_avg_volume, out
+):
+    """
+    Fused STM entry kernel (one pass over the bars).
+    
+    Mirrors the conditions of STM_MeanReversion.generate_entry_signals;
+    NaN inputs compare False exactly as in the scalar checks.
+    ``bb_factor`` is ``1 - price_below_bb_threshold``.
+    
+    Writes 1 (BUY) or 0 into ``out`` (int8, one slot per bar).
+    Releases the GIL, so scan_param_grid can run it from worker threads.
+    """
+    for i in range(out.shape[0]):
+        # Quality filters as one mask (a NaN close or average volume fails
+        # here, where the scalar checks fail it in the conditions below)
+        quality = (close[i] >= min_price) & (close[i] <= max_price) & (avg_volume[i] >= min_avg_volume)
+        
+        # Conditions are AND-ed bitwise, without branches, so the loop vectorizes
+        out[i] = (
+            quality &
+            (close[i] < bb_lower[i] * bb_factor) &           # 1. Price below lower BB
+            (rsi[i] < rsi_oversold) &                       # 2. RSI oversold
+            (volume[i] > avg_volume[i] * volume_surge_ratio)  # 3. Volume spike
+        )
+
+
+@njit(parallel=True)
+def _stm_entry_batch_nb(
+    closes, bb_lowers, rsis, volumes, avg_volumes,
+    bb_factor, rsi_oversold, volume_surge_ratio, min_price, max_price, min_avg_volume, out
+):
+    """
+    Run the entry kernel for every symbol.
+    
+    Inputs and ``out`` (zeroed int8) are [n_symbols, n_bars] arrays.
+    Symbols are independent, so they are spread across cores with prange.
+    """
+    for s in prange(closes.shape[0]):
+        _stm_entry_kernel(
+            closes[s], bb_lowers[s], rsis[s], volumes[s], avg_volumes[s],
+            bb_factor, rsi_oversold, volume_surge_ratio, min_price, max_price, min_avg_volume,
+            out[s]
+        )
+
+
+@njit
+def _stm_exit_kernel(
+    low, high, close, bb_middle, rsi, date_ns, start, entry_ns, entry_price,
+    stop_loss_pct, max_hold_days, exit_at_bb_middle, exit_at_rsi, rsi_exit_threshold,
+    use_trailing_stop, trailing_stop_pct
+):
+    """
+    Walk a trade forward from bar ``start`` until an exit rule fires.
+    
+    Mirrors calling STM_MeanReversion.generate_exit_signals on every bar
+    for a symbol with no trailing stop yet: the stop tested on a bar is
+    the one set by the bars before it. ``date_ns``/``entry_ns`` are
+    datetime64[ns] values as int64.
+    
+    Returns:
+        (bar position, reason code) with codes 1 (stop loss), 2 (max hold),
+        3 (BB middle), 4 (RSI); (-1, 0) if no rule fires
+    """
+    ns_per_day = 86_400_000_000_000
+    stop_price = entry_price * (1 - stop_loss_pct)
+    has_trailing = False
+    highest = np.nan
+    
+    for i in range(start, low.shape[0]):
+        if low[i] <= stop_price:
+            return i, 1
+        if (date_ns[i] - entry_ns) // ns_per_day >= max_hold_days:
+            return i, 2
+        if exit_at_bb_middle and close[i] >= bb_middle[i]:
+            return i, 3
+        if exit_at_rsi and rsi[i] > rsi_exit_threshold:
+            return i, 4
+        
+        if use_trailing_stop:
+            # Highest high since entry, skipping NaN like Series.max
+            if np.isnan(highest) or high[i] > highest:
+                highest = high[i]
+            new_trailing_stop = highest * (1 - trailing_stop_pct)
+            if not has_trailing or new_trailing_stop > stop_price:
+                stop_price = new_trailing_stop
+                has_trailing = True
+    
+    return -1, 0
+
+
+@njit('int64(float64, float64, float64, boolean, float64, float64, float64)')
+def _position_size(capital, entry_price, atr, use_atr, risk_pct, max_pos_pct, atr_mult):
+    """
+    Share count for STM_MeanReversion.calculate_position_size.
+    
+    Compiled for a fixed signature so Monte Carlo / grid sweeps can call it
+    directly (or from other kernels) without the method's attribute lookups.
+    ``use_atr`` selects ATR-based sizing; ``atr`` is ignored otherwise.
+    """
+    # Shares allowed by the max position percentage (also the fixed-size result)
+    max_shares = capital * max_pos_pct / entry_price
+    
+    if use_atr:
+        # ATR-based position sizing
+        shares = (capital * risk_pct) / (atr * atr_mult)
+    else:
+        # Fixed percentage position sizing
+        shares = max_shares
+    
+    # Ensure position doesn't exceed max percentage (truncating once after
+    # the min equals truncating both, int() is monotonic)
+    return max(int(min(shares, max_shares)), 0)
 
 
 class STM_MeanReversion:
@@ -19,6 +169,37 @@ class STM_MeanReversion:
     Trades oversold bounces back to mean.
     """
     
+    # Fixed attribute layout: parameter sweeps create many instances
+    __slots__ = (
+        'name',
+        # Indicator columns
+        'use_legacy_columns', 'bb_period', 'bb_std_dev', 'rsi_period', 'atr_period',
+        '_bb_middle_col', '_bb_lower_col', '_rsi_col', '_required_indicators',
+        # Entry
+        'rsi_oversold', 'rsi_exit_threshold', 'volume_surge_ratio', 'volume_lookback',
+        'price_below_bb_threshold',
+        # Quality
+        'min_price', 'max_price', 'min_avg_volume', 'min_market_cap',
+        # Earnings
+        'avoid_earnings', 'days_before_earnings', 'days_after_earnings',
+        # Exit
+        'exit_at_bb_middle', 'exit_at_rsi_threshold', 'max_hold_days',
+        # Risk
+        'stop_loss_pct', 'trailing_stop_pct', 'use_trailing_stop',
+        # Position sizing
+        'risk_per_trade_pct', 'max_position_pct', 'use_atr_sizing', 'atr_multiplier',
+        # Portfolio
+        'max_concurrent_positions', 'equal_weighting',
+        # State tracking
+        'open_positions', 'closed_trades', 'trailing_stops', '_trailing_highs',
+        '_exit_data_ref', '_exit_arrays',
+    )
+    
+    # Earnings-avoidance masks shared by all instances (LRU, see near_earnings_mask)
+    _earnings_mask_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+    _earnings_mask_cache_size = 64
+    _earnings_mask_lock = threading.Lock()
+    
     def __init__(
         self,
         # Entry parameters
@@ -57,9 +238,45 @@ class STM_MeanReversion:
         
         # Portfolio
         max_concurrent_positions: int = 10,
+        equal_weighting: bool = False,
+        
+        # Indicator columns
+        use_legacy_columns: bool = False,
+        bb_period: int = 20,  # legacy column scheme only
+        bb_std_dev: float = 2.0,  # legacy column scheme only
+        rsi_period: int = 14,  # legacy column scheme only
+        atr_period: int = 14,  # legacy column scheme only
+        
+        # Strategy name
+        name: str = "STM_MeanReversion",
     ):
         """Initialize STM Mean Reversion strategy."""
-        self.name = "STM_MeanReversion"
+        self.name = name
+        
+        # Indicator columns
+        self.use_legacy_columns = use_legacy_columns
+        self.bb_period = bb_period
+        self.bb_std_dev = bb_std_dev
+        self.rsi_period = rsi_period
+        self.atr_period = atr_period
+        
+        if use_legacy_columns:
+            self._bb_middle_col = f'bb_middle_{bb_period}_{bb_std_dev}'
+            self._bb_lower_col = f'bb_lower_{bb_period}_{bb_std_dev}'
+            self._rsi_col = f'rsi_{rsi_period}'
+            self._required_indicators = (
+                f'bb_upper_{bb_period}_{bb_std_dev}',
+                self._bb_middle_col,
+                self._bb_lower_col,
+                self._rsi_col,
+                f'atr_{atr_period}',
+                f'sma_{volume_lookback}'  # For volume average
+            )
+        else:
+            self._bb_middle_col = 'bb_middle'
+            self._bb_lower_col = 'bb_lower'
+            self._rsi_col = 'rsi_14'
+            self._required_indicators = ('bb_upper', 'bb_middle', 'bb_lower', 'rsi_14', 'atr_14')
         
         # Entry
         self.rsi_oversold = rsi_oversold
@@ -97,21 +314,24 @@ class STM_MeanReversion:
         
         # Portfolio
         self.max_concurrent_positions = max_concurrent_positions
+        self.equal_weighting = equal_weighting
         
         # State tracking
         self.open_positions = {}
         self.closed_trades = []
         self.trailing_stops = {}
+        # symbol -> (entry_date, date of the last update, highest high since entry)
+        self._trailing_highs = {}
+        
+        # Index, position map and column arrays of the last data passed to
+        # generate_exit_signals (weakref, rebuilt when a new frame arrives
+        # or the frame's index changes, e.g. a bar appended in place)
+        self._exit_data_ref = None
+        self._exit_arrays = None
     
     def get_required_indicators(self) -> List[str]:
-        """Return list of required indicators (using your actual column names)."""
-        return [
-            'bb_upper',
-            'bb_middle',
-            'bb_lower',
-            'rsi_14',
-            'atr_14',
-        ]
+        """Return list of required indicators (column scheme set by use_legacy_columns)."""
+        return list(self._required_indicators)
     
     def passes_quality_filters(
         self,
@@ -155,6 +375,100 @@ class STM_MeanReversion:
         
         return False
     
+    def near_earnings_mask(
+        self,
+        index: pd.Index,
+        earnings_dates: Dict[datetime, datetime]
+    ) -> np.ndarray:
+        """
+        Vectorized is_near_earnings() over a whole date index.
+        
+        Args:
+            index: Dates to check (the data index)
+            earnings_dates: Dict mapping dates to next earnings date
+            
+        Returns:
+            Boolean array (read-only), True where the date is too close to earnings
+        """
+        # Masks are cached per (calendar contents, index, window) so repeated
+        # calls and parameter sweeps sharing an earnings calendar build them
+        # once; an edited or extended calendar is a different key. The entry
+        # keeps the index alive, so its id cannot be reused while cached.
+        key = (
+            tuple(earnings_dates.items()), id(index),
+            self.avoid_earnings, self.days_before_earnings, self.days_after_earnings
+        )
+        cache = self._earnings_mask_cache
+        with self._earnings_mask_lock:
+            entry = cache.get(key)
+            if entry is not None and entry[0] is index:
+                cache.move_to_end(key)
+                return entry[1]
+        
+        mask = self._build_near_earnings_mask(index, earnings_dates)
+        mask.flags.writeable = False
+        
+        with self._earnings_mask_lock:
+            cache[key] = (index, mask)
+            cache.move_to_end(key)
+            while len(cache) > self._earnings_mask_cache_size:
+                cache.popitem(last=False)
+        
+        return mask
+    
+    def _build_near_earnings_mask(
+        self,
+        index: pd.Index,
+        earnings_dates: Dict[datetime, datetime]
+    ) -> np.ndarray:
+        """Uncached body of near_earnings_mask()."""
+        mask = np.zeros(len(index), dtype=bool)
+        pairs = [(date, earnings) for date, earnings in earnings_dates.items() if earnings is not None]
+        if not self.avoid_earnings or not pairs:
+            return mask
+        
+        dates, earnings = zip(*pairs)
+        dates = pd.DatetimeIndex(dates)
+        days_until_earnings = (pd.DatetimeIndex(earnings) - dates).days.to_numpy()
+        
+        # Too close before or after earnings
+        near = (
+            ((days_until_earnings >= 0) & (days_until_earnings <= self.days_before_earnings)) |
+            ((days_until_earnings < 0) & (days_until_earnings >= -self.days_after_earnings))
+        )
+        
+        # Positions of the flagged dates in the index (-1 if absent)
+        positions = index.get_indexer(dates[near])
+        mask[positions[positions >= 0]] = True
+        return mask
+    
+    def _entry_arrays(self, data: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+        """Float arrays read by the entry kernel: close, bb_lower, rsi, volume, avg volume."""
+        close, bb_lower, rsi, volume = (
+            np.ascontiguousarray(data[col].to_numpy(), dtype=np.float64)
+            for col in ('close', self._bb_lower_col, self._rsi_col, 'volume')
+        )
+        # Running-sum SMA (same NaN semantics as rolling().mean())
+        avg_volume = running_sma(volume, self.volume_lookback)
+        return close, bb_lower, rsi, volume, avg_volume
+    
+    def _entry_params(self) -> Tuple[float, ...]:
+        """Scalar thresholds passed to the entry kernel."""
+        return (
+            float(1 - self.price_below_bb_threshold),
+            float(self.rsi_oversold),
+            float(self.volume_surge_ratio),
+            float(self.min_price),
+            float(self.max_price),
+            float(self.min_avg_volume),
+        )
+    
+    def _entry_signal_array(self, data: pd.DataFrame) -> np.ndarray:
+        """Entry conditions except earnings, in one compiled pass (int8 array)."""
+        signals = np.zeros(len(data), dtype=np.int8)
+        _stm_entry_kernel(*self._entry_arrays(data), *self._entry_params(), signals)
+        return signals
+    
     def generate_entry_signals(
         self,
         data: pd.DataFrame,
@@ -170,42 +484,83 @@ class STM_MeanReversion:
         Returns:
             Series with 1 for BUY signal, 0 for no signal
         """
-        signals = pd.Series(0, index=data.index)
+        signals = self._entry_signal_array(data)
         
-        # Calculate average volume
-        avg_volume = data['volume'].rolling(window=self.volume_lookback).mean()
+        # Earnings check
+        if earnings_dates:
+            signals[self.near_earnings_mask(data.index, earnings_dates)] = 0
         
-        # Entry conditions
-        for idx in data.index:
-            row = data.loc[idx]
-            
-            # Quality filters
-            if not self.passes_quality_filters(
-                price=row['close'],
-                avg_volume=avg_volume.loc[idx] if idx in avg_volume.index else 0
-            ):
-                continue
-            
-            # Earnings check
-            if earnings_dates and idx in earnings_dates:
-                if self.is_near_earnings(idx, earnings_dates[idx]):
-                    continue
-            
-            # 1. Price below lower Bollinger Band
-            price_below_bb = row['close'] < (row['bb_lower'] * (1 - self.price_below_bb_threshold))
-            
-            # 2. RSI oversold
-            rsi_oversold = row['rsi_14'] < self.rsi_oversold
-            
-            # 3. Volume spike
-            volume_spike = row['volume'] > (avg_volume.loc[idx] * self.volume_surge_ratio)
+        return pd.Series(signals, index=data.index)
+    
+    def generate_entry_signals_batch(
+        self,
+        datas: Dict[str, pd.DataFrame],
+        earnings_dates: Optional[Dict[str, Dict[datetime, datetime]]] = None,
+        dtype: type = np.float64
+    ) -> Dict[str, pd.Series]:
+        """
+        Generate entry signals for many symbols in parallel.
+        
+        Args:
+            datas: Dict mapping symbol to its DataFrame, all with the same number of bars
+            earnings_dates: Dict mapping symbol to its earnings dates dict
+                (see generate_entry_signals)
+            dtype: Kernel input precision. ``np.float32`` halves the memory
+                traffic of large universe scans; bars within float32 rounding
+                of a threshold may then flip, so the default stays float64
             
-            # All conditions must be met
-            if price_below_bb and rsi_oversold and volume_spike:
-                signals.loc[idx] = 1
+        Returns:
+            Dict mapping symbol to its entry signal Series
+        """
+        if not datas:
+            return {}
+        if len({len(data) for data in datas.values()}) != 1:
+            raise ValueError("All symbols must have the same number of bars")
+        
+        symbols = list(datas)
+        arrays = [self._entry_arrays(datas[symbol]) for symbol in symbols]
+        # Average volume is summed in float64 before the cast
+        stacked = [np.stack(cols, dtype=dtype) for cols in zip(*arrays)]
+        
+        out = np.zeros((len(symbols), len(datas[symbols[0]])), dtype=np.int8)
+        _stm_entry_batch_nb(*stacked, *self._entry_params(), out)
+        
+        signals = {}
+        for symbol, row in zip(symbols, out):
+            symbol_earnings = (earnings_dates or {}).get(symbol)
+            if symbol_earnings:
+                row[self.near_earnings_mask(datas[symbol].index, symbol_earnings)] = 0
+            signals[symbol] = pd.Series(row, index=datas[symbol].index)
         
         return signals
     
+    def _exit_view(self, data: pd.DataFrame) -> Tuple[Dict, Dict[str, np.ndarray]]:
+        """
+        Date -> position map, float column arrays and int64 bar dates for
+        the exit checks.
+        
+        Built once per DataFrame and reused while the frame keeps the same
+        index (same object, length and last date); bars appended in place
+        replace the index, so the view is rebuilt.
+        """
+        index = data.index
+        cached = self._exit_arrays
+        if (
+            self._exit_data_ref is None or self._exit_data_ref() is not data
+            or cached[0] is not index or cached[1] != len(index)
+            or (len(index) and cached[2] != index[-1])
+        ):
+            positions = {date: i for i, date in enumerate(index)}
+            columns = {
+                'high': 'high', 'low': 'low', 'close': 'close',
+                'bb_middle': self._bb_middle_col, 'rsi': self._rsi_col,
+            }
+            bars = {key: data[col].to_numpy(dtype=np.float64) for key, col in columns.items()}
+            bars['date_ns'] = index.to_numpy(dtype='datetime64[ns]').view(np.int64)
+            self._exit_data_ref = weakref.ref(data)
+            self._exit_arrays = (index, len(index), index[-1] if len(index) else None, positions, bars)
+        return self._exit_arrays[3:]
+    
     def generate_exit_signals(
         self,
         data: pd.DataFrame,
@@ -220,17 +575,17 @@ class STM_MeanReversion:
         Returns:
             Tuple of (should_exit, exit_reason)
         """
-        if current_date not in data.index:
+        positions, bars = self._exit_view(data)
+        i = positions.get(current_date)
+        if i is None:
             return False, ""
         
-        row = data.loc[current_date]
-        
         # 1. Stop-loss check
         stop_price = entry_price * (1 - self.stop_loss_pct)
         if symbol in self.trailing_stops:
             stop_price = self.trailing_stops[symbol]
         
-        if row['low'] <= stop_price:
+        if bars['low'][i] <= stop_price:
             return True, "Stop Loss"
         
         # 2. Maximum hold period
@@ -240,23 +595,82 @@ class STM_MeanReversion:
         
         # 3. Price at BB middle (take profit)
         if self.exit_at_bb_middle:
-            if row['close'] >= row['bb_middle']:
+            if bars['close'][i] >= bars['bb_middle'][i]:
                 return True, "BB Middle (Take Profit)"
         
         # 4. RSI exit threshold
         if self.exit_at_rsi_threshold:
-            if row['rsi_14'] > self.rsi_exit_threshold:
+            if bars['rsi'][i] > self.rsi_exit_threshold:
                 return True, f"RSI > {self.rsi_exit_threshold}"
         
         # 5. Update trailing stop
         if self.use_trailing_stop:
-            highest_since_entry = data.loc[entry_date:current_date, 'high'].max()
+            # Running high kept by date: only bars after the previous update
+            # are scanned, so a different or sliding frame is handled too
+            state = self._trailing_highs.get(symbol)
+            if state is not None and state[0] == entry_date and state[1] <= current_date:
+                last = positions.get(state[1])
+                start = last + 1 if last is not None else data.index.searchsorted(state[1], side='right')
+                highest_since_entry = state[2]
+            else:
+                start, highest_since_entry = data.index.searchsorted(entry_date), np.nan
+            highest_since_entry = np.fmax.reduce(bars['high'][start:i + 1], initial=highest_since_entry)
+            self._trailing_highs[symbol] = (entry_date, current_date, highest_since_entry)
+            
             new_trailing_stop = highest_since_entry * (1 - self.trailing_stop_pct)
             if symbol not in self.trailing_stops or new_trailing_stop > self.trailing_stops[symbol]:
                 self.trailing_stops[symbol] = new_trailing_stop
         
         return False, ""
     
+    def find_exit(
+        self,
+        data: pd.DataFrame,
+        entry_date: datetime,
+        entry_price: float
+    ) -> Tuple[Optional[datetime], str]:
+        """
+        Find the exit of a trade in one compiled pass over the bars.
+        
+        Equivalent to calling generate_exit_signals on every bar from
+        entry_date on for a symbol without an existing trailing stop, but
+        without per-bar Python calls. Does not touch ``trailing_stops``.
+        
+        Args:
+            data: DataFrame with OHLCV and indicators
+            entry_date: Date position was entered
+            entry_price: Entry price
+            
+        Returns:
+            Tuple of (exit_date, exit_reason); (None, "") if no exit rule
+            fires before the data ends
+        """
+        _, bars = self._exit_view(data)
+        i, code = _stm_exit_kernel(
+            bars['low'], bars['high'], bars['close'], bars['bb_middle'], bars['rsi'],
+            bars['date_ns'],
+            data.index.searchsorted(entry_date),
+            pd.Timestamp(entry_date).value,
+            float(entry_price),
+            float(self.stop_loss_pct),
+            int(self.max_hold_days),
+            bool(self.exit_at_bb_middle),
+            bool(self.exit_at_rsi_threshold),
+            float(self.rsi_exit_threshold),
+            bool(self.use_trailing_stop),
+            float(self.trailing_stop_pct),
+        )
+        if i < 0:
+            return None, ""
+        
+        reasons = {
+            1: "Stop Loss",
+            2: f"Max Hold ({self.max_hold_days} days)",
+            3: "BB Middle (Take Profit)",
+            4: f"RSI > {self.rsi_exit_threshold}",
+        }
+        return data.index[i], reasons[code]
+    
     def calculate_position_size(
         self,
         capital: float,
@@ -274,25 +688,15 @@ class STM_MeanReversion:
         Returns:
             Number of shares to buy
         """
-        if self.use_atr_sizing and atr is not None and atr > 0:
-            # ATR-based position sizing
-            risk_amount = capital * self.risk_per_trade_pct
-            stop_distance = atr * self.atr_multiplier
-            shares = int(risk_amount / stop_distance)
-        else:
-            # Fixed percentage position sizing
-            position_value = capital * self.max_position_pct
-            shares = int(position_value / entry_price)
-        
-        # Ensure position doesn't exceed max percentage
-        max_shares = int((capital * self.max_position_pct) / entry_price)
-        shares = min(shares, max_shares)
-        
-        return max(shares, 0)
+        use_atr = self.use_atr_sizing and atr is not None and atr > 0
+        return _position_size(
+            capital, entry_price, atr if use_atr else 0.0, use_atr,
+            self.risk_per_trade_pct, self.max_position_pct, self.atr_multiplier
+        )
     
     def get_parameters(self) -> Dict:
         """Get strategy parameters for logging."""
-        return {
+        params = {
             'name': self.name,
             'rsi_oversold': self.rsi_oversold,
             'rsi_exit_threshold': self.rsi_exit_threshold,
@@ -306,6 +710,13 @@ class STM_MeanReversion:
             'max_price': self.max_price,
             'min_avg_volume': self.min_avg_volume,
         }
+        if self.use_legacy_columns:
+            params.update({
+                'bb_period': self.bb_period,
+                'bb_std_dev': self.bb_std_dev,
+                'rsi_period': self.rsi_period,
+            })
+        return params
     
     def __repr__(self) -> str:
         return f"<STM_MeanReversion: {self.name}>"
@@ -345,3 +756,133 @@ def get_scalping_stm_params() -> Dict:
         'max_hold_days': 2,  # Very short holds
         'risk_per_trade_pct': 0.01,  # Small risk
     }
+
+
+def scan_param_grid(
+    configs: List[Dict],
+    data: pd.DataFrame,
+    earnings_dates: Optional[Dict[datetime, datetime]] = None,
+    max_workers: Optional[int] = None
+) -> List[pd.Series]:
+    """
+    Generate STM entry signals for many parameter sets on the same data.
+    
+    The configurations are independent, so they run on a thread pool: the
+    compiled kernels release the GIL and every thread reads the same
+    ``data`` without copying it.
+    
+    Args:
+        configs: STM_MeanReversion keyword arguments, one dict per run
+            (e.g. the get_*_stm_params presets)
+        data: DataFrame with OHLCV and indicators
+        earnings_dates: Dict mapping dates to next earnings date
+        max_workers: Thread count (default: ThreadPoolExecutor's default)
+        
+    Returns:
+        Entry signal Series, one per config, in order
+    """
+    strategies = [STM_MeanReversion(**config) for config in configs]
+    return [
+        pd.Series(values, index=data.index)
+        for values in _entry_signal_arrays(strategies, data, earnings_dates, max_workers)
+    ]
+
+
+def _entry_signal_arrays(
+    strategies: List[STM_MeanReversion],
+    data: pd.DataFrame,
+    earnings_dates: Optional[Dict[datetime, datetime]],
+    max_workers: Optional[int]
+) -> List[np.ndarray]:
+    """Entry signal arrays of several strategies, computed on a thread pool."""
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        arrays = list(pool.map(lambda strategy: strategy._entry_signal_array(data), strategies))
+    
+    # Earnings masks go through the shared mask cache, so apply them here
+    if earnings_dates:
+        for strategy, values in zip(strategies, arrays):
+            values[strategy.near_earnings_mask(data.index, earnings_dates)] = 0
+    
+    return arrays
+
+
+def _backtest_signals(
+    strategy: STM_MeanReversion,
+    data: pd.DataFrame,
+    signals: np.ndarray,
+    symbol: str,
+    initial_capital: float
+) -> Dict:
+    """
+    Trade one symbol's entry signals through PortfolioBacktestEngine.
+    
+    One position at a time: an entry opens at the bar's close, sized by
+    calculate_position_size, and is closed at the close of the bar
+    find_exit returns (or of the last bar if no exit rule fires).
+    
+    Returns:
+        get_performance_metrics() of the run, plus the strategy parameters
+    """
+    engine = PortfolioBacktestEngine(initial_capital=initial_capital, max_positions=1)
+    close = data['close'].to_numpy(dtype=np.float64)
+    atr_col = f'atr_{strategy.atr_period}' if strategy.use_legacy_columns else 'atr_14'
+    atr = data[atr_col].to_numpy(dtype=np.float64) if atr_col in data.columns else None
+    last = len(data) - 1
+    exit_i, exit_reason = -1, ""
+    
+    for i, date in enumerate(data.index):
+        if signals[i] == 1 and symbol not in engine.positions:
+            shares = strategy.calculate_position_size(
+                engine.get_available_capital(), close[i], atr[i] if atr is not None else None
+            )
+            if shares > 0 and engine.open_position(
+                symbol, date, close[i], shares, close[i] * (1 - strategy.stop_loss_pct)
+            ):
+                exit_date, exit_reason = strategy.find_exit(data, date, close[i])
+                exit_i = data.index.get_loc(exit_date) if exit_date is not None else -1
+        
+        if symbol in engine.positions and (i == exit_i or i == last):
+            engine.close_position(symbol, date, close[i], exit_reason if i == exit_i else "End of Backtest")
+        
+        engine.update_equity(date, {symbol: close[i]})
+    
+    results = engine.get_performance_metrics()
+    results['parameters'] = strategy.get_parameters()
+    return results
+
+
+def run_grid(
+    configs: List[Dict],
+    data: pd.DataFrame,
+    earnings_dates: Optional[Dict[datetime, datetime]] = None,
+    symbol: str = 'SYMBOL',
+    initial_capital: float = 100000.0,
+    max_workers: Optional[int] = None
+) -> List[Dict]:
+    """
+    Backtest many STM parameter sets on the same symbol's data.
+    
+    Entry signals are computed as in scan_param_grid; each config's
+    trades are then walked with find_exit and calculate_position_size on
+    a thread pool.
+    
+    Args:
+        configs: STM_MeanReversion keyword arguments, one dict per run
+        data: DataFrame with OHLCV and indicators
+        earnings_dates: Dict mapping dates to next earnings date
+        symbol: Symbol name recorded on the trades
+        initial_capital: Starting capital of each run
+        max_workers: Thread count (default: ThreadPoolExecutor's default)
+    
+    Returns:
+        PortfolioBacktestEngine performance metrics, one dict per config,
+        in order, each with the run's 'parameters'
+    """
+    strategies = [STM_MeanReversion(**config) for config in configs]
+    signals = _entry_signal_arrays(strategies, data, earnings_dates, max_workers)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(
+            lambda run: _backtest_signals(run[0], data, run[1], symbol, initial_capital),
+            zip(strategies, signals)
+        ))
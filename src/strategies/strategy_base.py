@@ -10,11 +10,24 @@ This base class extends the simple strategy framework with:
 - Trade management logic
 """
 
-from abc import ABC, abstractmethod
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from abc import ABC
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple
+import threading
+import weakref
 import pandas as pd
 import numpy as np
 from enum import Enum
+from src.strategies._sizing_numba import _update_trailing_stops_batch
+from src.strategies.signal_utils import unpack
 
 
 class PositionSizingMethod(Enum):
@@ -24,6 +37,7 @@ class PositionSizingMethod(Enum):
     KELLY_CRITERION = "kelly_criterion"
     FIXED_FRACTIONAL = "fixed_fractional"
     EQUAL_WEIGHT = "equal_weight"
+    BAYESIAN_KELLY = "bayesian_kelly"
 
 
 class SignalType(Enum):
@@ -35,12 +49,222 @@ class SignalType(Enum):
     EXIT_SHORT = -2
 
 
+# Raw direction codes used by the hot paths instead of Enum comparisons
+_LONG = SignalType.LONG.value
+_SHORT = SignalType.SHORT.value
+
+# Per-symbol position record: stop, target, entry and direction (1/-1/0)
+_POS_DTYPE = np.dtype([
+    ('symbol_id', 'i4'),
+    ('stop', 'f8'),
+    ('tp', 'f8'),
+    ('entry', 'f8'),
+    ('side', 'i1')
+])
+
+
+def _empty_position_records(n: int) -> np.ndarray:
+    """``n`` flat position records with no stop, target or entry"""
+    records = np.zeros(n, dtype=_POS_DTYPE)
+    records['symbol_id'] = -1
+    records['stop'] = records['tp'] = records['entry'] = np.nan
+    return records
+
+
+class _PriceLevels(MutableMapping):
+    """
+    Symbol -> price view of one field ('stop' or 'tp') of a strategy's
+    position records. Reads and writes go straight to the records; a
+    missing level is stored as NaN.
+    """
+    
+    __slots__ = ('_strategy', '_field')
+    
+    def __init__(self, strategy: 'AdvancedStrategy', field: str):
+        self._strategy = strategy
+        self._field = field
+    
+    def __getitem__(self, symbol: str) -> float:
+        row = self._strategy._symbol_to_row.get(symbol)
+        if row is not None:
+            value = float(self._strategy._positions[row][self._field])
+            if not np.isnan(value):
+                return value
+        raise KeyError(symbol)
+    
+    def __setitem__(self, symbol: str, price: Optional[float]):
+        # symbol_row() may reallocate the records, so index after it
+        row = self._strategy.symbol_row(symbol)
+        self._strategy._positions[row][self._field] = np.nan if price is None else price
+    
+    def __delitem__(self, symbol: str):
+        self[symbol]  # KeyError if there is no level
+        row = self._strategy._symbol_to_row[symbol]
+        self._strategy._positions[row][self._field] = np.nan
+    
+    def __iter__(self):
+        levels = self._strategy._positions[self._field]
+        return iter([
+            symbol for symbol, row in self._strategy._symbol_to_row.items()
+            if not np.isnan(levels[row])
+        ])
+    
+    def __len__(self) -> int:
+        n = len(self._strategy._symbol_to_row)
+        return int(np.count_nonzero(~np.isnan(self._strategy._positions[self._field][:n])))
+    
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class _FrameCache:
+    """
+    Thread-safe LRU of values derived from DataFrame objects.
+    
+    Keys combine id(data) with a caller key. An entry also holds a weakref
+    to its DataFrame and that frame's columns Index, and is only served for
+    the same live object with the same columns Index, so a recycled id or
+    an added/removed column is a miss. Entries are dropped when their
+    DataFrame is garbage collected.
+    """
+    
+    __slots__ = ('_entries', '_lock', 'max_size')
+    
+    def __init__(self, max_size: int):
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # Reentrant: a weakref callback can run inside a locked section
+        # when garbage collection kicks in on the same thread
+        self._lock = threading.RLock()
+        self.max_size = max_size
+    
+    def get(self, data: pd.DataFrame, key):
+        """Value stored for this DataFrame object and key, or None"""
+        full_key = (id(data), key)
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is None or entry[0]() is not data or entry[1] is not data.columns:
+                return None
+            self._entries.move_to_end(full_key)
+            return entry[2]
+    
+    def put(self, data: pd.DataFrame, key, value):
+        """Store a value for this DataFrame object and key"""
+        full_key = (id(data), key)
+        ref = weakref.ref(data, lambda ref: self._discard(full_key, ref))
+        with self._lock:
+            self._entries[full_key] = (ref, data.columns, value)
+            self._entries.move_to_end(full_key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def _discard(self, full_key: tuple, ref: weakref.ref):
+        """Drop the entry of a collected DataFrame, unless its id was reused"""
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[full_key]
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Bar columns every strategy receives
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def _parameter(attr: str, multipliers: bool = False) -> property:
+    """
+    Property for a get_parameters() setting, stored in the ``_<attr>`` slot.
+    
+    Args:
+        attr: Public setting name
+        multipliers: Recompute the setting's price multipliers on assignment
+        
+    Returns:
+        Property whose setter drops the cached parameter snapshot
+    """
+    slot = '_' + attr
+    
+    def fset(self, value):
+        setattr(self, slot, value)
+        self._params_cache = None
+        if multipliers:
+            self._set_multipliers(attr, value)
+    
+    return property(attrgetter(slot), fset)
+
+
 class AdvancedStrategy(ABC):
     """
     Advanced base class for trading strategies with risk management
     and sophisticated position sizing.
     """
     
+    # Fixed attribute layout: parameter sweeps create many instances.
+    # Subclasses extend it with their own __slots__.
+    __slots__ = (
+        '_name', 'initial_capital',
+        # Sizing
+        '_position_sizing_method', '_position_size_pct', '_max_position_size',
+        '_max_positions', '_risk_per_trade', '_kelly_fraction',
+        # Stops
+        '_stop_loss_pct', '_take_profit_pct', '_trailing_stop_pct',
+        '_use_atr_stops', '_atr_stop_multiplier',
+        '_long_stop_mult', '_short_stop_mult', '_long_tp_mult', '_short_tp_mult',
+        '_long_trail_mult', '_short_trail_mult',
+        # Strategy-specific parameters and state
+        'parameters', 'positions', '_symbol_to_row', '_positions', '_params_cache',
+        '_wins', '_losses',
+        '__weakref__'
+    )
+    
+    # Signals shared by all instances, keyed by DataFrame and parameter
+    # signature, so sweeps that only vary risk parameters reuse the same
+    # signal vector. Off unless enabled with signal_caching()
+    _signal_cache = _FrameCache(256)
+    _signal_cache_enabled = False
+    _signal_cache_users = 0  # open signal_caching() blocks, across threads
+    _signal_cache_lock = threading.Lock()
+    
+    # DataFrames that already passed validate_data(), per required indicators
+    _validated_cache = _FrameCache(256)
+    
+    # Settings reported by get_parameters(); setting one drops the snapshot,
+    # and the stop/target/trail percentages also recompute their multipliers
+    name = _parameter('name')
+    position_sizing_method = _parameter('position_sizing_method')
+    position_size_pct = _parameter('position_size_pct')
+    max_position_size = _parameter('max_position_size')
+    stop_loss_pct = _parameter('stop_loss_pct', multipliers=True)
+    take_profit_pct = _parameter('take_profit_pct', multipliers=True)
+    trailing_stop_pct = _parameter('trailing_stop_pct', multipliers=True)
+    max_positions = _parameter('max_positions')
+    risk_per_trade = _parameter('risk_per_trade')
+    use_atr_stops = _parameter('use_atr_stops')
+    atr_stop_multiplier = _parameter('atr_stop_multiplier')
+    kelly_fraction = _parameter('kelly_fraction')
+    
+    def __init_subclass__(cls, **kwargs):
+        """
+        Require every strategy to implement its signal logic.
+        
+        generate_signals() has a default built on
+        generate_signals_vectorized(), so neither is abstract; a subclass
+        overriding neither (itself or through a base) is rejected here
+        instead of failing on its first generate_signals() call.
+        """
+        super().__init_subclass__(**kwargs)
+        if (cls.generate_signals is AdvancedStrategy.generate_signals
+                and cls.generate_signals_vectorized is AdvancedStrategy.generate_signals_vectorized):
+            raise TypeError(
+                f"{cls.__name__} must implement generate_signals() "
+                "or generate_signals_vectorized()"
+            )
+    
     def __init__(
         self,
         name: str,
@@ -55,6 +279,7 @@ class AdvancedStrategy(ABC):
         risk_per_trade: float = 0.02,
         use_atr_stops: bool = False,
         atr_stop_multiplier: float = 2.0,
+        kelly_fraction: float = 0.5,
         **kwargs
     ):
         """
@@ -73,8 +298,10 @@ class AdvancedStrategy(ABC):
             risk_per_trade: Maximum risk per trade as % of capital
             use_atr_stops: Use ATR-based stops instead of percentage
             atr_stop_multiplier: ATR multiplier for stop distance
+            kelly_fraction: Fraction of the Kelly position to take (0.5 = half Kelly)
             **kwargs: Additional strategy-specific parameters
         """
+        self._params_cache: Optional[Dict] = None
         self.name = name
         self.initial_capital = initial_capital
         self.position_sizing_method = position_sizing_method
@@ -87,25 +314,209 @@ class AdvancedStrategy(ABC):
         self.risk_per_trade = risk_per_trade
         self.use_atr_stops = use_atr_stops
         self.atr_stop_multiplier = atr_stop_multiplier
+        self.kelly_fraction = kelly_fraction
         self.parameters = kwargs
         
         # Track positions and stops
         self.positions: Dict[str, Dict] = {}  # symbol -> position info
-        self.stop_prices: Dict[str, float] = {}  # symbol -> stop price
-        self.take_profit_prices: Dict[str, float] = {}  # symbol -> TP price
         
-    @abstractmethod
+        # Running trade outcome counts for BAYESIAN_KELLY sizing
+        self._wins = 0
+        self._losses = 0
+        
+        # One record per symbol (NaN = no level) so a position's stop,
+        # target and direction share a cache line, and exits of all open
+        # positions are checked in one vectorized pass
+        self._symbol_to_row: Dict[str, int] = {}  # symbol -> record row
+        self._positions = _empty_position_records(max(max_positions, 1))
+        
+    def _set_multipliers(self, name: str, pct: Optional[float]):
+        """
+        Precompute the long/short price multipliers of a percentage setting
+        (None when the setting is disabled).
+        
+        Args:
+            name: stop_loss_pct, take_profit_pct or trailing_stop_pct
+            pct: New value of the setting
+        """
+        below = (1 - pct) if pct else None
+        above = (1 + pct) if pct else None
+        
+        if name == 'take_profit_pct':
+            self._long_tp_mult = above
+            self._short_tp_mult = below
+        elif name == 'stop_loss_pct':
+            self._long_stop_mult = below
+            self._short_stop_mult = above
+        else:
+            self._long_trail_mult = below
+            self._short_trail_mult = above
+    
+    @property
+    def stop_prices(self) -> MutableMapping:
+        """
+        Tracked stop prices (symbol -> price), backed by the position records.
+        Assignments write through; set_stops() also records the direction.
+        """
+        return _PriceLevels(self, 'stop')
+    
+    @property
+    def take_profit_prices(self) -> MutableMapping:
+        """
+        Tracked take-profit prices (symbol -> price), backed by the position
+        records. Assignments write through; set_stops() also records the direction.
+        """
+        return _PriceLevels(self, 'tp')
+    
+    def _grow_arrays(self, n: int):
+        """
+        Make room for at least ``n`` position records, doubling the capacity.
+        
+        Args:
+            n: Required number of rows
+        """
+        capacity = len(self._positions)
+        if n <= capacity:
+            return
+        while capacity < n:
+            capacity *= 2
+        
+        self._positions = np.concatenate([
+            self._positions, _empty_position_records(capacity - len(self._positions))
+        ])
+    
+    def symbol_row(self, symbol: str) -> int:
+        """
+        Row of a symbol in the position records, assigned on first use.
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            Row index, stable for the lifetime of the strategy
+        """
+        row = self._symbol_to_row.get(symbol)
+        if row is None:
+            row = self._symbol_to_row[symbol] = len(self._symbol_to_row)
+            self._grow_arrays(row + 1)
+            self._positions[row]['symbol_id'] = row
+        return row
+    
+    def set_stops(
+        self,
+        symbol: str,
+        signal: SignalType,
+        stop_price: Optional[float],
+        take_profit_price: Optional[float],
+        entry_price: Optional[float] = None
+    ):
+        """
+        Track the stop-loss and take-profit of an open position.
+        
+        Args:
+            symbol: Trading symbol
+            signal: Position direction (LONG or SHORT)
+            stop_price: Stop-loss price, or None
+            take_profit_price: Take-profit price, or None
+            entry_price: Entry price, or None
+        """
+        row = self.symbol_row(symbol)
+        record = self._positions[row]
+        record['stop'] = np.nan if stop_price is None else stop_price
+        record['tp'] = np.nan if take_profit_price is None else take_profit_price
+        record['entry'] = np.nan if entry_price is None else entry_price
+        record['side'] = signal.value
+    
+    def clear_stops(self, symbol: str):
+        """
+        Stop tracking a closed position (the symbol keeps its row).
+        
+        Args:
+            symbol: Trading symbol
+        """
+        row = self._symbol_to_row.get(symbol)
+        if row is not None:
+            record = self._positions[row]
+            record['stop'] = record['tp'] = record['entry'] = np.nan
+            record['side'] = 0
+        
+    def update_trade_result(self, pnl: float):
+        """
+        Record the outcome of a closed trade for BAYESIAN_KELLY sizing.
+        
+        Args:
+            pnl: Realized profit/loss of the trade
+        """
+        if pnl > 0:
+            self._wins += 1
+        else:
+            self._losses += 1
+    
+    def reset_trade_results(self):
+        """Forget the recorded trade outcomes (e.g. at the start of a backtest)."""
+        self._wins = 0
+        self._losses = 0
+    
+    def _bayesian_kelly_pct(self) -> Optional[float]:
+        """
+        Fractional Kelly position size from the recorded trade outcomes.
+        
+        With w wins out of the last L trades and an uncertain win
+        probability, the Bayesian Kelly fraction is (2w - L) / (L + 2),
+        which shrinks toward zero while the sample is small.
+        
+        Returns:
+            Position size as % of equity, or None before the first trade
+        """
+        trades = self._wins + self._losses
+        if not trades:
+            return None
+        kelly_pct = (2 * self._wins - trades) / (trades + 2)
+        return max(0.0, kelly_pct) * self.kelly_fraction
+    
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
         Generate trading signals based on strategy logic.
         
+        Subclasses either override this or implement
+        generate_signals_vectorized(); the default unwraps the OHLCV and
+        required indicator columns into arrays and calls the latter.
+        
         Args:
             data: DataFrame with OHLCV data and indicators
             
         Returns:
             Series with signals: 1 (LONG), -1 (SHORT), 0 (NEUTRAL)
         """
-        pass
+        self.validate_data(data)
+        
+        cols = list(OHLCV_COLUMNS) + [
+            ind for ind in self.get_required_indicators() if ind not in OHLCV_COLUMNS
+        ]
+        signals = self.generate_signals_vectorized(unpack(data, cols))
+        return pd.Series(signals, index=data.index)
+    
+    def generate_signals_vectorized(self, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Generate trading signals from raw column arrays.
+        
+        Contract: operate on whole arrays only, with no Python loops over
+        bars and no row-wise ``DataFrame.apply``. Use NumPy ufuncs,
+        ``numpy.lib.stride_tricks.sliding_window_view`` for windowed
+        logic, or a Numba kernel (see signal_utils); if a pandas
+        ``rolling().apply()`` is unavoidable, pass ``raw=True``.
+        
+        Args:
+            arrays: Column name -> float64 array for the OHLCV columns and
+                get_required_indicators()
+            
+        Returns:
+            Signal array (1 LONG, -1 SHORT, 0 NEUTRAL, 2/-2 exits)
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement generate_signals() "
+            "or generate_signals_vectorized()"
+        )
     
     def calculate_position_size(
         self,
@@ -130,54 +541,162 @@ class AdvancedStrategy(ABC):
         Returns:
             Number of shares to trade
         """
-        if self.position_sizing_method == PositionSizingMethod.FIXED:
-            position_value = equity * self.position_size_pct
-            shares = position_value / price
+        # One-element run of the batch formulas; only None means "not
+        # available" here, a NaN input is used as given (sizes to 0)
+        def as_array(value: Optional[float]) -> Optional[np.ndarray]:
+            return None if value is None else np.array([value], dtype=np.float64)
+        
+        shares = self._position_sizes(
+            as_array(price), as_array(equity), as_array(volatility),
+            as_array(win_rate), as_array(avg_win_loss_ratio), nan_missing=False
+        )
+        return int(shares[0])
+    
+    def calculate_position_sizes_batch(
+        self,
+        prices: np.ndarray,
+        equities: np.ndarray,
+        volatilities: Optional[np.ndarray] = None,
+        win_rates: Optional[np.ndarray] = None,
+        avg_win_loss_ratios: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_position_size() for many symbols at once.
+        
+        The sizing method is dispatched once and every formula runs over
+        whole arrays. A NaN volatility, win rate or win/loss ratio means
+        "not available" (the scalar method's None) and takes the same
+        fallback.
+        
+        Args:
+            prices: Current prices
+            equities: Account equity per position (or a scalar)
+            volatilities: ATR or standard deviation per symbol
+            win_rates: Historical win rates for Kelly Criterion
+            avg_win_loss_ratios: Average win/loss ratios for Kelly Criterion
             
-        elif self.position_sizing_method == PositionSizingMethod.VOLATILITY_ATR:
-            if volatility is None or volatility == 0:
-                # Fallback to fixed sizing
-                position_value = equity * self.position_size_pct
-                shares = position_value / price
+        Returns:
+            int64 array with the number of shares per symbol
+        """
+        return self._position_sizes(
+            prices, equities, volatilities, win_rates, avg_win_loss_ratios, nan_missing=True
+        )
+    
+    def _position_sizes(
+        self,
+        prices: np.ndarray,
+        equities: np.ndarray,
+        volatilities: Optional[np.ndarray],
+        win_rates: Optional[np.ndarray],
+        avg_win_loss_ratios: Optional[np.ndarray],
+        nan_missing: bool
+    ) -> np.ndarray:
+        """
+        Position sizing formulas shared by the scalar and batch methods.
+        
+        ``nan_missing`` makes a NaN volatility, win rate or win/loss ratio
+        take the "not available" fallback; otherwise NaN flows through
+        the formulas.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        equities = np.broadcast_to(np.asarray(equities, dtype=np.float64), prices.shape)
+        
+        # Fixed sizing, also the fallback of the other methods
+        fixed = equities * self.position_size_pct / prices
+        method = self.position_sizing_method
+        
+        if method == PositionSizingMethod.FIXED:
+            shares = fixed
+            
+        elif method == PositionSizingMethod.VOLATILITY_ATR:
+            if volatilities is None:
+                shares = fixed
             else:
                 # Risk-based position sizing using ATR
-                risk_amount = equity * self.risk_per_trade
-                stop_distance = volatility * self.atr_stop_multiplier
-                shares = risk_amount / stop_distance if stop_distance > 0 else 0
+                volatilities = np.asarray(volatilities, dtype=np.float64)
+                stop_distance = volatilities * self.atr_stop_multiplier
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    risk_shares = np.where(stop_distance > 0, equities * self.risk_per_trade / stop_distance, 0.0)
+                missing = volatilities == 0
+                if nan_missing:
+                    missing |= np.isnan(volatilities)
+                shares = np.where(missing, fixed, risk_shares)
                 
-        elif self.position_sizing_method == PositionSizingMethod.KELLY_CRITERION:
-            if win_rate is not None and avg_win_loss_ratio is not None:
-                # Kelly % = W - [(1-W) / R]
-                # W = win rate, R = avg_win / avg_loss
-                kelly_pct = win_rate - ((1 - win_rate) / avg_win_loss_ratio)
-                kelly_pct = max(0, min(kelly_pct, 0.25))  # Cap at 25%
-                # Use fractional Kelly (e.g., half Kelly)
-                kelly_pct *= 0.5
-                position_value = equity * kelly_pct
-                shares = position_value / price
+        elif method == PositionSizingMethod.KELLY_CRITERION:
+            if win_rates is None or avg_win_loss_ratios is None:
+                shares = fixed
             else:
-                # Fallback to fixed sizing
-                position_value = equity * self.position_size_pct
-                shares = position_value / price
-                
-        elif self.position_sizing_method == PositionSizingMethod.FIXED_FRACTIONAL:
-            risk_amount = equity * self.risk_per_trade
+                win_rates = np.asarray(win_rates, dtype=np.float64)
+                avg_win_loss_ratios = np.asarray(avg_win_loss_ratios, dtype=np.float64)
+                # Kelly % = W - [(1-W) / R], capped at 25%, fractional Kelly
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    kelly_pct = win_rates - ((1 - win_rates) / avg_win_loss_ratios)
+                kelly_pct = np.where(kelly_pct > 0.25, 0.25, kelly_pct)
+                kelly_pct = np.where(kelly_pct > 0, kelly_pct, 0.0) * self.kelly_fraction
+                shares = equities * kelly_pct / prices
+                if nan_missing:
+                    missing = np.isnan(win_rates) | np.isnan(avg_win_loss_ratios)
+                    shares = np.where(missing, fixed, shares)
+        
+        elif method == PositionSizingMethod.FIXED_FRACTIONAL:
             if self.stop_loss_pct:
-                stop_distance = price * self.stop_loss_pct
-                shares = risk_amount / stop_distance if stop_distance > 0 else 0
+                stop_distance = prices * self.stop_loss_pct
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    shares = np.where(stop_distance > 0, equities * self.risk_per_trade / stop_distance, 0.0)
             else:
-                position_value = equity * self.position_size_pct
-                shares = position_value / price
+                shares = fixed
+                
+        elif method == PositionSizingMethod.BAYESIAN_KELLY:
+            kelly_pct = self._bayesian_kelly_pct()
+            shares = fixed if kelly_pct is None else equities * kelly_pct / prices
                 
         else:  # EQUAL_WEIGHT
-            position_value = equity / self.max_positions
-            shares = position_value / price
+            shares = equities / self.max_positions / prices
         
         # Apply maximum position size limit
-        max_shares = (equity * self.max_position_size) / price
-        shares = min(shares, max_shares)
+        max_shares = (equities * self.max_position_size) / prices
+        shares = np.minimum(shares, max_shares)
+        
+        return np.trunc(shares, out=shares).astype(np.int64, copy=False)
+    
+    @staticmethod
+    def compute_atr(
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        n: int = 14
+    ) -> np.ndarray:
+        """
+        Average True Range with Wilder smoothing, for ATR-based stops and sizing.
+        
+        True range is one np.maximum.reduce over the three candidates; compute
+        it once per backtest and pass the per-bar values to calculate_stops()
+        or calculate_position_sizes_batch(). The first bar has no previous
+        close, so smoothing starts on the second bar.
+        
+        Args:
+            high: High prices
+            low: Low prices
+            close: Close prices
+            n: ATR period
+            
+        Returns:
+            float64 ATR array of the same length
+        """
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
+        
+        prev_close = np.empty_like(close)
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
         
-        return int(shares)
+        true_range = np.maximum.reduce([
+            high - low,
+            np.abs(high - prev_close),
+            np.abs(low - prev_close)
+        ])
+        return pd.Series(true_range).ewm(alpha=1.0 / n, adjust=False).mean().to_numpy()
     
     def calculate_stops(
         self,
@@ -198,31 +717,71 @@ class AdvancedStrategy(ABC):
         Returns:
             Tuple of (stop_price, take_profit_price)
         """
+        return self._calculate_stops_raw(entry_price, signal.value, atr)
+    
+    def _calculate_stops_raw(
+        self,
+        entry_price: float,
+        side: int,
+        atr: Optional[float] = None
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """calculate_stops() on a raw direction code (1 long, -1 short)"""
+        if side == _LONG:
+            stop_mult, tp_mult = self._long_stop_mult, self._long_tp_mult
+        elif side == _SHORT:
+            stop_mult, tp_mult = self._short_stop_mult, self._short_tp_mult
+        else:
+            return None, None
+        
+        # ATR offset differs between long and short only in its sign
         stop_price = None
-        take_profit_price = None
+        if self.use_atr_stops and atr is not None:
+            stop_price = entry_price - side * (atr * self.atr_stop_multiplier)
+        elif stop_mult is not None:
+            stop_price = entry_price * stop_mult
         
-        if signal == SignalType.LONG:
-            # Long position stops
-            if self.use_atr_stops and atr is not None:
-                stop_price = entry_price - (atr * self.atr_stop_multiplier)
-            elif self.stop_loss_pct:
-                stop_price = entry_price * (1 - self.stop_loss_pct)
-                
-            if self.take_profit_pct:
-                take_profit_price = entry_price * (1 + self.take_profit_pct)
-                
-        elif signal == SignalType.SHORT:
-            # Short position stops
-            if self.use_atr_stops and atr is not None:
-                stop_price = entry_price + (atr * self.atr_stop_multiplier)
-            elif self.stop_loss_pct:
-                stop_price = entry_price * (1 + self.stop_loss_pct)
-                
-            if self.take_profit_pct:
-                take_profit_price = entry_price * (1 - self.take_profit_pct)
+        take_profit_price = None
+        if tp_mult is not None:
+            take_profit_price = entry_price * tp_mult
         
         return stop_price, take_profit_price
     
+    def calculate_stops_batch(
+        self,
+        entry_prices: np.ndarray,
+        sides: np.ndarray,
+        atrs: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized calculate_stops() over many entries.
+        
+        Args:
+            entry_prices: Entry prices
+            sides: Direction codes (1 long, -1 short; anything else gets no levels)
+            atrs: ATR per entry for ATR-based stops (NaN = not available)
+            
+        Returns:
+            Tuple of (stop_prices, take_profit_prices), NaN where there is no level
+        """
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        sides = np.asarray(sides)
+        sign = np.where((sides == _LONG) | (sides == _SHORT), sides, np.nan)
+        
+        stop_prices = np.full(entry_prices.shape, np.nan)
+        if self.stop_loss_pct:
+            stop_prices = entry_prices * (1 - sign * self.stop_loss_pct)
+        if self.use_atr_stops and atrs is not None:
+            atrs = np.asarray(atrs, dtype=np.float64)
+            atr_stops = entry_prices - sign * (atrs * self.atr_stop_multiplier)
+            stop_prices = np.where(np.isnan(atrs), stop_prices, atr_stops)
+        
+        if self.take_profit_pct:
+            take_profit_prices = entry_prices * (1 + sign * self.take_profit_pct)
+        else:
+            take_profit_prices = np.full(entry_prices.shape, np.nan)
+        
+        return stop_prices, take_profit_prices
+    
     def update_trailing_stop(
         self,
         symbol: str,
@@ -240,25 +799,51 @@ class AdvancedStrategy(ABC):
         Returns:
             Updated stop price or None
         """
-        if not self.trailing_stop_pct or symbol not in self.stop_prices:
+        row = self._symbol_to_row.get(symbol)
+        if not self.trailing_stop_pct or row is None:
+            return None
+        current_stop = float(self._positions[row]['stop'])
+        if np.isnan(current_stop):
             return None
-            
-        current_stop = self.stop_prices[symbol]
         
-        if signal == SignalType.LONG:
+        side = signal.value
+        if side == _LONG:
             # For long positions, only move stop up
-            new_stop = current_price * (1 - self.trailing_stop_pct)
+            new_stop = current_price * self._long_trail_mult
             if new_stop > current_stop:
                 return new_stop
                 
-        elif signal == SignalType.SHORT:
+        elif side == _SHORT:
             # For short positions, only move stop down
-            new_stop = current_price * (1 + self.trailing_stop_pct)
+            new_stop = current_price * self._short_trail_mult
             if new_stop < current_stop:
                 return new_stop
         
         return current_stop
     
+    def update_trailing_stops(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Ratchet the trailing stops of all tracked positions in one pass.
+        
+        Unlike update_trailing_stop(), which only returns the new level,
+        this writes the moved stops back into the position records (see
+        set_stops()), so it is called once per bar with the full vector.
+        
+        Args:
+            prices: Current price per symbol row (see symbol_row())
+            
+        Returns:
+            The (updated) stop price per row
+        """
+        active = self._positions[:len(self._symbol_to_row)]
+        stops = active['stop']
+        if self.trailing_stop_pct:
+            _update_trailing_stops_batch(
+                np.asarray(prices, dtype=np.float64), active['side'], stops,
+                float(self.trailing_stop_pct)
+            )
+        return stops
+    
     def check_exit_conditions(
         self,
         symbol: str,
@@ -280,24 +865,52 @@ class AdvancedStrategy(ABC):
         Returns:
             True if position should be exited
         """
-        # Check stop-loss
-        if symbol in self.stop_prices and self.stop_prices[symbol] is not None:
-            stop = self.stop_prices[symbol]
-            if signal == SignalType.LONG and low <= stop:
-                return True
-            elif signal == SignalType.SHORT and high >= stop:
-                return True
-        
-        # Check take-profit
-        if symbol in self.take_profit_prices and self.take_profit_prices[symbol] is not None:
-            tp = self.take_profit_prices[symbol]
-            if signal == SignalType.LONG and high >= tp:
-                return True
-            elif signal == SignalType.SHORT and low <= tp:
-                return True
+        row = self._symbol_to_row.get(symbol)
+        if row is None:
+            return False
+        return self._check_exit_raw(row, high, low, signal.value)
+    
+    def _check_exit_raw(self, row: int, high: float, low: float, side: int) -> bool:
+        """check_exit_conditions() on a symbol row and raw direction code"""
+        # NaN (no stop / no target) compares False
+        record = self._positions[row]
+        stop = record['stop']
+        tp = record['tp']
+        if side == _LONG:
+            return bool(low <= stop or high >= tp)
+        elif side == _SHORT:
+            return bool(high >= stop or low <= tp)
         
         return False
     
+    def check_exits_vectorized(
+        self,
+        lows: np.ndarray,
+        highs: np.ndarray,
+        signals_side: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Check stop-loss and take-profit of all tracked symbols at once.
+        
+        Args:
+            lows: Period low per symbol row (see symbol_row())
+            highs: Period high per symbol row
+            signals_side: Position direction per row (1 long, -1 short, 0 flat);
+                defaults to the directions recorded by set_stops()
+            
+        Returns:
+            Boolean mask of rows whose position should be exited
+        """
+        active = self._positions[:len(self._symbol_to_row)]
+        stops = active['stop']
+        tps = active['tp']
+        sides = active['side'] if signals_side is None else np.asarray(signals_side)
+        
+        # NaN stops/targets never trigger
+        exit_long = (sides == _LONG) & ((lows <= stops) | (highs >= tps))
+        exit_short = (sides == _SHORT) & ((highs >= stops) | (lows <= tps))
+        return exit_long | exit_short
+    
     def apply_filters(self, data: pd.DataFrame, signals: pd.Series) -> pd.Series:
         """
         Apply additional filters to trading signals (override in subclass).
@@ -308,6 +921,9 @@ class AdvancedStrategy(ABC):
         - Market regime filters
         - Time-of-day filters
         
+        Implementations may filter ``signals`` in place rather than copy it;
+        callers should use the returned Series.
+        
         Args:
             data: DataFrame with market data and indicators
             signals: Raw signals from generate_signals()
@@ -337,19 +953,130 @@ class AdvancedStrategy(ABC):
         Returns:
             True if data is valid
         """
-        required_cols = ['open', 'high', 'low', 'close', 'volume']
-        required_indicators = self.get_required_indicators()
+        required_cols = OHLCV_COLUMNS
+        required_indicators = tuple(self.get_required_indicators())
+        
+        # Same DataFrame object with an unchanged columns Index: already checked
+        if self._validated_cache.get(data, required_indicators):
+            return True
         
-        missing_cols = [col for col in required_cols if col not in data.columns]
-        missing_indicators = [ind for ind in required_indicators if ind not in data.columns]
+        # Plain set probes instead of pandas Index lookups
+        columns = frozenset(data.columns)
+        missing_cols = [col for col in required_cols if col not in columns]
+        missing_indicators = [ind for ind in required_indicators if ind not in columns]
         
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
         if missing_indicators:
             raise ValueError(f"Missing required indicators: {missing_indicators}")
-            
+        
+        self._validated_cache.put(data, required_indicators, True)
         return True
     
+    @classmethod
+    @contextmanager
+    def signal_caching(cls):
+        """
+        Share generated signals between strategy instances within the block.
+        
+        Meant for parameter sweeps over fixed data: the DataFrames passed to
+        generate_signals() must not be modified in place while caching is
+        on, since a hit is served for the same DataFrame object. Blocks may
+        run concurrently in several threads; the cache is cleared when the
+        last one exits.
+        
+        Example:
+            with AdvancedStrategy.signal_caching():
+                for params in grid:
+                    engine.run_backtest(MyStrategy(**params), data)
+        """
+        with AdvancedStrategy._signal_cache_lock:
+            AdvancedStrategy._signal_cache_users += 1
+            AdvancedStrategy._signal_cache_enabled = True
+        try:
+            yield
+        finally:
+            with AdvancedStrategy._signal_cache_lock:
+                AdvancedStrategy._signal_cache_users -= 1
+                if not AdvancedStrategy._signal_cache_users:
+                    AdvancedStrategy._signal_cache_enabled = False
+                    AdvancedStrategy._signal_cache.clear()
+    
+    def _param_signature(self) -> Optional[tuple]:
+        """
+        Live signal-affecting state: the attributes declared in the
+        subclasses' __slots__ (plus any instance __dict__) and the strategy
+        kwargs, not the risk/sizing settings of AdvancedStrategy. None if
+        they are not hashable.
+        """
+        values = [type(self), tuple(sorted(self.parameters.items()))]
+        for cls in type(self).__mro__:
+            if cls is AdvancedStrategy:
+                break
+            slots = cls.__dict__.get('__slots__', ())
+            for attr in (slots,) if isinstance(slots, str) else slots:
+                if attr not in ('__dict__', '__weakref__'):
+                    values.append((attr, getattr(self, attr, None)))
+        
+        instance_dict = getattr(self, '__dict__', None)
+        if instance_dict:
+            values.append(tuple(sorted(instance_dict.items())))
+        
+        signature = tuple(values)
+        try:
+            hash(signature)
+        except TypeError:
+            return None
+        return signature
+    
+    def _cached_signals(self, data: pd.DataFrame) -> Optional[pd.Series]:
+        """
+        Look up signals previously generated for this DataFrame object.
+        
+        Only active inside signal_caching(), where the DataFrame is treated
+        as immutable once signals were generated from it (a changed columns
+        Index still counts as a miss); entries are dropped when it is
+        garbage collected.
+        
+        Args:
+            data: DataFrame passed to generate_signals()
+            
+        Returns:
+            Copy of the cached signals, or None on a miss
+        """
+        if not self._signal_cache_enabled:
+            return None
+        signature = self._param_signature()
+        if signature is None:
+            return None
+        
+        values = self._signal_cache.get(data, signature)
+        if values is None:
+            return None
+        return pd.Series(values.copy(), index=data.index)
+    
+    def _store_signals(self, data: pd.DataFrame, signals: pd.Series) -> pd.Series:
+        """
+        Cache generated signals for this DataFrame (see _cached_signals).
+        
+        Args:
+            data: DataFrame passed to generate_signals()
+            signals: Generated signals
+            
+        Returns:
+            The signals, unchanged
+        """
+        if not self._signal_cache_enabled:
+            return signals
+        signature = self._param_signature()
+        if signature is None:
+            return signals
+        
+        values = signals.to_numpy().copy()
+        values.flags.writeable = False
+        self._signal_cache.put(data, signature, values)
+        return signals
+    
     def get_parameters(self) -> Dict:
         """
         Get strategy parameters for logging/optimization.
@@ -357,7 +1084,16 @@ class AdvancedStrategy(ABC):
         Returns:
             Dictionary of parameters
         """
-        params = {
+        if self._params_cache is None:
+            self._params_cache = self._build_params()
+        
+        params = dict(self._params_cache)
+        params.update(self.parameters)
+        return params
+    
+    def _build_params(self) -> Dict:
+        """Snapshot of the base parameters, cached by get_parameters()"""
+        return {
             'name': self.name,
             'position_sizing_method': self.position_sizing_method.value,
             'position_size_pct': self.position_size_pct,
@@ -369,9 +1105,8 @@ class AdvancedStrategy(ABC):
             'risk_per_trade': self.risk_per_trade,
             'use_atr_stops': self.use_atr_stops,
             'atr_stop_multiplier': self.atr_stop_multiplier,
+            'kelly_fraction': self.kelly_fraction,
         }
-        params.update(self.parameters)
-        return params
     
     def __repr__(self) -> str:
         return f"<AdvancedStrategy: {self.name}>"
@@ -0,0 +1,75 @@
+"""
+Shared fixtures for unit tests
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _market_data(n: int = 1000, seed: int = 0) -> pd.DataFrame:
+    """
+    Random-walk daily bars with the indicator columns the strategies read,
+    built with pandas rolling windows (NaN warm-up included)
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    high = close + rng.random(n) * 2
+    low = close - rng.random(n) * 2
+    volume = rng.integers(100_000, 1_000_000, n).astype(float)
+    volume[rng.random(n) < 0.05] *= 3  # Volume spikes
+    
+    index = pd.date_range('2015-01-01', periods=n, freq='D')
+    df = pd.DataFrame(
+        {'open': close, 'high': high, 'low': low, 'close': close, 'volume': volume},
+        index=index
+    )
+    c = df['close']
+    
+    # Bollinger Bands, default and parameterized names
+    for period, std in ((20, 2.0), (20, 2.5), (10, 2.0)):
+        middle = c.rolling(period).mean()
+        width = c.rolling(period).std() * std
+        df[f'bb_middle_{period}_{std}'] = middle
+        df[f'bb_upper_{period}_{std}'] = middle + width
+        df[f'bb_lower_{period}_{std}'] = middle - width
+    df['bb_middle'] = df['bb_middle_20_2.0']
+    df['bb_upper'] = df['bb_upper_20_2.0']
+    df['bb_lower'] = df['bb_lower_20_2.0']
+    
+    # Oscillators: random values with a NaN warm-up
+    for period in (7, 14):
+        rsi = rng.random(n) * 100
+        rsi[:period] = np.nan
+        df[f'rsi_{period}'] = rsi
+    adx = rng.random(n) * 50
+    adx[:27] = np.nan
+    df['adx_14'] = adx
+    
+    # MACD
+    for fast, slow, signal in ((12, 26, 9), (8, 17, 9)):
+        macd = c.ewm(span=fast).mean() - c.ewm(span=slow).mean()
+        macd_signal = macd.ewm(span=signal).mean()
+        macd[:slow] = np.nan
+        macd_signal[:slow + signal] = np.nan
+        suffix = f'{fast}_{slow}_{signal}'
+        df[f'macd_{suffix}'] = macd
+        df[f'macd_signal_{suffix}'] = macd_signal
+        df[f'macd_hist_{suffix}'] = macd - macd_signal
+    
+    for period in (20, 50, 200):
+        df[f'sma_{period}'] = c.rolling(period).mean()
+    df['atr_14'] = (df['high'] - df['low']).rolling(14).mean()
+    df['volume_sma_20'] = df['volume'].rolling(20).mean()
+    return df
+
+
+@pytest.fixture
+def market_data():
+    """Factory for synthetic OHLCV + indicator DataFrames: market_data(n, seed)"""
+    return _market_data
@@ -0,0 +1,180 @@
+"""
+Tests for the Bollinger Band strategies: the fused signal kernels against
+the original pandas implementations
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategies.bollinger_bands_strategy import (
+    BollingerBandsMeanReversion, BollingerBandBreakout, BollingerBandCombo
+)
+from src.strategies.strategy_base import AdvancedStrategy
+
+
+def bands(strategy, data):
+    """Upper, middle and lower band columns of a strategy"""
+    suffix = f'{strategy.bb_period}_{strategy.bb_std}'
+    return data[f'bb_upper_{suffix}'], data[f'bb_middle_{suffix}'], data[f'bb_lower_{suffix}']
+
+
+def reference_mean_reversion(strategy, data):
+    """BollingerBandsMeanReversion.generate_signals() with pandas masks"""
+    upper_bb, middle_bb, lower_bb = bands(strategy, data)
+    rsi = data[f'rsi_{strategy.rsi_period}']
+    signals = pd.Series(0, index=data.index)
+    
+    avg_volume = data['volume'].rolling(window=20).mean()
+    volume_surge = data['volume'] > (avg_volume * strategy.volume_surge_ratio)
+    touch_lower = (data['low'] <= lower_bb) | (data['close'] <= lower_bb)
+    touch_upper = (data['high'] >= upper_bb) | (data['close'] >= upper_bb)
+    
+    if strategy.require_bb_squeeze:
+        bb_width = (upper_bb - lower_bb) / middle_bb
+        squeeze = (bb_width < strategy.squeeze_threshold) | (bb_width == bb_width.rolling(20).min())
+        squeeze_ended = squeeze.shift(1, fill_value=False) & ~squeeze
+    else:
+        squeeze_ended = pd.Series(True, index=data.index)
+    
+    signals[touch_lower & volume_surge & (rsi < strategy.rsi_extreme_high) & squeeze_ended] = 1
+    signals[touch_upper & volume_surge & (rsi > strategy.rsi_extreme_low) & squeeze_ended] = -1
+    
+    if strategy.exit_at_middle_band:
+        close = data['close']
+        signals[(close >= middle_bb) & (close.shift(1) < middle_bb.shift(1))] = 2
+        signals[(close <= middle_bb) & (close.shift(1) > middle_bb.shift(1))] = -2
+    return signals
+
+
+def reference_breakout(strategy, data):
+    """BollingerBandBreakout.generate_signals() with pandas masks"""
+    upper_bb, _, lower_bb = bands(strategy, data)
+    close = data['close']
+    signals = pd.Series(0, index=data.index)
+    
+    avg_volume = data['volume'].rolling(window=20).mean()
+    volume_surge = data['volume'] > (avg_volume * strategy.volume_surge_ratio)
+    strong_trend = data['adx_14'] > strategy.min_adx
+    breakout_above = (close > upper_bb) & (close.shift(1) <= upper_bb.shift(1))
+    breakout_below = (close < lower_bb) & (close.shift(1) >= lower_bb.shift(1))
+    
+    signals[breakout_above & volume_surge & strong_trend] = 1
+    signals[breakout_below & volume_surge & strong_trend] = -1
+    return signals
+
+
+def reference_combo(strategy, data):
+    """BollingerBandCombo.generate_signals() with pandas masks"""
+    upper_bb, _, lower_bb = bands(strategy, data)
+    close, adx, rsi = data['close'], data['adx_14'], data['rsi_14']
+    signals = pd.Series(0, index=data.index)
+    
+    ranging = adx < strategy.adx_ranging_threshold
+    trending = adx > strategy.adx_trending_threshold
+    breakout_above = (close > upper_bb) & (close.shift(1) <= upper_bb.shift(1))
+    breakout_below = (close < lower_bb) & (close.shift(1) >= lower_bb.shift(1))
+    
+    signals[(ranging & (data['low'] <= lower_bb) & (rsi < 70)) | (trending & breakout_above)] = 1
+    signals[(ranging & (data['high'] >= upper_bb) & (rsi > 30)) | (trending & breakout_below)] = -1
+    return signals
+
+
+MEAN_REVERSION_GRID = [
+    dict(require_bb_squeeze=squeeze, exit_at_middle_band=exit_mid, squeeze_threshold=threshold,
+         bb_std=std, volume_surge_ratio=ratio)
+    for squeeze in (False, True)
+    for exit_mid in (False, True)
+    for threshold in (0.02, 0.05)
+    for std in (2.0, 2.5)
+    for ratio in (1.0, 1.5)
+]
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_mean_reversion_matches_reference(market_data, seed):
+    data = market_data(800, seed=seed)
+    
+    for params in MEAN_REVERSION_GRID:
+        strategy = BollingerBandsMeanReversion(**params)
+        signals = strategy.generate_signals(data)
+        expected = reference_mean_reversion(strategy, data)
+        assert signals.index.equals(data.index)
+        assert signals.tolist() == expected.tolist(), params
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_breakout_matches_reference(market_data, seed):
+    data = market_data(800, seed=seed)
+    
+    for ratio in (1.0, 2.0):
+        for min_adx in (10, 25):
+            strategy = BollingerBandBreakout(volume_surge_ratio=ratio, min_adx=min_adx)
+            expected = reference_breakout(strategy, data)
+            assert strategy.generate_signals(data).tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_combo_matches_reference(market_data, seed):
+    data = market_data(800, seed=seed)
+    
+    for ranging in (20, 30):
+        for trending in (25, 35):
+            strategy = BollingerBandCombo(adx_ranging_threshold=ranging, adx_trending_threshold=trending)
+            expected = reference_combo(strategy, data)
+            assert strategy.generate_signals(data).tolist() == expected.tolist()
+
+
+def test_batch_matches_single_runs(market_data):
+    datas = [market_data(500, seed=seed) for seed in range(3)]
+    grid = [params for params in MEAN_REVERSION_GRID if params['bb_std'] == 2.0]
+    
+    out = BollingerBandsMeanReversion.batch_generate_signals(datas, grid)
+    
+    assert out.shape == (len(datas), len(grid), 500)
+    for s, data in enumerate(datas):
+        for p, params in enumerate(grid):
+            expected = reference_mean_reversion(BollingerBandsMeanReversion(**params), data)
+            assert out[s, p].tolist() == expected.tolist()
+
+
+def test_batch_rejects_mixed_indicator_columns(market_data):
+    data = market_data(100)
+    with pytest.raises(ValueError):
+        BollingerBandsMeanReversion.batch_generate_signals([data], [{'bb_std': 2.0}, {'bb_std': 2.5}])
+
+
+def test_signal_caching_serves_each_parameter_set_its_own_signals(market_data):
+    data = market_data(500)
+    expected = [
+        reference_mean_reversion(BollingerBandsMeanReversion(**params), data)
+        for params in MEAN_REVERSION_GRID
+    ]
+    
+    with AdvancedStrategy.signal_caching():
+        for _ in range(2):  # Second pass is served from the cache
+            for params, signals in zip(MEAN_REVERSION_GRID, expected):
+                result = BollingerBandsMeanReversion(**params).generate_signals(data)
+                assert result.tolist() == signals.tolist(), params
+                result[:] = 0  # Callers may modify the returned copy
+        assert len(AdvancedStrategy._signal_cache) == len(MEAN_REVERSION_GRID)
+        
+        # Changing a parameter of a cached instance is a different entry
+        strategy = BollingerBandsMeanReversion(**MEAN_REVERSION_GRID[0])
+        strategy.generate_signals(data)
+        strategy.require_bb_squeeze = not strategy.require_bb_squeeze
+        assert strategy.generate_signals(data).tolist() == reference_mean_reversion(strategy, data).tolist()
+        
+        # Other strategy classes with the same data do not collide
+        breakout = BollingerBandBreakout()
+        assert breakout.generate_signals(data).tolist() == reference_breakout(breakout, data).tolist()
+    
+    assert not AdvancedStrategy._signal_cache_enabled
+    assert len(AdvancedStrategy._signal_cache) == 0
+    BollingerBandsMeanReversion().generate_signals(data)
+    assert len(AdvancedStrategy._signal_cache) == 0
@@ -0,0 +1,57 @@
+"""
+Tests for the fused derived-indicator kernel against the original pandas expressions
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# indicator_calculator imports TA-Lib at module level
+pytest.importorskip('talib')
+
+from src.indicators.indicator_calculator import _derived_indicators
+
+
+def reference_derived(df):
+    """The derived indicator block of calculate_all_indicators() in pandas"""
+    close, upper, lower = df['close'], df['bb_upper'], df['bb_lower']
+    return {
+        'price_to_sma20': close / df['sma_20'],
+        'price_to_sma50': close / df['sma_50'],
+        'price_to_sma200': close / df['sma_200'],
+        'bb_position': (close - lower) / (upper - lower),
+        'rsi_overbought': df['rsi_14'] > 70,
+        'rsi_oversold': df['rsi_14'] < 30,
+        'sma_20_above_50': df['sma_20'] > df['sma_50'],
+        'sma_50_above_200': df['sma_50'] > df['sma_200'],
+    }
+
+
+def test_derived_indicators_match_pandas(market_data):
+    df = market_data(600, seed=6)
+    mid = df['close'].rolling(20).mean()
+    width = 2 * df['close'].rolling(20).std()
+    df['bb_upper'], df['bb_lower'] = mid + width, mid - width
+    # Zero-width band (0/0) and flat price over the band (x/0)
+    df.iloc[300:302, df.columns.get_loc('bb_upper')] = df['bb_lower'].iloc[300:302]
+    df.iloc[300, df.columns.get_loc('close')] = df['bb_lower'].iloc[300]
+    
+    n = len(df)
+    out = {
+        name: np.empty(n, dtype=np.bool_ if name.startswith(('rsi_', 'sma_')) else np.float64)
+        for name in reference_derived(df)
+    }
+    _derived_indicators(
+        *(df[col].to_numpy(dtype=np.float64) for col in
+          ('close', 'sma_20', 'sma_50', 'sma_200', 'bb_upper', 'bb_lower', 'rsi_14')),
+        out['price_to_sma20'], out['price_to_sma50'], out['price_to_sma200'], out['bb_position'],
+        out['rsi_overbought'], out['rsi_oversold'], out['sma_20_above_50'], out['sma_50_above_200']
+    )
+    
+    for name, expected in reference_derived(df).items():
+        np.testing.assert_array_equal(out[name], expected.to_numpy(), err_msg=name)
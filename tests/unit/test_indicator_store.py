@@ -0,0 +1,134 @@
+"""
+Tests for the Parquet indicator store
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.indicators.indicator_store import IndicatorStore
+
+
+def make_bars(n: int = 300) -> pd.DataFrame:
+    """Deterministic daily OHLCV bars"""
+    index = pd.date_range('2020-01-01', periods=n, freq='D', name='date')
+    close = np.arange(1.0, n + 1.0)
+    return pd.DataFrame({
+        'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+        'volume': np.full(n, 1e6), 'adj_close': close
+    }, index=index)
+
+
+def with_indicators(bars: pd.DataFrame) -> pd.DataFrame:
+    """Add a warm-up dependent indicator, like calculate_all_indicators()"""
+    df = bars.copy()
+    df['sma_200'] = df['close'].rolling(200).mean()
+    df['obv'] = df['volume'].cumsum()
+    return df
+
+
+@pytest.fixture
+def store(tmp_path):
+    return IndicatorStore(cache_dir=tmp_path)
+
+
+def test_round_trip(store):
+    bars = make_bars()
+    full = with_indicators(bars)
+    store.write(1, full)
+    
+    stored = store.read(1, bars)
+    
+    assert stored is not None
+    assert list(stored.columns) == ['sma_200', 'obv']
+    pd.testing.assert_frame_equal(stored, full[['sma_200', 'obv']], check_freq=False)
+
+
+def test_missing_window_is_not_served(store):
+    bars = make_bars()
+    store.write(1, with_indicators(bars))
+    
+    assert store.read(1, bars.iloc[50:]) is None
+    assert store.read(2, bars) is None
+
+
+def test_sub_window_write_keeps_full_window(store):
+    bars = make_bars()
+    full = with_indicators(bars)
+    store.write(1, full)
+    
+    # Shorter window: warm-up NaNs where the full window has values
+    partial = with_indicators(bars.iloc[100:])
+    store.write(1, partial)
+    
+    stored_full = store.read(1, bars)
+    assert stored_full['sma_200'].iloc[250] == full['sma_200'].iloc[250] == 151.5
+    
+    stored_partial = store.read(1, bars.iloc[100:])
+    assert np.isnan(stored_partial['sma_200'].iloc[150])
+    assert stored_partial['obv'].iloc[0] == 1e6
+
+
+@pytest.mark.parametrize('windows', [
+    [slice(0, 300), slice(50, 250), slice(250, 300)],
+    [slice(120, 280), slice(0, 10), slice(0, 300)],
+])
+def test_partial_windows_round_trip(store, windows):
+    bars = make_bars()
+    expected = {}
+    for window in windows:
+        df = with_indicators(bars.iloc[window])
+        df['above_sma'] = df['close'] > df['sma_200']
+        store.write(1, df)
+        # A longer window from the same first date replaces the shorter one
+        for start, stop in list(expected):
+            if start == window.start:
+                expected[start, stop] = None
+        expected[window.start, window.stop] = df[store.indicator_columns(df)]
+    
+    for (start, stop), indicators in expected.items():
+        stored = store.read(1, bars.iloc[start:stop])
+        if indicators is None:
+            assert stored is None
+        else:
+            pd.testing.assert_frame_equal(stored, indicators, check_freq=False)
+    
+    # Same first and last date with a bar missing in between is another window
+    gapped = bars.iloc[windows[0]].drop(bars.index[windows[0].start + 5])
+    assert store.read(1, gapped) is None
+
+
+def test_corrected_bars_invalidate_window(store):
+    bars = make_bars()
+    store.write(1, with_indicators(bars))
+    
+    corrected = bars.copy()
+    corrected.iloc[10, corrected.columns.get_loc('close')] += 0.5
+    
+    assert store.read(1, corrected) is None
+
+
+def test_appended_bars_replace_window(store, tmp_path):
+    bars = make_bars()
+    store.write(1, with_indicators(bars.iloc[:-1]))
+    store.write(1, with_indicators(bars))
+    
+    assert store.read(1, bars.iloc[:-1]) is None
+    assert store.read(1, bars) is not None
+    assert len(list(tmp_path.glob('ind_1_*.parquet'))) == 1
+
+
+def test_clear(store, tmp_path):
+    bars = make_bars()
+    store.write(1, with_indicators(bars))
+    store.write(12, with_indicators(bars))
+    
+    store.clear(1)
+    
+    assert store.read(1, bars) is None
+    assert store.read(12, bars) is not None
@@ -0,0 +1,110 @@
+"""
+Tests for the RSI + MACD strategies: the fused signal/filter kernel against
+the original pandas implementations
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd
+import pytest
+
+from src.strategies.rsi_macd_strategy import (
+    RSI_MACD_Strategy, RSI_MACD_Enhanced_Strategy, get_scalping_params
+)
+
+
+def reference_signals(strategy, data):
+    """RSI_MACD_Strategy.generate_signals() with pandas masks, before filters"""
+    suffix = f'{strategy.macd_fast}_{strategy.macd_slow}_{strategy.macd_signal}'
+    rsi = data[f'rsi_{strategy.rsi_period}']
+    macd, macd_signal = data[f'macd_{suffix}'], data[f'macd_signal_{suffix}']
+    macd_hist = data[f'macd_hist_{suffix}']
+    signals = pd.Series(0, index=data.index)
+    
+    cross_above = (macd > macd_signal) & (macd.shift(1) <= macd_signal.shift(1))
+    cross_below = (macd < macd_signal) & (macd.shift(1) >= macd_signal.shift(1))
+    long_conditions = (rsi < strategy.rsi_oversold) & cross_above
+    short_conditions = (rsi > strategy.rsi_overbought) & cross_below
+    if strategy.require_macd_histogram_positive:
+        long_conditions &= macd_hist > 0
+        short_conditions &= macd_hist < 0
+    
+    signals[long_conditions] = 1
+    signals[short_conditions] = -1
+    return signals
+
+
+def reference_filters(strategy, data, signals):
+    """apply_filters() of both strategies with pandas masks"""
+    signals = signals.copy()
+    if strategy.volume_filter:
+        volume_ratio = data['volume'] / data['volume'].rolling(window=20).mean()
+        signals[volume_ratio < strategy.min_volume_ratio] = 0
+    
+    if isinstance(strategy, RSI_MACD_Enhanced_Strategy):
+        if strategy.use_trend_filter:
+            trend_sma = data[f'sma_{strategy.trend_sma_period}']
+            signals[(data['close'] < trend_sma) & (signals == 1)] = 0
+            signals[(data['close'] > trend_sma) & (signals == -1)] = 0
+        if strategy.use_adx_filter:
+            signals[data['adx_14'] < strategy.min_adx] = 0
+    return signals
+
+
+BASE_GRID = [
+    {},
+    dict(require_macd_histogram_positive=False),
+    dict(volume_filter=False),
+    dict(rsi_oversold=45, rsi_overbought=55, min_volume_ratio=0.8),
+    dict(rsi_oversold=60, rsi_overbought=40, require_macd_histogram_positive=False),
+    get_scalping_params(),
+]
+
+ENHANCED_GRID = [
+    dict(params, use_trend_filter=trend, use_adx_filter=adx, min_adx=min_adx)
+    for params in BASE_GRID[:4]
+    for trend in (False, True)
+    for adx in (False, True)
+    for min_adx in (10, 25)
+]
+
+
+@pytest.mark.parametrize('cls, grid', [
+    (RSI_MACD_Strategy, BASE_GRID),
+    (RSI_MACD_Enhanced_Strategy, ENHANCED_GRID),
+])
+@pytest.mark.parametrize('fast_kernel', [True, False])
+def test_filtered_signals_match_reference(market_data, cls, grid, fast_kernel):
+    data = market_data(800, seed=2)
+    
+    for params in grid:
+        strategy = cls(**params)
+        strategy._use_fast_kernel = fast_kernel
+        raw = reference_signals(strategy, data)
+        
+        signals = strategy.generate_signals(data)
+        if not fast_kernel:
+            # Unfused: generate_signals() leaves filtering to apply_filters()
+            assert signals.tolist() == raw.tolist(), params
+        filtered = strategy.apply_filters(data, signals.copy())
+        assert filtered.tolist() == reference_filters(strategy, data, raw).tolist(), params
+
+
+def test_batch_matches_single_runs(market_data):
+    datas = [market_data(500, seed=seed) for seed in range(3)]
+    
+    # One set of indicator columns per batch: vary thresholds, not filters
+    enhanced = [params for params in ENHANCED_GRID if params['use_trend_filter'] and params['use_adx_filter']]
+    
+    for cls, grid in ((RSI_MACD_Strategy, BASE_GRID[:5]), (RSI_MACD_Enhanced_Strategy, enhanced)):
+        out = cls.batch_generate_signals(datas, grid)
+        
+        assert out.shape == (len(datas), len(grid), 500)
+        for s, data in enumerate(datas):
+            for p, params in enumerate(grid):
+                strategy = cls(**params)
+                expected = reference_filters(strategy, data, reference_signals(strategy, data))
+                assert out[s, p].tolist() == expected.tolist()
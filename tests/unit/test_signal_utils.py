@@ -0,0 +1,53 @@
+"""
+Tests for the shared signal kernels against their pandas equivalents
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategies.signal_utils import running_sma, window_min_mask
+
+
+def random_walk(n: int, seed: int, nan_every: int = 0) -> np.ndarray:
+    """Price-like float64 series, optionally with NaN holes"""
+    rng = np.random.default_rng(seed)
+    values = 100 + np.cumsum(rng.normal(0, 1, n))
+    if nan_every:
+        values[::nan_every] = np.nan
+    return values
+
+
+@pytest.mark.parametrize('window', [1, 2, 7, 20, 200])
+@pytest.mark.parametrize('nan_every', [0, 37])
+def test_running_sma_matches_rolling_mean(window, nan_every):
+    values = random_walk(1000, seed=window, nan_every=nan_every)
+    
+    result = running_sma(values, window)
+    expected = pd.Series(values).rolling(window).mean().to_numpy()
+    
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+
+def test_running_sma_shorter_than_window():
+    assert np.isnan(running_sma(np.arange(5.0), 10)).all()
+
+
+@pytest.mark.parametrize('window', [2, 5, 20])
+@pytest.mark.parametrize('nan_every', [0, 37])
+def test_window_min_mask_matches_rolling_min(window, nan_every):
+    values = random_walk(1000, seed=window, nan_every=nan_every)
+    # Repeated values: ties with the window minimum count as the minimum
+    values[100:110] = values[99]
+    
+    result = window_min_mask(values, window)
+    expected = values == pd.Series(values).rolling(window).min().to_numpy()
+    
+    assert result.dtype == np.bool_
+    np.testing.assert_array_equal(result, expected)
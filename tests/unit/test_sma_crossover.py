@@ -0,0 +1,58 @@
+"""
+Tests for the SMA crossover strategy against the original pandas implementation
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategies.sma_crossover import SMACrossoverStrategy
+
+
+def reference_signals(fast_period, slow_period, df):
+    """SMACrossoverStrategy.generate_signals() with pandas rolling means and .loc"""
+    df = df.copy()
+    for period in (fast_period, slow_period):
+        if f'sma_{period}' not in df.columns:
+            df[f'sma_{period}'] = df['close'].rolling(window=period).mean()
+    fast_sma, slow_sma = df[f'sma_{fast_period}'], df[f'sma_{slow_period}']
+    
+    df['signal'] = 0
+    df.loc[fast_sma > slow_sma, 'signal'] = 1
+    df.loc[fast_sma < slow_sma, 'signal'] = -1
+    df['position'] = df['signal'].diff()
+    df['entry'] = 0
+    df['exit'] = 0
+    df.loc[df['position'] > 0, 'entry'] = 1
+    df.loc[df['position'] < 0, 'exit'] = 1
+    return df
+
+
+@pytest.mark.parametrize('fast, slow', [(20, 50), (10, 30), (50, 200), (5, 7)])
+def test_signals_match_reference(market_data, fast, slow):
+    data = market_data(600, seed=3)[['open', 'high', 'low', 'close', 'volume', 'sma_20', 'sma_50']]
+    
+    result = SMACrossoverStrategy(fast, slow).generate_signals(data)
+    expected = reference_signals(fast, slow, data)
+    
+    assert list(result.columns) == list(expected.columns)
+    for col in ('signal', 'position', 'entry', 'exit', f'sma_{fast}', f'sma_{slow}'):
+        np.testing.assert_allclose(
+            result[col].to_numpy(dtype=float), expected[col].to_numpy(dtype=float),
+            rtol=1e-12, equal_nan=True, err_msg=col
+        )
+
+
+def test_input_frame_is_not_modified(market_data):
+    data = market_data(300)[['open', 'high', 'low', 'close', 'volume']]
+    before = data.copy()
+    
+    result = SMACrossoverStrategy(10, 30).generate_signals(data)
+    
+    pd.testing.assert_frame_equal(data, before)
+    assert {'sma_10', 'sma_30', 'signal', 'entry', 'exit'} <= set(result.columns)
@@ -0,0 +1,206 @@
+"""
+Tests for the STM mean reversion strategy
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategies.stm import STM_MeanReversion, run_grid, scan_param_grid
+
+
+def reference_exit(strategy, trailing_stops, data, symbol, entry_date, entry_price, current_date):
+    """generate_exit_signals() as implemented with pandas label lookups"""
+    if current_date not in data.index:
+        return False, ""
+    row = data.loc[current_date]
+    
+    stop_price = trailing_stops.get(symbol, entry_price * (1 - strategy.stop_loss_pct))
+    if row['low'] <= stop_price:
+        return True, "Stop Loss"
+    if (current_date - entry_date).days >= strategy.max_hold_days:
+        return True, f"Max Hold ({strategy.max_hold_days} days)"
+    if strategy.exit_at_bb_middle and row['close'] >= row['bb_middle']:
+        return True, "BB Middle (Take Profit)"
+    if strategy.exit_at_rsi_threshold and row['rsi_14'] > strategy.rsi_exit_threshold:
+        return True, f"RSI > {strategy.rsi_exit_threshold}"
+    
+    if strategy.use_trailing_stop:
+        highest_since_entry = data.loc[entry_date:current_date, 'high'].max()
+        new_trailing_stop = highest_since_entry * (1 - strategy.trailing_stop_pct)
+        if symbol not in trailing_stops or new_trailing_stop > trailing_stops[symbol]:
+            trailing_stops[symbol] = new_trailing_stop
+    return False, ""
+
+
+LONG_HOLD = {'max_hold_days': 60, 'exit_at_bb_middle': False, 'rsi_exit_threshold': 99}
+
+
+@pytest.mark.parametrize('params', [{}, LONG_HOLD])
+def test_exit_signals_match_reference(market_data, params):
+    data = market_data(600, seed=1)
+    
+    for k in range(30, 550, 17):
+        entry_date = data.index[k]
+        entry_price = data['close'].iloc[k] * 1.02
+        strategy = STM_MeanReversion(**params)
+        reference_stops = {}
+        
+        for current_date in data.index[k:k + 70]:
+            result = strategy.generate_exit_signals(data, 'X', entry_date, entry_price, current_date)
+            expected = reference_exit(
+                strategy, reference_stops, data, 'X', entry_date, entry_price, current_date
+            )
+            assert result == expected
+            assert strategy.trailing_stops.get('X') == reference_stops.get('X')
+            if result[0]:
+                break
+
+
+@pytest.mark.parametrize('params', [{}, LONG_HOLD])
+def test_find_exit_matches_bar_by_bar(market_data, params):
+    data = market_data(600, seed=2)
+    
+    for k in range(30, 550, 23):
+        entry_date = data.index[k]
+        entry_price = data['close'].iloc[k]
+        strategy = STM_MeanReversion(**params)
+        
+        expected = (None, "")
+        for current_date in data.index[k:]:
+            should_exit, reason = strategy.generate_exit_signals(
+                data, 'X', entry_date, entry_price, current_date
+            )
+            if should_exit:
+                expected = (current_date, reason)
+                break
+        
+        assert STM_MeanReversion(**params).find_exit(data, entry_date, entry_price) == expected
+
+
+def test_exit_view_sees_bar_appended_in_place(market_data):
+    data = market_data(300, seed=3)
+    strategy = STM_MeanReversion(**LONG_HOLD)
+    entry_date = data.index[250]
+    entry_price = data['close'].iloc[250]
+    
+    for current_date in data.index[250:]:
+        strategy.generate_exit_signals(data, 'X', entry_date, entry_price, current_date)
+    
+    # New bar gaps far below any stop
+    new_date = data.index[-1] + pd.Timedelta(days=1)
+    data.loc[new_date] = data.iloc[-1]
+    data.loc[new_date, 'low'] = entry_price * 0.5
+    
+    assert strategy.generate_exit_signals(data, 'X', entry_date, entry_price, new_date) == (True, "Stop Loss")
+
+
+def test_trailing_high_across_sliding_frames(market_data):
+    data = market_data(400, seed=4)
+    params = dict(LONG_HOLD, stop_loss_pct=0.5)
+    entry_date = data.index[200]
+    entry_price = data['close'].iloc[200]
+    strategy = STM_MeanReversion(**params)
+    
+    for current_date in data.index[200:230]:
+        strategy.generate_exit_signals(data, 'X', entry_date, entry_price, current_date)
+    
+    # Continue on a window that starts after the entry
+    window = data.iloc[220:]
+    for current_date in window.index[10:30]:
+        strategy.generate_exit_signals(window, 'X', entry_date, entry_price, current_date)
+    
+    highest = data.loc[entry_date:window.index[29], 'high'].max()
+    assert strategy.trailing_stops['X'] == pytest.approx(highest * (1 - strategy.trailing_stop_pct))
+    
+    # Replaying an earlier date (a new pass over the full frame) rescans
+    # from the entry date
+    strategy.trailing_stops.clear()
+    strategy.generate_exit_signals(data, 'X', entry_date, entry_price, data.index[235])
+    assert strategy._trailing_highs['X'][2] == data.loc[entry_date:data.index[235], 'high'].max()
+
+
+def make_calendar(index, every=30, offset=3):
+    """Date -> next earnings date, with an earnings day every ``every`` bars"""
+    earnings_days = index[offset::every]
+    positions = np.minimum(earnings_days.searchsorted(index), len(earnings_days) - 1)
+    return {date: earnings_days[p].to_pydatetime() for date, p in zip(index, positions)}
+
+
+def test_near_earnings_mask_matches_scalar_check(market_data):
+    data = market_data(300, seed=5)
+    calendar = make_calendar(data.index)
+    strategy = STM_MeanReversion(days_before_earnings=4, days_after_earnings=2)
+    
+    mask = strategy.near_earnings_mask(data.index, calendar)
+    
+    expected = [strategy.is_near_earnings(date, calendar.get(date)) for date in data.index]
+    assert mask.tolist() == expected
+
+
+def test_near_earnings_mask_sees_calendar_edited_in_place(market_data):
+    data = market_data(300, seed=6)
+    calendar = make_calendar(data.index)
+    strategy = STM_MeanReversion()
+    before = strategy.near_earnings_mask(data.index, calendar).copy()
+    
+    # Move one earnings date without changing the calendar's size
+    date = data.index[100]
+    calendar[date] = date.to_pydatetime()
+    after = strategy.near_earnings_mask(data.index, calendar)
+    
+    assert after[100] and not before[100]
+    assert after.tolist() == [
+        strategy.is_near_earnings(d, calendar.get(d)) for d in data.index
+    ]
+
+
+GRID = [
+    {'rsi_oversold': 40, 'volume_surge_ratio': 1.0, 'min_avg_volume': 0},
+    {'rsi_oversold': 60, 'volume_surge_ratio': 0.8, 'min_avg_volume': 0, 'use_atr_sizing': False},
+]
+
+
+def test_run_grid_trades_follow_signals_and_find_exit(market_data):
+    data = market_data(800, seed=7)
+    results = run_grid(GRID, data, symbol='X')
+    signals = scan_param_grid(GRID, data)
+    
+    assert len(results) == len(GRID)
+    for config, result, entries in zip(GRID, results, signals):
+        strategy = STM_MeanReversion(**config)
+        assert result['parameters'] == strategy.get_parameters()
+        assert result['total_trades'] > 0
+        
+        previous_exit = None
+        for trade in result['trades']:
+            entry_date = pd.Timestamp(trade['entry_date'])
+            exit_date = pd.Timestamp(trade['exit_date'])
+            assert entries[entry_date] == 1
+            assert previous_exit is None or entry_date > previous_exit
+            
+            expected_date, expected_reason = strategy.find_exit(
+                data, entry_date, data.loc[entry_date, 'close']
+            )
+            if expected_date is None:
+                assert (exit_date, trade['exit_reason']) == (data.index[-1], "End of Backtest")
+            else:
+                assert (exit_date, trade['exit_reason']) == (expected_date, expected_reason)
+            previous_exit = exit_date
+
+
+def test_legacy_module_keeps_original_interface(market_data):
+    from src.strategies.stm_old import STM_MeanReversion as LegacySTM
+    
+    strategy = LegacySTM(volume_period=10)
+    assert strategy.volume_period == strategy.volume_lookback == 10
+    assert strategy.entry_dates == {} and strategy.stop_prices == {}
+    
+    strategy.entry_dates['X'] = market_data(30).index[-1]
+    strategy.stop_prices['X'] = 95.0
+    assert LegacySTM().entry_dates == {}
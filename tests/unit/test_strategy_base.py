@@ -0,0 +1,365 @@
+"""
+Tests for the AdvancedStrategy base class
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategies.strategy_base import (
+    AdvancedStrategy, PositionSizingMethod, SignalType, _FrameCache
+)
+
+
+class CloseAboveSMA(AdvancedStrategy):
+    """Implements only the vectorized hook"""
+    
+    def get_required_indicators(self):
+        return ['sma_20']
+    
+    def generate_signals_vectorized(self, arrays):
+        return np.where(arrays['close'] > arrays['sma_20'], 1, 0)
+
+
+def test_subclass_must_implement_signal_logic():
+    with pytest.raises(TypeError, match="generate_signals"):
+        class NoSignals(AdvancedStrategy):
+            def get_required_indicators(self):
+                return []
+
+
+def test_either_signal_hook_is_enough(market_data):
+    class PandasSignals(CloseAboveSMA):
+        def generate_signals(self, data):
+            return pd.Series(0, index=data.index)
+    
+    data = market_data(100)
+    signals = CloseAboveSMA('sma').generate_signals(data)
+    
+    assert signals.tolist() == np.where(data['close'] > data['sma_20'], 1, 0).tolist()
+    assert (PandasSignals('pandas').generate_signals(data) == 0).all()
+
+
+def reference_position_size(strategy, price, equity, volatility=None, win_rate=None,
+                            avg_win_loss_ratio=None):
+    """The original scalar calculate_position_size(), with kelly_fraction and BAYESIAN_KELLY"""
+    method = strategy.position_sizing_method
+    fixed = equity * strategy.position_size_pct / price
+    
+    if method == PositionSizingMethod.FIXED:
+        shares = fixed
+    elif method == PositionSizingMethod.VOLATILITY_ATR:
+        if volatility is None or volatility == 0:
+            shares = fixed
+        else:
+            stop_distance = volatility * strategy.atr_stop_multiplier
+            shares = equity * strategy.risk_per_trade / stop_distance if stop_distance > 0 else 0
+    elif method == PositionSizingMethod.KELLY_CRITERION:
+        if win_rate is not None and avg_win_loss_ratio is not None:
+            kelly_pct = win_rate - ((1 - win_rate) / avg_win_loss_ratio)
+            kelly_pct = max(0, min(kelly_pct, 0.25)) * strategy.kelly_fraction
+            shares = equity * kelly_pct / price
+        else:
+            shares = fixed
+    elif method == PositionSizingMethod.FIXED_FRACTIONAL:
+        if strategy.stop_loss_pct:
+            stop_distance = price * strategy.stop_loss_pct
+            shares = equity * strategy.risk_per_trade / stop_distance if stop_distance > 0 else 0
+        else:
+            shares = fixed
+    elif method == PositionSizingMethod.BAYESIAN_KELLY:
+        kelly_pct = strategy._bayesian_kelly_pct()
+        shares = fixed if kelly_pct is None else equity * kelly_pct / price
+    else:  # EQUAL_WEIGHT
+        shares = equity / strategy.max_positions / price
+    
+    return int(min(shares, equity * strategy.max_position_size / price))
+
+
+SIZING_STRATEGIES = [
+    dict(position_sizing_method=method, stop_loss_pct=stop_loss_pct, kelly_fraction=kelly_fraction)
+    for method in PositionSizingMethod
+    for stop_loss_pct in (None, 0.03)
+    for kelly_fraction in (0.5, 1.0)
+]
+
+
+def sizing_inputs(n: int, seed: int = 0):
+    """Prices, equities, ATRs, win rates and win/loss ratios with NaN and zero holes"""
+    rng = np.random.default_rng(seed)
+    prices = rng.uniform(5, 500, n)
+    equities = rng.uniform(1e4, 1e6, n)
+    volatilities = rng.uniform(0.1, 20, n)
+    volatilities[::7] = 0.0
+    win_rates = rng.uniform(0.2, 0.8, n)
+    ratios = rng.uniform(0.5, 3.0, n)
+    for values, step in ((volatilities, 5), (win_rates, 6), (ratios, 11)):
+        values[::step] = np.nan
+    return prices, equities, volatilities, win_rates, ratios
+
+
+def optional(value: float):
+    """NaN as the scalar method's "not available" None"""
+    return None if np.isnan(value) else float(value)
+
+
+@pytest.mark.parametrize('params', SIZING_STRATEGIES)
+def test_batch_sizing_matches_scalar_reference(params):
+    strategy = CloseAboveSMA('sizing', **params)
+    for pnl in (1.0, 1.0, -1.0, 1.0):
+        strategy.update_trade_result(pnl)
+    prices, equities, volatilities, win_rates, ratios = sizing_inputs(200)
+    
+    shares = strategy.calculate_position_sizes_batch(prices, equities, volatilities, win_rates, ratios)
+    expected = [
+        reference_position_size(strategy, *args[:2], *map(optional, args[2:]))
+        for args in zip(prices, equities, volatilities, win_rates, ratios)
+    ]
+    
+    assert shares.dtype == np.int64
+    assert shares.tolist() == expected
+
+
+@pytest.mark.parametrize('params', SIZING_STRATEGIES)
+def test_scalar_sizing_matches_reference(params):
+    strategy = CloseAboveSMA('sizing', **params)
+    prices, equities, volatilities, win_rates, ratios = sizing_inputs(50, seed=1)
+    
+    for args in zip(prices, equities, volatilities, win_rates, ratios):
+        args = [float(arg) for arg in args]
+        if np.isnan(args[2:]).any():
+            continue
+        assert strategy.calculate_position_size('SYM', *args) == reference_position_size(strategy, *args)
+        # Without the optional inputs every method falls back the same way
+        assert strategy.calculate_position_size('SYM', *args[:2]) == reference_position_size(strategy, *args[:2])
+
+
+def test_scalar_sizing_nan_input_sizes_to_zero():
+    atr = CloseAboveSMA('atr', position_sizing_method=PositionSizingMethod.VOLATILITY_ATR)
+    kelly = CloseAboveSMA('kelly', position_sizing_method=PositionSizingMethod.KELLY_CRITERION)
+    
+    assert atr.calculate_position_size('SYM', 50.0, 1e5, volatility=np.nan) == 0
+    assert kelly.calculate_position_size('SYM', 50.0, 1e5, win_rate=np.nan, avg_win_loss_ratio=2.0) == 0
+    # The batch method reads NaN as "not available" and falls back to fixed sizing
+    assert atr.calculate_position_sizes_batch(np.array([50.0]), 1e5, np.array([np.nan])).tolist() == [200]
+
+
+def reference_trailing_stop(trailing_stop_pct, current_stop, current_price, signal):
+    """The original update_trailing_stop(): longs only ratchet up, shorts only down"""
+    if signal == SignalType.LONG:
+        new_stop = current_price * (1 - trailing_stop_pct)
+        if new_stop > current_stop:
+            return new_stop
+    elif signal == SignalType.SHORT:
+        new_stop = current_price * (1 + trailing_stop_pct)
+        if new_stop < current_stop:
+            return new_stop
+    return current_stop
+
+
+@pytest.mark.parametrize('trailing_stop_pct', [0.01, 0.05])
+def test_trailing_stops_match_reference_over_price_path(trailing_stop_pct):
+    strategy = CloseAboveSMA('trail', trailing_stop_pct=trailing_stop_pct)
+    rng = np.random.default_rng(4)
+    # More symbols than the initial record capacity (max_positions=10)
+    sides = [SignalType.LONG, SignalType.SHORT, SignalType.NEUTRAL] * 5
+    entry = rng.uniform(20, 200, len(sides))
+    symbols = [f'SYM{i}' for i in range(len(sides))]
+    expected = {}
+    for symbol, side, price in zip(symbols, sides, entry):
+        stop = price * (1 - side.value * 0.1) if side != SignalType.NEUTRAL else 90.0
+        strategy.set_stops(symbol, side, stop, None, price)
+        expected[symbol] = stop
+    strategy.stop_prices['SYM0'] = None  # Long without a stop: never trails
+    del expected['SYM0']
+    
+    paths = entry * np.cumprod(1 + rng.normal(0, 0.02, (250, len(sides))), axis=0)
+    for prices in paths:
+        for symbol, side, price in zip(symbols, sides, prices):
+            if symbol in expected:
+                assert strategy.update_trailing_stop(symbol, price, side) == pytest.approx(
+                    reference_trailing_stop(trailing_stop_pct, expected[symbol], price, side), rel=1e-12
+                )
+        
+        stops = strategy.update_trailing_stops(prices)
+        for symbol, side, price in zip(symbols, sides, prices):
+            if symbol in expected:
+                expected[symbol] = reference_trailing_stop(trailing_stop_pct, expected[symbol], price, side)
+        
+        assert np.isnan(stops[0])
+        np.testing.assert_allclose(stops[1:], [expected[symbol] for symbol in symbols[1:]], rtol=1e-12)
+    
+    # The ratcheted stops are what the exit checks see
+    assert dict(strategy.stop_prices) == pytest.approx(expected, rel=1e-12)
+
+
+def test_trailing_stops_ignore_nan_prices_and_disabled_trailing():
+    strategy = CloseAboveSMA('trail', trailing_stop_pct=0.05)
+    strategy.set_stops('A', SignalType.LONG, 95.0, None, 100.0)
+    strategy.set_stops('B', SignalType.SHORT, 105.0, None, 100.0)
+    
+    assert strategy.update_trailing_stops(np.array([np.nan, np.nan])).tolist() == [95.0, 105.0]
+    
+    strategy.trailing_stop_pct = None
+    assert strategy.update_trailing_stops(np.array([200.0, 50.0])).tolist() == [95.0, 105.0]
+    assert strategy.update_trailing_stop('A', 200.0, SignalType.LONG) is None
+
+
+def test_price_level_views_write_through_to_records():
+    strategy = CloseAboveSMA('levels')
+    stops, targets = strategy.stop_prices, strategy.take_profit_prices
+    
+    stops['A'] = 95.0
+    targets['A'] = 110.0
+    targets['B'] = None
+    
+    assert dict(stops) == {'A': 95.0} and dict(targets) == {'A': 110.0}
+    assert len(targets) == 1 and 'B' not in targets
+    with pytest.raises(KeyError):
+        stops['B']
+    with pytest.raises(KeyError):
+        del targets['B']
+    
+    row = strategy.symbol_row('A')
+    assert strategy._positions[row]['stop'] == 95.0 and strategy._positions[row]['tp'] == 110.0
+    
+    del stops['A']
+    assert 'A' not in strategy.stop_prices and strategy.take_profit_prices['A'] == 110.0
+    assert np.isnan(strategy._positions[row]['stop'])
+
+
+def test_price_levels_survive_record_growth():
+    strategy = CloseAboveSMA('levels', max_positions=2)
+    levels = {f'SYM{i}': 10.0 + i for i in range(50)}
+    for symbol, price in levels.items():
+        strategy.stop_prices[symbol] = price
+    
+    assert dict(strategy.stop_prices) == levels
+    assert [strategy.symbol_row(symbol) for symbol in levels] == list(range(50))
+
+
+def reference_exit(stop, take_profit, high, low, signal):
+    """The original check_exit_conditions() on plain stop/target values"""
+    if stop is not None:
+        if signal == SignalType.LONG and low <= stop:
+            return True
+        elif signal == SignalType.SHORT and high >= stop:
+            return True
+    if take_profit is not None:
+        if signal == SignalType.LONG and high >= take_profit:
+            return True
+        elif signal == SignalType.SHORT and low <= take_profit:
+            return True
+    return False
+
+
+def test_exit_checks_match_reference():
+    strategy = CloseAboveSMA('exits')
+    rng = np.random.default_rng(5)
+    cases = []
+    for i in range(300):
+        side = (SignalType.LONG, SignalType.SHORT)[i % 2]
+        stop = None if i % 5 == 0 else 100 * (1 - side.value * 0.05)
+        take_profit = None if i % 7 == 0 else 100 * (1 + side.value * 0.08)
+        strategy.set_stops(f'SYM{i}', side, stop, take_profit, 100.0)
+        cases.append((stop, take_profit, side))
+    lows = 100 - rng.uniform(0, 10, len(cases))
+    highs = 100 + rng.uniform(0, 10, len(cases))
+    
+    expected = [
+        reference_exit(stop, take_profit, high, low, side)
+        for (stop, take_profit, side), high, low in zip(cases, highs, lows)
+    ]
+    
+    assert strategy.check_exits_vectorized(lows, highs).tolist() == expected
+    assert [
+        strategy.check_exit_conditions(f'SYM{i}', 100.0, highs[i], lows[i], side)
+        for i, (_, _, side) in enumerate(cases)
+    ] == expected
+    assert not strategy.check_exit_conditions('UNKNOWN', 100.0, 1e9, 0.0, SignalType.LONG)
+
+
+def test_frame_cache_only_serves_the_same_frame_and_columns():
+    cache = _FrameCache(max_size=2)
+    data = pd.DataFrame({'close': [1.0, 2.0]})
+    cache.put(data, 'key', 'value')
+    
+    assert cache.get(data, 'key') == 'value'
+    assert cache.get(data, 'other') is None
+    assert cache.get(data.copy(), 'key') is None
+    
+    data['sma_20'] = data['close']
+    assert cache.get(data, 'key') is None
+
+
+def test_frame_cache_drops_collected_frames_and_evicts_lru():
+    cache = _FrameCache(max_size=2)
+    frames = [pd.DataFrame({'close': [float(i)]}) for i in range(3)]
+    for i, data in enumerate(frames):
+        cache.put(data, 'key', i)
+    
+    assert len(cache) == 2 and cache.get(frames[0], 'key') is None
+    
+    last = frames[-1]
+    del data, frames
+    gc.collect()
+    assert len(cache) == 1 and cache.get(last, 'key') == 2
+
+
+def test_validate_data_rechecks_after_columns_change(market_data):
+    strategy = CloseAboveSMA('validate')
+    data = market_data(50)
+    
+    assert strategy.validate_data(data)
+    assert strategy.validate_data(data)
+    
+    del data['sma_20']
+    with pytest.raises(ValueError, match="sma_20"):
+        strategy.validate_data(data)
+    with pytest.raises(ValueError, match="volume"):
+        strategy.validate_data(data.drop(columns='volume'))
+
+
+def test_get_parameters_tracks_setting_changes():
+    strategy = CloseAboveSMA('params', lookback=20)
+    
+    params = strategy.get_parameters()
+    params['stop_loss_pct'] = 0.5  # Callers get a copy
+    assert strategy.get_parameters()['stop_loss_pct'] is None
+    
+    strategy.stop_loss_pct = 0.02
+    strategy.position_sizing_method = PositionSizingMethod.KELLY_CRITERION
+    strategy.parameters['lookback'] = 30
+    
+    params = strategy.get_parameters()
+    assert params['stop_loss_pct'] == 0.02
+    assert params['position_sizing_method'] == 'kelly_criterion'
+    assert params['lookback'] == 30
+
+
+def reference_atr(df, n):
+    """Row-wise true range with pandas (NaN on the first bar), then Wilder smoothing"""
+    prev_close = df['close'].shift(1)
+    true_range = pd.concat([
+        df['high'] - df['low'],
+        (df['high'] - prev_close).abs(),
+        (df['low'] - prev_close).abs()
+    ], axis=1).max(axis=1, skipna=False)
+    return true_range.ewm(alpha=1.0 / n, adjust=False).mean()
+
+
+@pytest.mark.parametrize('n', [1, 14, 50])
+def test_compute_atr_matches_pandas(market_data, n):
+    data = market_data(400, seed=n)
+    
+    atr = AdvancedStrategy.compute_atr(data['high'], data['low'], data['close'], n)
+    
+    assert atr.dtype == np.float64 and atr.shape == (400,)
+    np.testing.assert_allclose(atr, reference_atr(data, n).to_numpy(), rtol=1e-12, equal_nan=True)
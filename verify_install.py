@@ -1,25 +1,54 @@
+import io
+import os
 import sys
+from multiprocessing import Pool
 from colorama import Fore, Style, init
 
 init(autoreset=True)
 
+# Report lines are collected here and written to stdout in one go
+_BUF = io.StringIO()
+
+def _print(text=''):
+    _BUF.write(f"{text}\n")
+
+def _flush():
+    """Write the collected report lines to stdout"""
+    sys.stdout.write(_BUF.getvalue())
+    sys.stdout.flush()
+    _BUF.seek(0)
+    _BUF.truncate()
+
+def _probe(import_name):
+    """Try an import in this process, returning (ok, error message)"""
+    try:
+        __import__(import_name)
+        return True, ''
+    except ImportError as e:
+        return False, str(e)
+
+def _report(package_name, ok, error):
+    """Print the result line for a package"""
+    if ok:
+        _print(f"{Fore.GREEN}✓ {package_name:30} OK{Style.RESET_ALL}")
+    else:
+        _print(f"{Fore.RED}✗ {package_name:30} FAILED: {error}{Style.RESET_ALL}")
+    return ok
+
 def check_package(package_name, import_name=None):
     """Test if a package can be imported"""
     if import_name is None:
         import_name = package_name
     
-    try:
-        __import__(import_name)
-        print(f"{Fore.GREEN}✓ {package_name:30} OK{Style.RESET_ALL}")
-        return True
-    except ImportError as e:
-        print(f"{Fore.RED}✗ {package_name:30} FAILED: {e}{Style.RESET_ALL}")
-        return False
+    ok = _report(package_name, *_probe(import_name))
+    _flush()
+    return ok
 
 def main():
-    print(f"\n{Fore.CYAN}{'='*60}")
-    print(f"{Fore.CYAN}AlphaFactory OS - Installation Verification")
-    print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
+    _print(f"\n{Fore.CYAN}{'='*60}")
+    _print(f"{Fore.CYAN}AlphaFactory OS - Installation Verification")
+    _print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
+    _flush()
     
     packages = [
         # Core
@@ -71,29 +100,38 @@ def main():
         ('joblib', 'joblib'),
     ]
     
-    results = []
-    for package_name, import_name in packages:
-        results.append(check_package(package_name, import_name))
+    # Cold imports dominate the runtime: probe them in parallel worker
+    # processes (which also keeps them out of this interpreter), then
+    # report in list order
+    with Pool(processes=min(8, os.cpu_count() or 1)) as pool:
+        probes = pool.map(_probe, [import_name for _, import_name in packages], chunksize=1)
+    
+    results = [
+        _report(package_name, ok, error)
+        for (package_name, _), (ok, error) in zip(packages, probes)
+    ]
     
     # Summary
     total = len(results)
     passed = sum(results)
     failed = total - passed
     
-    print(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
-    print(f"Total Packages: {total}")
-    print(f"{Fore.GREEN}Passed: {passed}{Style.RESET_ALL}")
+    _print(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
+    _print(f"Total Packages: {total}")
+    _print(f"{Fore.GREEN}Passed: {passed}{Style.RESET_ALL}")
     if failed > 0:
-        print(f"{Fore.RED}Failed: {failed}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
+        _print(f"{Fore.RED}Failed: {failed}{Style.RESET_ALL}")
+    _print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
     
     if failed == 0:
-        print(f"{Fore.GREEN}✓ ALL DEPENDENCIES INSTALLED SUCCESSFULLY!{Style.RESET_ALL}\n")
-        print(f"{Fore.YELLOW}Next: Reply with 'next' to receive configuration files{Style.RESET_ALL}\n")
+        _print(f"{Fore.GREEN}✓ ALL DEPENDENCIES INSTALLED SUCCESSFULLY!{Style.RESET_ALL}\n")
+        _print(f"{Fore.YELLOW}Next: Reply with 'next' to receive configuration files{Style.RESET_ALL}\n")
+        _flush()
         return 0
     else:
-        print(f"{Fore.RED}✗ SOME DEPENDENCIES FAILED{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}Please review errors above and reinstall failed packages{Style.RESET_ALL}\n")
+        _print(f"{Fore.RED}✗ SOME DEPENDENCIES FAILED{Style.RESET_ALL}")
+        _print(f"{Fore.YELLOW}Please review errors above and reinstall failed packages{Style.RESET_ALL}\n")
+        _flush()
         return 1
 
 if __name__ == '__main__':